@@ -4,9 +4,10 @@ import requests
 import yaml
 import logging
 import os
-from faculty_db import FacultyDatabase
+from faculty_db import FACULTY_PAGE_SIZE, FacultyDatabase
+from faculty_snapshot import FacultySnapshotCache, normalize_name
 from faculty_verifier import FacultyVerifier
-from ga_tech_scraper import validate_url
+from ga_tech_scraper import http_sessions, validate_url
 
 # Set up logging
 logging.basicConfig(
@@ -23,6 +24,8 @@ app = Flask(__name__)
 
 # Initialize faculty database
 faculty_db = FacultyDatabase()
+# In-memory copy of the faculty table for request handlers, reloaded when the database changes
+faculty_snapshots = FacultySnapshotCache(faculty_db)
 
 # --- Load config and Perplexity API key ---
 def load_config():
@@ -79,15 +82,40 @@ def ask_perplexity():
         return jsonify({'error': f'Perplexity API error: {resp.status_code}', 'details': resp.text}), 500
 
 import re
+import unicodedata
+
+# Maximum faculty returned per department keyword
+DEPARTMENT_SEARCH_LIMIT = 500
+
+def name_tokens(name):
+    """Lowercased words of a person's name, without a leading title or diacritics"""
+    name = unicodedata.normalize('NFKD', re.sub(r"^(Dr\.|Professor)\s+", "", name or ''))
+    return re.findall(r'\w+', ''.join(c for c in name if not unicodedata.combining(c)).lower())
+
+def match_faculty_name(name):
+    """The faculty member named with every word of ``name`` and the same first and last word, or None.
+    
+    Words match exactly (no prefixes), so a middle name or initial in the
+    stored name is tolerated but "David Smith" never matches "Mark Davidson Smithers".
+    """
+    tokens = name_tokens(name)
+    if len(tokens) < 2:
+        return None
+    for fac in faculty_db.search_faculty(' '.join(tokens), fields=('name',), limit=5, prefix=False):
+        candidate = name_tokens(fac.get('name'))
+        if candidate[:1] == tokens[:1] and candidate[-1:] == tokens[-1:]:
+            return fac
+    return None
 
 def load_faculty_by_department(dept_keywords):
     # Load faculty from the database and filter by department keywords
     try:
         # First try to get from database
+        snapshot = faculty_snapshots.get()
         all_faculty = []
         for keyword in dept_keywords:
-            # Search for faculty with this keyword in department
-            faculty_list = faculty_db.search_faculty_by_department(keyword)
+            # Search for faculty with this keyword in department or school
+            faculty_list = snapshot.search_department(keyword, limit=DEPARTMENT_SEARCH_LIMIT)
             all_faculty.extend(faculty_list)
         
         # If database is empty, fall back to JSON file
@@ -115,7 +143,7 @@ def load_faculty_by_department(dept_keywords):
             name = prof.get('name')
             if name and name not in seen_names:
                 seen_names.add(name)
-                filtered.append(prof)
+                filtered.append(prof.to_dict())
         
         logger.info(f"Found {len(filtered)} faculty members for keywords {dept_keywords}")
         return filtered
@@ -123,6 +151,22 @@ def load_faculty_by_department(dept_keywords):
         logger.error(f"Error in load_faculty_by_department: {e}")
         return []
 
+@app.route('/api/faculty', methods=['GET'])
+def list_faculty():
+    # Keyset-paginated faculty listing: pass next_cursor back as ?cursor= for the next page
+    try:
+        limit = int(request.args.get('limit', FACULTY_PAGE_SIZE))
+        min_confidence = float(request.args.get('min_confidence', 0.0))
+        faculty_list, next_cursor = faculty_db.get_faculty_page(
+            cursor=request.args.get('cursor') or None,
+            limit=limit,
+            min_confidence=min_confidence,
+            department=request.args.get('department') or None
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'faculty': faculty_list, 'next_cursor': next_cursor, 'count': len(faculty_list)})
+
 @app.route('/ask_and_enrich_perplexity', methods=['POST'])
 def ask_and_enrich_perplexity():
     if not PERPLEXITY_API_KEY:
@@ -209,29 +253,8 @@ def ask_and_enrich_perplexity():
             short_answer = answer[:400]
         # --- Improved fuzzy matching for enrichment ---
         import difflib
-        import re
-        def normalize_name(name):
-            # Remove titles, punctuation, extra whitespace, and lowercase
-            if not name:
-                return ''
-            name = re.sub(r"^(Dr\.|Professor)\s+", "", name)
-            name = re.sub(r"[^a-zA-Z\s]", "", name)  # Remove punctuation
-            name = re.sub(r"\s+", " ", name)  # Collapse whitespace
-            return ''.join(name.lower().split())
-        # Load all faculty data for matching
-        with open('ga_tech_faculty.json', 'r') as f:
-            all_faculty = json.load(f)
-        # Filter out non-faculty entries
-        NON_FACULTY_NAMES = set([
-            'home', 'directory', 'visitor parking information', 'main directory', 'day', 'welcome',
-            'undergraduate handbook', 'professional education', 'financial aid', 'faculty', 'staff', 'office', 'about', 'contact', 'events', 'graduate handbook', 'student', 'advising', 'administration', 'resources', 'faq', 'news', 'alumni', 'forms', 'information', 'handbook', 'overview'
-        ])
-        faculty_by_norm = {}
-        for fac in all_faculty:
-            norm = normalize_name(fac['name'])
-            if not norm or norm in NON_FACULTY_NAMES:
-                continue
-            faculty_by_norm[norm] = fac
+        # Faculty keyed by normalized name (non-faculty entries already filtered out)
+        faculty_by_norm = faculty_snapshots.get().by_name
         # For each result, try fuzzy match
         enriched_results = []
         for prof in results:
@@ -239,6 +262,9 @@ def ask_and_enrich_perplexity():
             norm_name = normalize_name(name)
             # Try exact match
             fac = faculty_by_norm.get(norm_name)
+            # Try the name index: same words, allowing for middle names and initials
+            if not fac and name:
+                fac = match_faculty_name(name)
             # Try fuzzy match if not found
             if not fac:
                 close_matches = difflib.get_close_matches(norm_name, faculty_by_norm.keys(), n=1, cutoff=0.85)
@@ -259,7 +285,7 @@ def ask_and_enrich_perplexity():
                     'lab_affiliation': fac.get('lab_affiliation', 'N/A'),
                     'personal_website': fac.get('personal_website', 'N/A'),
                     'profile_url': profile_url if profile_url else 'N/A',
-                    'publications': fac.get('publications', [])
+                    'publications': list(fac.get('publications', []))
                 })
             enriched_results.append(prof)
 
@@ -288,7 +314,7 @@ def find_professors():
     # Use OpenAlex search parameter for fuzzy matching
     authors_url = f'https://api.openalex.org/authors?search={requests.utils.quote(query)}&per-page=10&sort=cited_by_count:desc'
     print(f'[DEBUG] Authors URL: {authors_url}')
-    authors_resp = requests.get(authors_url)
+    authors_resp = http_sessions.get(authors_url)
     if authors_resp.status_code == 200:
         authors_data = authors_resp.json()
         profs = []
@@ -299,7 +325,7 @@ def find_professors():
             affiliation = author.get('last_known_institution', {}).get('display_name', '')
             email = author.get('email', None)
             works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-            works_resp = requests.get(works_url)
+            works_resp = http_sessions.get(works_url)
             papers = []
             if works_resp.status_code == 200:
                 works_data = works_resp.json()
@@ -331,7 +357,7 @@ def find_professors():
     concept_raw_responses = []
     for f in mapped_fields:
         concept_url = f'https://api.openalex.org/concepts?search={f}&per-page=1'
-        concept_resp = requests.get(concept_url)
+        concept_resp = http_sessions.get(concept_url)
         concept_raw_responses.append({'field': f, 'url': concept_url, 'status': concept_resp.status_code, 'response': concept_resp.text})
         if concept_resp.status_code != 200:
             continue
@@ -346,7 +372,7 @@ def find_professors():
     if not concept_id:
         # Suggest closest concepts
         suggest_url = f'https://api.openalex.org/concepts?search={field}&per-page=5'
-        suggest_resp = requests.get(suggest_url)
+        suggest_resp = http_sessions.get(suggest_url)
         if suggest_resp.status_code == 200 and suggest_resp.json().get('results'):
             suggestions = [c['display_name'] for c in suggest_resp.json()['results']]
             return jsonify({'error': f'No field found matching "{field}". Did you mean one of: {', '.join(suggestions)}?', 'debug': {'institution': inst_data, 'concept_attempts': concept_raw_responses}}), 404
@@ -355,7 +381,7 @@ def find_professors():
     # 3. Get authors at the institution with this concept
     authors_url = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id},x_concepts.id:{concept_id}&per-page=10&sort=cited_by_count:desc'
     print(f'[DEBUG] Authors URL: {authors_url}')
-    authors_resp = requests.get(authors_url)
+    authors_resp = http_sessions.get(authors_url)
     print(f'[DEBUG] Authors Response Status: {authors_resp.status_code}')
     authors_data = authors_resp.json() if authors_resp.status_code == 200 else {}
     profs = []
@@ -375,7 +401,7 @@ def find_professors():
             email = author.get('email', None)
             # Get top 3 recent papers
             works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-            works_resp = requests.get(works_url)
+            works_resp = http_sessions.get(works_url)
             papers = []
             if works_resp.status_code == 200:
                 works_data = works_resp.json()
@@ -420,7 +446,7 @@ def find_professors():
                 sub_id = sub_id_url.split('/')[-1]
                 sub_name = sub.get('display_name', 'Unknown')
                 sub_authors_url = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id},x_concepts.id:{sub_id}&per-page=5&sort=cited_by_count:desc'
-                sub_authors_resp = requests.get(sub_authors_url)
+                sub_authors_resp = http_sessions.get(sub_authors_url)
                 if sub_authors_resp.status_code == 200:
                     sub_authors_data = sub_authors_resp.json()
                     for author in sub_authors_data.get('results', []):
@@ -438,7 +464,7 @@ def find_professors():
                     affiliation = author.get('last_known_institution', {}).get('display_name', '')
                     email = author.get('email', None)
                     works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-                    works_resp = requests.get(works_url)
+                    works_resp = http_sessions.get(works_url)
                     papers = []
                     if works_resp.status_code == 200:
                         works_data = works_resp.json()
@@ -464,7 +490,7 @@ def find_professors():
                     return jsonify({'institution_used': inst_name, 'professors': profs, 'fallback': 'subfields', 'fallback_fields': list(set([p['source_field'] for p in profs]))})
         # (3) Fallback: Show all professors at institution
         all_inst_url = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id}&per-page=10&sort=cited_by_count:desc'
-        all_inst_resp = requests.get(all_inst_url)
+        all_inst_resp = http_sessions.get(all_inst_url)
         all_inst_data = all_inst_resp.json() if all_inst_resp.status_code == 200 else {}
         if all_inst_data.get('results'):
             fallback_used = 'institution_only'
@@ -479,7 +505,7 @@ def find_professors():
                 affiliation = author.get('last_known_institution', {}).get('display_name', '')
                 email = author.get('email', None)
                 works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-                works_resp = requests.get(works_url)
+                works_resp = http_sessions.get(works_url)
                 papers = []
                 if works_resp.status_code == 200:
                     works_data = works_resp.json()
@@ -504,7 +530,7 @@ def find_professors():
                 return jsonify({'institution_used': inst_name, 'professors': profs, 'fallback': 'institution_only'})
         # (4) Fallback: Show all in field, filter for institution
         all_field_url = f'https://api.openalex.org/authors?filter=x_concepts.id:{concept_id}&per-page=20&sort=cited_by_count:desc'
-        all_field_resp = requests.get(all_field_url)
+        all_field_resp = http_sessions.get(all_field_url)
         all_field_data = all_field_resp.json() if all_field_resp.status_code == 200 else {}
         filtered = []
         if all_field_data.get('results'):
@@ -525,7 +551,7 @@ def find_professors():
                 affiliation = author.get('last_known_institution', {}).get('display_name', '')
                 email = author.get('email', None)
                 works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-                works_resp = requests.get(works_url)
+                works_resp = http_sessions.get(works_url)
                 papers = []
                 if works_resp.status_code == 200:
                     works_data = works_resp.json()
@@ -557,7 +583,7 @@ def find_professors():
                     sub_name = sub.get('display_name', 'Unknown')
                     print(f'[DEBUG] Subfield: {sub_name}, sub_id: {sub_id}')
                     sub_authors_url = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id},x_concepts.id:{sub_id}&per-page=5&sort=cited_by_count:desc'
-                    sub_authors_resp = requests.get(sub_authors_url)
+                    sub_authors_resp = http_sessions.get(sub_authors_url)
                     if sub_authors_resp.status_code == 200:
                         sub_authors_data = sub_authors_resp.json()
                         for author in sub_authors_data.get('results', []):
@@ -578,7 +604,7 @@ def find_professors():
                         affiliation = author.get('last_known_institution', {}).get('display_name', '')
                         email = author.get('email', None)
                         works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-                        works_resp = requests.get(works_url)
+                        works_resp = http_sessions.get(works_url)
                         papers = []
                         if works_resp.status_code == 200:
                             works_data = works_resp.json()
@@ -613,7 +639,7 @@ def find_professors():
                 parent_name = parent_concept['display_name']
                 print(f"[DEBUG] Parent Concept: {parent_name} (ID: {parent_id})")
                 authors_url_parent = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id},x_concepts.id:{parent_id}&per-page=10&sort=cited_by_count:desc'
-                authors_resp_parent = requests.get(authors_url_parent)
+                authors_resp_parent = http_sessions.get(authors_url_parent)
                 print(f"[DEBUG] Parent Authors URL: {authors_url_parent}")
                 print(f"[DEBUG] Parent Authors Response Status: {authors_resp_parent.status_code}")
                 if authors_resp_parent.status_code == 200:
@@ -628,7 +654,7 @@ def find_professors():
         if not authors_data.get('results'):
             print(f"[DEBUG] Fallback used: all_professors")
             all_authors_url = f'https://api.openalex.org/authors?filter=last_known_institutions.id:{inst_id}&per-page=10&sort=cited_by_count:desc'
-            all_authors_resp = requests.get(all_authors_url)
+            all_authors_resp = http_sessions.get(all_authors_url)
             all_profs = []
             if all_authors_resp.status_code == 200:
                 all_authors_data = all_authors_resp.json()
@@ -639,7 +665,7 @@ def find_professors():
                     affiliation = author.get('last_known_institution', {}).get('display_name', '')
                     email = author.get('email', None)
                     works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-                    works_resp = requests.get(works_url)
+                    works_resp = http_sessions.get(works_url)
                     papers = []
                     if works_resp.status_code == 200:
                         works_data = works_resp.json()
@@ -665,7 +691,7 @@ def find_professors():
                     return jsonify({'institution_used': inst_name, 'professors': all_profs, 'fallback': 'all_professors'}), 200
             # (4) Suggest most common fields at the institution
             inst_concepts_url = f'https://api.openalex.org/institutions/{inst_id}'
-            inst_concepts_resp = requests.get(inst_concepts_url)
+            inst_concepts_resp = http_sessions.get(inst_concepts_url)
             inst_concepts = []
             if inst_concepts_resp.status_code == 200:
                 inst_concepts_data = inst_concepts_resp.json()
@@ -688,7 +714,7 @@ def find_professors():
         email = author.get('email', None)
         # Get top 3 recent papers
         works_url = f'https://api.openalex.org/works?filter=author.id:{author["id"]}&sort=publication_year:desc&per-page=3'
-        works_resp = requests.get(works_url)
+        works_resp = http_sessions.get(works_url)
         papers = []
         if works_resp.status_code == 200:
             works_data = works_resp.json()
@@ -747,7 +773,7 @@ def get_professor_papers():
         'sort': 'publication_date:desc',
         'per-page': 3
     }
-    resp = requests.get(works_url, params=params)
+    resp = http_sessions.get(works_url, params=params)
     papers = []
     if resp.status_code == 200:
         for w in resp.json().get('results', []):
@@ -819,7 +845,7 @@ def summarize():
 
 def search_arxiv(query, max_results=3):
     url = f'http://export.arxiv.org/api/query?search_query=all:{query}&start=0&max_results={max_results}'
-    response = requests.get(url)
+    response = http_sessions.get(url)
     entries = []
     if response.status_code == 200:
         root = ET.fromstring(response.text)
@@ -839,7 +865,7 @@ def search_arxiv(query, max_results=3):
 def search_openalex(query, per_page=3):
     url = 'https://api.openalex.org/works'
     params = {'search': query, 'per-page': per_page}
-    response = requests.get(url, params=params)
+    response = http_sessions.get(url, params=params)
     results = []
     if response.status_code == 200:
         for item in response.json().get('results', []):
@@ -0,0 +1,69 @@
+"""Benchmark incremental vs full confidence-score maintenance.
+
+Loads a synthetic database, edits a handful of rows the way a scrape or
+verification run would, and times update_confidence_scores() (which only
+rescores changed faculty) against update_confidence_scores(full=True).
+After each incremental pass the scores are checked against a full
+recompute.
+
+Usage: python benchmarks/bench_confidence.py [--size 100000] [--changed 10 100 1000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase, CONFIDENCE_SCORE_SQL
+from bench_faculty_reads import populate
+
+def touch(db, count, size):
+    """Change scored fields and publications for ``count`` faculty spread over the table"""
+    step = max(size // max(count, 1), 1)
+    for n, faculty_id in enumerate(range(1, size + 1, step)[:count]):
+        if n % 2:
+            db.update_faculty(faculty_id, {'email': None, 'new_publications': [f"New paper {n}"]})
+        else:
+            db.update_faculty(faculty_id, {'personal_website': 'N/A'})
+
+def stale_scores(db):
+    """Rows whose stored score differs from a fresh computation"""
+    with db.pool.reader() as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM faculty WHERE abs(confidence_score - {CONFIDENCE_SCORE_SQL}) > 1e-9"
+        ).fetchone()[0]
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Confidence score maintenance benchmark")
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--changed', type=int, nargs='+', default=[0, 10, 100, 1000])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = FacultyDatabase(os.path.join(tmp, 'bench.db'))
+        populate(db, args.size)
+        initial = timed(db.update_confidence_scores)
+
+        print(f"{args.size} faculty, initial scoring of every new row: {initial:.3f}s")
+        print(f"{'changed':>8}  {'incremental':>12}  {'full':>8}  {'stale after':>12}")
+        for changed in args.changed:
+            touch(db, changed, args.size)
+            incremental = timed(db.update_confidence_scores)
+            stale = stale_scores(db)
+            touch(db, changed, args.size)
+            full = timed(db.update_confidence_scores, full=True)
+            print(f"{changed:>8}  {incremental:>11.4f}s  {full:>7.3f}s  {stale:>12}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Peak memory of the directory crawl, replayed offline.
+
+Serves faculty_page.html as a paginated listing (--pages pages per school,
+each with its own profile URLs) to crawl_directories through a stub session,
+and compares two ways of collecting the links, each in a fresh subprocess
+so its peak RSS is its own:
+
+  records  the crawler as is: each page becomes FacultyLinks and its tree is
+           released before the next page is fetched
+  tags     the previous behaviour: the BeautifulSoup Tags of every page are
+           kept until the crawl ends, holding every page tree in memory
+
+Usage: python benchmarks/bench_crawl_memory.py [--pages 10] [--max-rss-mib 150]
+
+--max-rss-mib fails (exit status 1) if the records crawl's peak RSS exceeds it.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+
+from crawler import CrawlEngine, peak_rss_mib
+from ga_tech_scraper import crawl_directories, process_faculty_page
+
+BASE_URL = "https://www.cc.gatech.edu"
+SCHOOL_HOSTS = ['www.cc.gatech.edu', 'ic.gatech.edu', 'scs.gatech.edu', 'cse.gatech.edu', 'scp.gatech.edu']
+NEXT_LINK = 'href="?items_per_page=1000&amp;page=1" rel="next"'
+
+class ListingResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = 200
+
+class ListingSession:
+    """Stub session serving page ``page=N`` of every school's listing from the fixture"""
+
+    def __init__(self, pages):
+        with open(os.path.join(ROOT, 'faculty_page.html'), encoding='utf-8') as f:
+            self.template = f.read()
+        self.pages = pages
+
+    def page(self, number):
+        # Distinct profile URLs per page, and a "next" link on all but the last page
+        html = re.sub(r'href="(/people/[^"?#]+)"', rf'href="\1-p{number}"', self.template)
+        if number + 1 < self.pages:
+            return html.replace(NEXT_LINK, f'href="?items_per_page=1000&amp;page={number + 1}" rel="next"')
+        return html.replace(NEXT_LINK, 'href="#"')
+
+    def get(self, url, **kwargs):
+        match = re.search(r'[?&]page=(\d+)', url)
+        return ListingResponse(self.page(int(match.group(1)) if match else 0))
+
+def crawl_records(pages):
+    engine = CrawlEngine(per_host_rate=1e6, burst=1000, session=ListingSession(pages))
+    return crawl_directories(engine, BASE_URL)
+
+def crawl_tags(pages):
+    """Every page's Tags kept until the end, as the crawler did before FacultyLinks"""
+    session = ListingSession(pages)
+    links = []
+    for host in SCHOOL_HOSTS:
+        for number in range(pages):
+            soup = BeautifulSoup(session.page(number), 'html.parser')
+            links.extend((link, host) for link in process_faculty_page(soup, host, f"https://{host}"))
+    return links
+
+def run_mode(mode, pages):
+    """Crawl in this process and print its measurements as JSON"""
+    before = peak_rss_mib()
+    start = time.perf_counter()
+    # The crawler saves the first listing page for debugging; keep it out of the repo
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        os.chdir(workdir)
+        links = (crawl_records if mode == 'records' else crawl_tags)(pages)
+        os.chdir(ROOT)
+    print(json.dumps({
+        'links': len(links),
+        'seconds': time.perf_counter() - start,
+        'baseline_mib': before,
+        'peak_mib': peak_rss_mib(),
+    }))
+
+def measure(mode, pages):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--mode', mode, '--pages', str(pages)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Directory crawl peak memory benchmark")
+    parser.add_argument('--pages', type=int, default=10, help='Listing pages per school')
+    parser.add_argument('--max-rss-mib', type=float, help='Fail if the records crawl peaks above this')
+    parser.add_argument('--mode', choices=['records', 'tags'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.pages)
+        return
+
+    if peak_rss_mib() is None:
+        sys.exit("Peak RSS is not available on this platform")
+    print(f"{len(SCHOOL_HOSTS)} schools x {args.pages} listing pages")
+    print(f"{'mode':<8} {'links':>6} {'time':>8} {'baseline':>10} {'peak RSS':>10} {'growth':>9}")
+    results = {}
+    for mode in ('records', 'tags'):
+        r = results[mode] = measure(mode, args.pages)
+        print(f"{mode:<8} {r['links']:>6} {r['seconds']:>7.2f}s {r['baseline_mib']:>7.0f}MiB "
+              f"{r['peak_mib']:>7.0f}MiB {r['peak_mib'] - r['baseline_mib']:>6.0f}MiB")
+
+    if args.max_rss_mib is not None and results['records']['peak_mib'] > args.max_rss_mib:
+        print(f"Records crawl peaked at {results['records']['peak_mib']:.0f} MiB, above {args.max_rss_mib:.0f} MiB")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Offline benchmark of the scraper's listing and profile extractors.
+
+Replays the checked-in faculty_page.html and profile_*.html fixtures, plus
+synthetic variants scaled up by --scale, through process_faculty_page and
+parse_profile_page + extract_professor_info with every network call
+stubbed out. For each case it reports per-page parse and extract time
+(median of --repeat runs), peak traced memory, the memory blocks held by
+the parsed tree and a digest of the extracted output.
+
+Results can be saved and compared across commits:
+
+    python benchmarks/bench_extraction.py --output before.json
+    (check out another commit)
+    python benchmarks/bench_extraction.py --compare before.json
+
+--compare exits with status 1 if a time or memory figure regresses by more
+than --threshold, or if a case's output digest changed.
+"""
+import argparse
+import contextlib
+import copy
+import gc
+import glob
+import hashlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+
+import ga_tech_scraper
+from ga_tech_scraper import extract_professor_info, parse_profile_page, process_faculty_page
+
+LISTING_URL = "https://www.cc.gatech.edu"
+METRICS = ('parse_ms', 'extract_ms', 'peak_kib', 'blocks')
+
+def no_network(*args, **kwargs):
+    raise RuntimeError("network access is stubbed out in this benchmark")
+
+def read_fixture(name):
+    with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+        return f.read()
+
+def scale_listing(html, factor):
+    """Listing page with every faculty row repeated ``factor`` times"""
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = soup.select('div.views-row')
+    for row in rows:
+        for _ in range(factor - 1):
+            row.insert_after(copy.copy(row))
+    return str(soup)
+
+def scale_profile(html, factor):
+    """Profile page whose person article body is repeated ``factor`` times"""
+    soup = BeautifulSoup(html, 'html.parser')
+    article = soup.select_one(ga_tech_scraper.PROFILE_REGION_SELECTORS[-1])
+    if article is not None:
+        children = list(article.children)
+        for _ in range(factor - 1):
+            for child in children:
+                article.append(copy.copy(child))
+    return str(soup)
+
+def listing_case(html):
+    return (lambda: BeautifulSoup(html, 'html.parser'),
+            lambda soup: [(link.get_text(strip=True), link.get('href'))
+                          for link in process_faculty_page(soup, "School", LISTING_URL)])
+
+def profile_case(html, fast=True):
+    return (lambda: parse_profile_page(html, fast),
+            lambda soup: extract_professor_info(soup, "Professor Example", "profile", "School", fetch_publications=False))
+
+def measure(parse, extract, repeat):
+    """Median parse and extract milliseconds, then peak memory and held blocks from one traced run"""
+    parse_times, extract_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = parse()
+        parsed = time.perf_counter()
+        result = extract(soup)
+        parse_times.append((parsed - start) * 1000)
+        extract_times.append((time.perf_counter() - parsed) * 1000)
+        del soup
+
+    # Parse trees are full of reference cycles; collect the timed runs' trees first
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    soup = parse()
+    extract(soup)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del soup
+    gc.collect()
+    digest = hashlib.sha256(json.dumps(result, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    return {
+        'parse_ms': statistics.median(parse_times),
+        'extract_ms': statistics.median(extract_times),
+        'peak_kib': peak / 1024,
+        'blocks': blocks,
+        'digest': digest,
+    }
+
+def combine(results):
+    """Mean per page over several fixtures; the digest covers all of them"""
+    combined = {metric: statistics.mean(result[metric] for result in results) for metric in METRICS}
+    combined['digest'] = hashlib.sha256(''.join(result['digest'] for result in results).encode()).hexdigest()[:16]
+    return combined
+
+def run_cases(scale, repeat):
+    listing = read_fixture('faculty_page.html')
+    profiles = [read_fixture(os.path.basename(path)) for path in
+                sorted(glob.glob(os.path.join(ROOT, 'profile_*.html')), key=lambda path: int(path[:-5].rsplit('_', 1)[1]))]
+    cases = {}
+    # extract_professor_info and process_faculty_page report what they find with print
+    with contextlib.redirect_stdout(io.StringIO()):
+        cases['listing'] = measure(*listing_case(listing), repeat)
+        cases[f'listing x{scale}'] = measure(*listing_case(scale_listing(listing, scale)), repeat)
+        cases['profiles'] = combine([measure(*profile_case(html), repeat) for html in profiles])
+        cases['profiles (full parse)'] = combine([measure(*profile_case(html, fast=False), repeat) for html in profiles])
+        cases[f'profiles x{scale}'] = combine([measure(*profile_case(scale_profile(html, scale)), repeat)
+                                              for html in profiles])
+    return cases
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_cases(cases):
+    print(f"{'case':<24} {'parse':>9} {'extract':>9} {'peak':>10} {'blocks':>8}  digest")
+    for name, r in cases.items():
+        print(f"{name:<24} {r['parse_ms']:>7.2f}ms {r['extract_ms']:>7.2f}ms {r['peak_kib']:>7.0f}KiB "
+              f"{r['blocks']:>8.0f}  {r['digest']}")
+
+def compare(baseline, cases, threshold):
+    """Print changes against a saved run; return True if anything regressed"""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} ({baseline.get('created')}), "
+          f"threshold {threshold:.0%}")
+    print(f"{'case':<24} " + ' '.join(f"{metric:>11}" for metric in METRICS) + "  output")
+    regressed = False
+    for name, r in cases.items():
+        before = baseline['cases'].get(name)
+        if before is None:
+            print(f"{name:<24} (new case)")
+            continue
+        changes = []
+        for metric in METRICS:
+            ratio = r[metric] / before[metric] - 1 if before[metric] else 0.0
+            flag = '!' if ratio > threshold and metric != 'blocks' else ' '
+            regressed |= flag == '!'
+            changes.append(f"{ratio:>+10.0%}{flag}")
+        same_output = r['digest'] == before['digest']
+        regressed |= not same_output
+        print(f"{name:<24} " + ' '.join(changes) + f"  {'same' if same_output else 'CHANGED'}")
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline listing/profile extraction benchmark")
+    parser.add_argument('--scale', type=int, default=10, help='Repetition factor for the synthetic variants')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='Save the results as JSON')
+    parser.add_argument('--compare', help='Compare with results saved by --output')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Relative slowdown counted as a regression')
+    args = parser.parse_args()
+
+    # Nothing here may reach Google Scholar or the network
+    ga_tech_scraper.fetch_google_scholar_publications = no_network
+    ga_tech_scraper.get_publications_from_google_scholar = no_network
+    ga_tech_scraper.http_sessions.request = no_network
+
+    cases = run_cases(args.scale, args.repeat)
+    print(f"parser for profiles: {ga_tech_scraper.PROFILE_PARSER}, per page medians of {args.repeat} runs")
+    print_cases(cases)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'commit': git_commit(),
+                'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'python': platform.python_version(),
+                'scale': args.scale,
+                'cases': cases,
+            }, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, cases, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark streaming export/import of faculty dumps.
+
+Round-trips synthetic databases through JSON Lines (optionally gzipped) and
+reports time and peak traced Python memory for each step, which should stay
+flat as the number of faculty grows.
+
+Usage: python benchmarks/bench_faculty_io.py [--sizes 10000 100000 1000000] [--gzip]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase
+from bench_faculty_reads import populate
+
+def measure(func, *args):
+    """Run func and return (seconds, peak traced MiB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description="Faculty streaming import/export benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--gzip', action='store_true', help='Compress the dump')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'faculty':>8}  {'export':>8}  {'peak':>9}  {'import':>8}  {'peak':>9}  {'dump size':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = FacultyDatabase(os.path.join(tmp, 'source.db'))
+            populate(source, size)
+            dump = os.path.join(tmp, 'dump.jsonl' + ('.gz' if args.gzip else ''))
+            export_time, export_peak = measure(source.export_to_jsonl, dump)
+            source.close()
+
+            target = FacultyDatabase(os.path.join(tmp, 'target.db'))
+            import_time, import_peak = measure(target.import_from_jsonl, dump)
+            target.close()
+            dump_size = os.path.getsize(dump) / (1024 * 1024)
+        print(f"{size:>8}  {export_time:>7.2f}s  {export_peak:>6.1f}MiB  {import_time:>7.2f}s  {import_peak:>6.1f}MiB  {dump_size:>7.1f}MiB")
+
+if __name__ == "__main__":
+    main()
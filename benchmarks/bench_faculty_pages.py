@@ -0,0 +1,65 @@
+"""Benchmark keyset pagination of the faculty listing.
+
+Times fetching one page at increasing depths with get_faculty_page (keyset
+cursor), with LIMIT/OFFSET, and by slicing get_all_faculty() as callers
+used to, and reports the peak traced memory of each.
+
+Usage: python benchmarks/bench_faculty_pages.py [--size 100000] [--page-size 50]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase, FACULTY_SELECT, encode_page_cursor
+from bench_faculty_reads import populate
+
+def offset_page(db, offset, limit):
+    """LIMIT/OFFSET paging: SQLite still steps over every skipped row"""
+    with db.pool.reader() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"{FACULTY_SELECT} ORDER BY confidence_score DESC, id DESC LIMIT ? OFFSET ?", (limit, offset))
+        return db._with_publications(cursor, cursor.fetchall())
+
+def measure(func):
+    """Return (milliseconds, peak traced MiB); timed separately since tracing slows allocation"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description="Faculty keyset pagination benchmark")
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = FacultyDatabase(os.path.join(tmp, 'bench.db'))
+        populate(db, args.size)
+        with db.pool.reader() as conn:
+            ordered = conn.execute('SELECT confidence_score, id FROM faculty ORDER BY confidence_score DESC, id DESC').fetchall()
+
+        print(f"{args.size} faculty, {args.page_size} per page")
+        print(f"{'depth':>8}  {'keyset':>16}  {'offset':>16}  {'slice all':>16}")
+        for depth in (0, args.size // 10, args.size // 2, args.size - args.page_size):
+            cursor = encode_page_cursor(*ordered[depth - 1]) if depth else None
+            keyset = measure(lambda: db.get_faculty_page(cursor, limit=args.page_size))
+            offset = measure(lambda: offset_page(db, depth, args.page_size))
+            sliced = measure(lambda: db.get_all_faculty()[depth:depth + args.page_size])
+            print(f"{depth:>8}  " + "  ".join(f"{ms:>7.2f}ms {mib:>5.1f}MiB" for ms, mib in (keyset, offset, sliced)))
+        db.close()
+
+if __name__ == "__main__":
+    main()
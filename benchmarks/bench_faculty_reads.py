@@ -0,0 +1,97 @@
+"""Benchmark faculty list/export latency against synthetic databases.
+
+Compares the legacy per-row publication lookups (one query per faculty
+member) with the grouped read path in FacultyDatabase.
+
+Usage: python benchmarks/bench_faculty_reads.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase, FACULTY_SELECT, row_to_faculty, to_export_record
+
+DEPARTMENTS = [
+    'School of Computer Science', 'School of Interactive Computing',
+    'School of Computational Science and Engineering', 'School of Cybersecurity and Privacy',
+    'Biomedical Engineering', 'Electrical and Computer Engineering'
+]
+
+def populate(db, size, pubs_per_faculty=5):
+    """Fill the database with synthetic faculty and publications"""
+    with db.pool.writer() as conn:
+        conn.executemany('''
+        INSERT INTO faculty (name, email, department, school, research_interests, personal_website, profile_url, confidence_score)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            (f"Professor {i} Example", f"prof{i}@gatech.edu", DEPARTMENTS[i % len(DEPARTMENTS)],
+             'College of Computing', f"Topic {i % 97}; Topic {i % 31}", f"https://example.org/~prof{i}",
+             f"https://www.cc.gatech.edu/people/prof-{i}", (i % 10) / 10)
+            for i in range(size)
+        ))
+        conn.executemany('INSERT INTO publications (faculty_id, title, source) VALUES (?, ?, ?)', (
+            (fid, f"Paper {j} by professor {fid}", 'benchmark')
+            for fid in range(1, size + 1) for j in range(pubs_per_faculty)
+        ))
+
+def legacy_get_all_faculty(db, min_confidence=0.0):
+    """The pre-grouping read path: one publication query per faculty row"""
+    with db.pool.reader() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"{FACULTY_SELECT} WHERE confidence_score >= ? ORDER BY confidence_score DESC", (min_confidence,))
+        faculty_list = []
+        for row in cursor.fetchall():
+            cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (row[0],))
+            faculty_list.append(row_to_faculty(row, [pub[0] for pub in cursor.fetchall()]))
+    return faculty_list
+
+def legacy_export_to_json(db, json_file):
+    """The pre-grouping export: per-row lookups, then one json.dump"""
+    faculty_list = [to_export_record(faculty) for faculty in legacy_get_all_faculty(db)]
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(faculty_list, indent=2, ensure_ascii=False, fp=f)
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def count_queries(db, func, *args):
+    """Count the SQL statements issued by one call"""
+    statements = []
+    with db.pool.reader() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            func(*args)
+        finally:
+            conn.set_trace_callback(None)
+    return len(statements)
+
+def main():
+    parser = argparse.ArgumentParser(description="Faculty read path benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'faculty':>8}  {'list before':>12}  {'list after':>11}  {'export before':>14}  {'export after':>13}  {'queries':>15}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = FacultyDatabase(os.path.join(tmp, 'bench.db'))
+            populate(db, size)
+            before = timed(legacy_get_all_faculty, db)
+            after = timed(db.get_all_faculty)
+            export_before = timed(legacy_export_to_json, db, os.path.join(tmp, 'before.json'))
+            export_after = timed(db.export_to_json, os.path.join(tmp, 'after.json'))
+            queries = f"{count_queries(db, legacy_get_all_faculty, db)} -> {count_queries(db, db.get_all_faculty)}"
+            db.close()
+        print(f"{size:>8}  {before:>11.3f}s  {after:>10.3f}s  {export_before:>13.3f}s  {export_after:>12.3f}s  {queries:>15}")
+
+if __name__ == "__main__":
+    main()
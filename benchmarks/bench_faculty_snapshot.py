@@ -0,0 +1,102 @@
+"""Benchmark the in-memory faculty snapshot used by the web tier.
+
+For each size, reports the memory held by a FacultySnapshot (traced Python
+allocations and resident set growth) next to the list of dicts returned by
+get_all_faculty(), plus per-request latency of the two lookups app.py
+makes: department search and name matching for enrichment.
+
+Usage: python benchmarks/bench_faculty_snapshot.py [--sizes 10000 100000]
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase
+from faculty_snapshot import FacultySnapshot, normalize_name
+from bench_faculty_reads import populate
+
+def rss_mib():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def traced_mib(func):
+    """Python allocations (MiB) still held by the result of func"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / (1024 * 1024)
+
+def rss_growth_mib(func):
+    """Return (result, resident set growth in MiB); run without tracemalloc, whose bookkeeping inflates RSS"""
+    gc.collect()
+    before = rss_mib()
+    result = func()
+    gc.collect()
+    return result, rss_mib() - before
+
+def per_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def legacy_name_lookup(json_file, name):
+    """What ask_and_enrich_perplexity did per request: re-read the JSON dump and rebuild the map"""
+    with open(json_file, 'r') as f:
+        all_faculty = json.load(f)
+    faculty_by_norm = {normalize_name(fac['name']): fac for fac in all_faculty}
+    return faculty_by_norm.get(normalize_name(name))
+
+def main():
+    parser = argparse.ArgumentParser(description="Faculty snapshot memory/latency benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = FacultyDatabase(os.path.join(tmp, 'bench.db'))
+            populate(db, size)
+            dump = os.path.join(tmp, 'faculty.json')
+            db.export_to_json(dump)
+
+            # Warm SQLite's page cache so it isn't charged to whichever structure loads first
+            db.get_all_faculty()
+            # Both results stay alive so the second measurement can't reuse memory freed by the first
+            snapshot, snap_rss = rss_growth_mib(lambda: FacultySnapshot.load(db))
+            dicts, dict_rss = rss_growth_mib(db.get_all_faculty)
+            del dicts
+            snap_mib = traced_mib(lambda: FacultySnapshot.load(db))
+            dict_mib = traced_mib(db.get_all_faculty)
+            scale = 10000 / size
+            print(f"{size} faculty (MiB per 10k faculty)")
+            print(f"  list of dicts: {dict_mib * scale:6.2f} traced  {dict_rss * scale:6.2f} RSS")
+            print(f"  snapshot:      {snap_mib * scale:6.2f} traced  {snap_rss * scale:6.2f} RSS")
+
+            name = f"Professor {size // 2} Example"
+            department = per_call(lambda: db.search_faculty('Cybersecurity', fields=('department', 'school'), limit=500), args.repeat)
+            department_snapshot = per_call(
+                lambda: [record.to_dict() for record in snapshot.search_department('Cybersecurity', limit=500)], args.repeat
+            )
+            lookup = per_call(lambda: legacy_name_lookup(dump, name), max(args.repeat // 10, 1))
+            lookup_snapshot = per_call(lambda: snapshot.find_by_name(name), args.repeat)
+            print(f"  department search: {department:8.2f}ms -> {department_snapshot:8.3f}ms")
+            print(f"  name lookup:       {lookup:8.2f}ms -> {lookup_snapshot:8.3f}ms")
+            db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark profile page extraction on the checked-in profile_*.html fixtures.
+
+Times parse + extract_professor_info per profile with the whole page parsed
+by html.parser (parse_profile_page(fast=False)) and with the fast path
+(lxml, restricted to the profile region), and checks that both produce
+identical records. Google Scholar lookups are skipped.
+
+Usage: python benchmarks/bench_profile_extraction.py [--repeat 20]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from ga_tech_scraper import PROFILE_PARSER, extract_professor_info, parse_profile_page
+
+def extract(html, fast):
+    return extract_professor_info(parse_profile_page(html, fast), "Professor Example", "profile", "School",
+                                  fetch_publications=False)
+
+def per_profile_ms(html, fast, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract(html, fast)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile extraction benchmark")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    fixtures = sorted(glob.glob(os.path.join(ROOT, 'profile_*.html')),
+                      key=lambda path: int(os.path.basename(path)[8:-5]))
+    print(f"fast path parser: {PROFILE_PARSER}")
+    print(f"{'fixture':<18} {'full':>9} {'fast':>9} {'speedup':>8}  identical")
+    total_full = total_fast = 0.0
+    # extract_professor_info reports what it finds with print
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = []
+        for path in fixtures:
+            with open(path, encoding='utf-8') as f:
+                html = f.read()
+            identical = extract(html, False) == extract(html, True)
+            full = per_profile_ms(html, False, args.repeat)
+            fast = per_profile_ms(html, True, args.repeat)
+            rows.append((os.path.basename(path), full, fast, identical))
+    for name, full, fast, identical in rows:
+        total_full += full
+        total_fast += fast
+        print(f"{name:<18} {full:>7.2f}ms {fast:>7.2f}ms {full / fast:>7.1f}x  {identical}")
+    count = max(len(rows), 1)
+    print(f"{'mean per profile':<18} {total_full / count:>7.2f}ms {total_fast / count:>7.2f}ms "
+          f"{total_full / total_fast if total_fast else 0:>7.1f}x  {all(row[3] for row in rows)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Query plan regression check for the FacultyDatabase read paths.
+
+Runs every read path against a small synthetic database, captures the SQL
+it issues and runs EXPLAIN QUERY PLAN on each statement. Exits non-zero if
+any plan falls back to a full scan of a table instead of an index, an
+integer primary key lookup or a constrained full-text index query, unless
+that scan is listed in ALLOWED_SCANS.
+
+Usage: python benchmarks/check_query_plans.py [--size 2000] [--verbose]
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from faculty_db import FacultyDatabase
+from bench_faculty_reads import populate
+
+# Plan details that count as indexed access
+INDEXED_SCAN = re.compile(
+    r'USING (COVERING )?INDEX|USING INTEGER PRIMARY KEY|VIRTUAL TABLE INDEX \d+:\S'
+)
+# Statements FTS5 issues against its own shadow tables are quoted like 'main'.'faculty_fts_config'
+SHADOW_TABLE_SQL = "'main'."
+# Table scans a read path can't avoid, as {label: tables}
+ALLOWED_SCANS = {
+    # Faculty lacking a gatech.edu email: NOT LIKE can't use an index
+    'get_email_discovery_candidates': {'faculty'},
+    # Ranking every due faculty member needs every source's schedule state
+    'get_verification_candidates': {'verification_sources'},
+}
+# "FROM table alias" / "JOIN table AS alias" in a statement
+TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)\s+(?:AS\s+)?(\w+)', re.IGNORECASE)
+
+def read_paths(db):
+    """(label, callable) for every FacultyDatabase read path"""
+    return [
+        ('get_faculty_by_name (fuzzy)', lambda: db.get_faculty_by_name('Professor 12')),
+        ('get_faculty_by_name (exact)', lambda: db.get_faculty_by_name('Professor 12 Example', fuzzy_match=False)),
+        ('search_faculty_by_department', lambda: db.search_faculty_by_department('Interactive')),
+        ('get_faculty_by_id', lambda: db.get_faculty_by_id(42)),
+        ('get_all_faculty', lambda: db.get_all_faculty(min_confidence=0.8)),
+        ('search_faculty', lambda: db.search_faculty('topic 42')),
+        ('iter_faculty (by confidence)', lambda: list(db.iter_faculty(0.8, order_by_confidence=True))),
+        ('get_provenance', lambda: db.get_provenance(42)),
+        ('get_faculty_page', lambda: db.get_faculty_page(db.get_faculty_page(limit=20)[1], limit=20)),
+        ('get_faculty_page (department)', lambda: db.get_faculty_page(limit=20, department='Interactive')),
+        ('count_faculty', lambda: db.count_faculty(0.8)),
+        # Claims with an UPDATE on the writer; only its subquery reads
+        ('claim_enrichment', lambda: db.claim_enrichment(5)),
+        ('get_verification_log', lambda: db.get_verification_log(42)),
+        ('get_backed_off_sources', lambda: db.get_backed_off_sources(42)),
+        ('get_verification_candidates', lambda: db.get_verification_candidates(4, limit=20)),
+        ('get_email_discovery_candidates', lambda: db.get_email_discovery_candidates(20)),
+    ]
+
+def capture_statements(db, func):
+    """Run func and return the SELECT and UPDATE statements it sent to the database.
+
+    Nested reader() calls in a thread share the checked-out connection, so
+    holding one here traces everything func reads; the writer is traced too.
+    """
+    statements = []
+    with db.pool.reader() as conn, db.pool.writer() as writer:
+        for traced in (conn, writer):
+            traced.set_trace_callback(statements.append)
+        try:
+            func()
+        finally:
+            for traced in (conn, writer):
+                traced.set_trace_callback(None)
+    return [sql for sql in statements
+            if sql.lstrip().upper().startswith(('SELECT', 'UPDATE')) and SHADOW_TABLE_SQL not in sql]
+
+def table_scans(conn, sql):
+    """Return (plan, [full table scan lines]) for one statement.
+
+    Scans of subquery results (e.g. a LIMITed FTS hit list) and of table-valued
+    functions like json_each are not table scans and are ignored.
+    """
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    # Plans name aliased tables by their alias
+    names = {name: name for name in tables}
+    names.update((alias, table) for table, alias in TABLE_ALIAS.findall(sql) if table in tables)
+    plan = [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}')]
+    scans = []
+    for detail in plan:
+        match = re.match(r'SCAN (\w+)', detail)
+        if match and match.group(1) in names and not INDEXED_SCAN.search(detail):
+            scans.append((names[match.group(1)], detail))
+    return plan, scans
+
+def main():
+    parser = argparse.ArgumentParser(description="FacultyDatabase query plan regression check")
+    parser.add_argument('--size', type=int, default=2000, help='Synthetic faculty to load')
+    parser.add_argument('--verbose', action='store_true', help='Print every plan')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        db = FacultyDatabase(os.path.join(tmp, 'plans.db'))
+        populate(db, args.size)
+        for label, func in read_paths(db):
+            statements = capture_statements(db, func)
+            allowed = ALLOWED_SCANS.get(label, set())
+            with db.pool.reader() as conn:
+                results = []
+                for sql in statements:
+                    plan, scans = table_scans(conn, sql)
+                    results.append((sql, plan, [detail for table, detail in scans if table not in allowed],
+                                    [detail for table, detail in scans if table in allowed]))
+            bad = [sql for sql, plan, scans, _ in results if scans]
+            print(f"{'FAIL' if bad else 'ok':>4}  {label} ({len(statements)} statements)")
+            for sql, plan, scans, allowed_scans in results:
+                if args.verbose or scans:
+                    print(f"      {' '.join(sql.split())[:160]}")
+                    for detail in plan:
+                        flag = '!' if detail in scans else '~' if detail in allowed_scans else ' '
+                        print(f"        {flag} {detail}")
+            failures += len(bad)
+        db.close()
+
+    if failures:
+        print(f"{failures} statement(s) fall back to a table scan")
+        sys.exit(1)
+    print("All read paths use indexes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Check that a full re-crawl never resumes an interrupted incremental crawl, offline.
+
+Drives FacultyManager.scrape_and_update through a stub session serving
+faculty_page.html as every school's listing and the profile_*.html fixtures
+as the profiles, with the crawl frontier, HTTP and selector caches in a
+temporary directory:
+
+  1. a first crawl stores every profile and its fingerprint
+  2. an incremental crawl finds some profiles changed, skips the rest as
+     unchanged and is left unfinished by profiles that fail to load
+  3. a --rescrape-all crawl then runs with every profile loading
+
+and checks that the re-crawl starts a fresh frontier: it re-reads the
+directories, fetches and stores every profile, saves every fingerprint and
+finishes the crawl. A final pair of runs checks that an interrupted
+incremental crawl is still resumed by the next incremental one.
+
+Usage: python benchmarks/check_rescrape_resume.py
+
+Exits with status 1 if any check fails.
+"""
+import contextlib
+import io
+import logging
+import os
+import sys
+import tempfile
+import zlib
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import requests
+
+import ga_tech_scraper
+from crawl_frontier import CrawlFrontier
+from crawler import CrawlEngine
+from faculty_manager import FacultyManager
+
+PROFILE_FIXTURES = 12
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = 200
+
+class StubSession:
+    """Serves the fixtures, counting directory and profile fetches.
+
+    Profiles in ``changed`` are served another fixture, so their fingerprint
+    changes; profiles in ``failing`` refuse connections.
+    """
+
+    def __init__(self):
+        with open(os.path.join(ROOT, 'faculty_page.html'), encoding='utf-8') as f:
+            self.directory = f.read()
+        self.profiles = []
+        for i in range(PROFILE_FIXTURES):
+            with open(os.path.join(ROOT, f'profile_{i}.html'), encoding='utf-8') as f:
+                self.profiles.append(f.read())
+        self.changed = set()
+        self.failing = set()
+        self.reset()
+
+    def reset(self):
+        self.directory_fetches = 0
+        self.profile_fetches = 0
+
+    def get(self, url, **kwargs):
+        if '/people/faculty' in url:
+            self.directory_fetches += 1
+            return StubResponse(self.directory)
+        self.profile_fetches += 1
+        if url in self.failing:
+            raise requests.ConnectionError(f"connection refused: {url}")
+        index = zlib.crc32(url.encode()) + (url in self.changed)
+        return StubResponse(self.profiles[index % PROFILE_FIXTURES])
+
+def crawl(manager, session, incremental=True):
+    """One scrape_and_update run; returns (success, profile URLs written to the faculty DB)"""
+    session.reset()
+    written = []
+    add_faculty_many = manager.db.add_faculty_many
+
+    def recording_add(records, *args, **kwargs):
+        records = list(records)
+        written.extend(record['profile_url'] for record in records)
+        return add_faculty_many(records, *args, **kwargs)
+
+    manager.db.add_faculty_many = recording_add
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            success = manager.scrape_and_update(incremental=incremental)
+    finally:
+        manager.db.add_faculty_many = add_faculty_many
+    return success, written
+
+def frontier_in_progress():
+    frontier = CrawlFrontier()
+    try:
+        return frontier.in_progress()
+    finally:
+        frontier.close()
+
+def run_checks(manager, session):
+    checks = []
+    success, written = crawl(manager, session)
+    fetches = session.profile_fetches
+    profiles = sorted(manager.db.get_profile_fingerprints())
+    checks.append(("the first crawl stores every profile",
+                   success and len(profiles) > 2 and sorted(set(written)) == profiles))
+
+    session.changed = set(profiles[:2])
+    session.failing = set(profiles[2:4])
+    success, written = crawl(manager, session)
+    checks.append(("the interrupted incremental crawl stores only the changed profiles",
+                   success and sorted(set(written)) == profiles[:2] and frontier_in_progress()))
+
+    session.changed = set()
+    session.failing = set()
+    success, written = crawl(manager, session, incremental=False)
+    checks.append(("the re-crawl succeeds", success))
+    checks.append(("the re-crawl starts afresh, re-reading the directories",
+                   session.directory_fetches > 0))
+    checks.append(("the re-crawl fetches and stores every profile",
+                   session.profile_fetches == fetches and sorted(set(written)) == profiles))
+    checks.append(("the re-crawl saves every fingerprint and finishes the crawl",
+                   sorted(manager.db.get_profile_fingerprints()) == profiles and not frontier_in_progress()))
+
+    session.failing = set(profiles[:2])
+    crawl(manager, session)
+    session.failing = set()
+    success, written = crawl(manager, session)
+    checks.append(("an interrupted incremental crawl is resumed by the next one",
+                   success and session.directory_fetches == 0 and session.profile_fetches == 2
+                   and not frontier_in_progress()))
+    return checks
+
+def main():
+    logging.disable(logging.ERROR)
+    session = StubSession()
+    ga_tech_scraper.create_crawl_engine = lambda: CrawlEngine(max_workers=4, session=session, per_host_rate=None)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The frontier, HTTP cache and selector cache live in the working directory
+        os.chdir(workdir)
+        manager = FacultyManager(os.path.join(workdir, 'rescrape.db'))
+        try:
+            checks = run_checks(manager, session)
+        finally:
+            manager.close()
+
+    for label, passed in checks:
+        print(f"{'ok' if passed else 'FAIL':>4}  {label}")
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
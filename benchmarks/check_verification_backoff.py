@@ -0,0 +1,147 @@
+"""Check that failing verification sources are backed off, offline.
+
+Verifies one faculty member with every network call stubbed out: Google
+Scholar raises as if blocked and DBLP refuses connections, while the
+department and personal websites answer. Then checks that:
+
+  - the failing sources are logged as errors and backed off
+  - the next verification skips them, keeping the working sources' results
+  - a repeated failure doubles the delay, and a success clears it
+  - faculty with every source backed off are not scheduled
+
+Usage: python benchmarks/check_verification_backoff.py
+
+Exits with status 1 if any check fails.
+"""
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import requests
+
+import faculty_verifier
+from faculty_db import VERIFICATION_RETRY_DELAY
+from faculty_verifier import VERIFICATION_SOURCE_TIMEOUTS, FacultyVerifier
+
+PROFILE_URL = "https://www.cc.gatech.edu/people/ada-lovelace"
+PERSONAL_WEBSITE = "https://ada.example.org/"
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = 200
+
+class StubSession:
+    """DBLP refuses connections; every other host serves a page naming the professor"""
+
+    def __init__(self):
+        self.dblp_down = True
+
+    def get(self, url, **kwargs):
+        if 'dblp.org' in url and self.dblp_down:
+            raise requests.ConnectionError(f"connection refused: {url}")
+        return StubResponse("<html><body><h1>Ada Lovelace</h1><p>Georgia Tech</p></body></html>")
+
+class BlockedScholar:
+    """ScholarCache stand-in whose every lookup fails, counting the attempts"""
+
+    def __init__(self):
+        self.lookups = 0
+
+    def author(self, name, affiliation, throttle=None):
+        self.lookups += 1
+        raise Exception("Cannot Fetch from Google Scholar (blocked)")
+
+    def report(self):
+        pass
+
+def source_state(db, faculty_id):
+    with db.pool.reader() as conn:
+        rows = conn.execute('''
+        SELECT source, last_status, failures,
+               CAST(ROUND((julianday(retry_after) - julianday('now')) * 86400) AS INTEGER)
+        FROM verification_sources WHERE faculty_id = ?
+        ''', (faculty_id,)).fetchall()
+    return {source: (status, failures, delay) for source, status, failures, delay in rows}
+
+def expire_backoff(db, faculty_id):
+    """Move every retry_after into the past, as if the delays had elapsed"""
+    with db.pool.writer() as conn:
+        conn.execute('''
+        UPDATE verification_sources SET retry_after = datetime('now', '-1 second')
+        WHERE faculty_id = ? AND retry_after IS NOT NULL
+        ''', (faculty_id,))
+
+def run_checks(verifier, session, scholar):
+    db = verifier.db
+    db.add_faculty({'name': 'Ada Lovelace', 'department': 'Computing', 'profile_url': PROFILE_URL,
+                    'personal_website': PERSONAL_WEBSITE})
+    faculty_id = db.get_faculty_by_name('Ada Lovelace', fuzzy_match=False)[0]['id']
+    sources = len(VERIFICATION_SOURCE_TIMEOUTS)
+    checks = []
+
+    verifier.verify_faculty(faculty_id=faculty_id)
+    state = source_state(db, faculty_id)
+    checks.append(("failing sources are logged as errors",
+                   state['google_scholar'][0] == 'error' and state['dblp'][0] == 'error'))
+    checks.append(("working sources are logged as ok",
+                   state['department_website'][0] == 'ok' and state['personal_website'][0] == 'ok'))
+    checks.append(("failing sources are backed off for VERIFICATION_RETRY_DELAY",
+                   set(db.get_backed_off_sources(faculty_id)) == {'google_scholar', 'dblp'}
+                   and abs(state['dblp'][2] - VERIFICATION_RETRY_DELAY) <= 5))
+
+    lookups, logged = scholar.lookups, len(db.get_verification_log(faculty_id, limit=100))
+    verifier.verify_faculty(faculty_id=faculty_id)
+    new_sources = {entry['source'] for entry in db.get_verification_log(faculty_id, limit=100)[:-logged]}
+    checks.append(("backed-off sources are skipped on the next verification",
+                   scholar.lookups == lookups and new_sources == {'department_website', 'personal_website'}))
+
+    expire_backoff(db, faculty_id)
+    session.dblp_down = False
+    verifier.verify_faculty(faculty_id=faculty_id)
+    state = source_state(db, faculty_id)
+    checks.append(("a repeated failure doubles the delay",
+                   state['google_scholar'][1] == 2 and abs(state['google_scholar'][2] - 2 * VERIFICATION_RETRY_DELAY) <= 5))
+    checks.append(("a success clears the backoff", state['dblp'] == ('ok', 0, None)))
+
+    with db.pool.writer() as conn:
+        conn.execute("UPDATE verification_sources SET verified_at = datetime('now', '-2 days'), "
+                     "retry_after = datetime('now', '+1 day') WHERE faculty_id = ?", (faculty_id,))
+    checks.append(("faculty with every source backed off are not scheduled",
+                   not db.get_verification_candidates(sources)))
+    with db.pool.writer() as conn:
+        conn.execute("UPDATE verification_sources SET retry_after = NULL WHERE faculty_id = ? AND source = 'dblp'",
+                     (faculty_id,))
+    checks.append(("faculty with a source left to probe are scheduled",
+                   [c['id'] for c in db.get_verification_candidates(sources)] == [faculty_id]))
+    return checks
+
+def main():
+    logging.disable(logging.ERROR)
+    # The stub pages' URLs are not resolvable
+    faculty_verifier.validate_url = lambda url, check_reachable=False: True
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The verifier opens its HTTP cache in the working directory
+        os.chdir(workdir)
+        verifier = FacultyVerifier(os.path.join(workdir, 'backoff.db'))
+        session = StubSession()
+        scholar = BlockedScholar()
+        verifier.engine.session = session
+        verifier.scholar_cache = scholar
+        try:
+            checks = run_checks(verifier, session, scholar)
+        finally:
+            verifier.close()
+
+    for label, passed in checks:
+        print(f"{'ok' if passed else 'FAIL':>4}  {label}")
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
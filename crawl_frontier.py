@@ -0,0 +1,158 @@
+import sqlite3
+import json
+import threading
+import time
+
+FRONTIER_PATH = "crawl_frontier.db"
+# Attempts at a profile URL (across resumed runs) before it is given up on
+FRONTIER_MAX_ATTEMPTS = 3
+
+class CrawlFrontier:
+    """Persistent state of a faculty crawl in SQLite, so an interrupted crawl can resume.
+    
+    A crawl starts by recording every profile to fetch as a (name, url, school)
+    task, in link order. Each URL then moves through pending -> in_flight ->
+    done or failed, with its attempt count and last error, and the extracted
+    record is committed as soon as it completes. Records handed on to the
+    faculty database are marked stored, so after an interruption only the ones
+    that never reached it are handed on again. While a crawl is in progress
+    (started but not finished) a new run picks it up: done URLs are not fetched
+    again and only pending, interrupted and failed ones are retried.
+    
+    The options a crawl was started with are stored alongside it, because the
+    records depend on them; callers should only resume a crawl whose
+    ``options()`` match their own.
+    """
+    
+    def __init__(self, path=FRONTIER_PATH, max_attempts=FRONTIER_MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS frontier (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT UNIQUE NOT NULL,
+            name TEXT,
+            school TEXT,
+            state TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            result TEXT,
+            stored INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL
+        )
+        ''')
+        # Frontiers written before records were stored as the crawl goes
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(frontier)')]
+        if 'stored' not in columns:
+            self.conn.execute('ALTER TABLE frontier ADD COLUMN stored INTEGER NOT NULL DEFAULT 0')
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS crawl_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        ''')
+        self.conn.commit()
+    
+    def _set_state(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO crawl_state (key, value) VALUES (?, ?)', (key, value))
+    
+    def in_progress(self):
+        """Whether a crawl was started and has not finished"""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM crawl_state WHERE key = 'status'").fetchone()
+        return row is not None and row[0] == 'crawling'
+    
+    def options(self):
+        """The options (a JSON-serializable dict) the current crawl was started with, or None"""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM crawl_state WHERE key = 'options'").fetchone()
+        return json.loads(row[0]) if row is not None else None
+    
+    def start(self, tasks, options=None):
+        """Begin a new crawl of (name, profile_url, school_name) tasks with ``options``, discarding the previous one"""
+        with self.lock:
+            with self.conn:
+                self.conn.execute('DELETE FROM frontier')
+                self.conn.executemany(
+                    'INSERT OR IGNORE INTO frontier (name, url, school, updated_at) VALUES (?, ?, ?, ?)',
+                    ((name, url, school, time.time()) for name, url, school in tasks)
+                )
+                self._set_state('status', 'crawling')
+                self._set_state('started_at', str(time.time()))
+                self._set_state('options', json.dumps(options, sort_keys=True))
+    
+    def tasks(self):
+        """All (name, profile_url, school_name) tasks of the current crawl, in link order"""
+        with self.lock:
+            return [tuple(row) for row in self.conn.execute('SELECT name, url, school FROM frontier ORDER BY seq')]
+    
+    def remaining(self):
+        """Tasks still to do: pending, interrupted in flight, or failed with attempts left"""
+        with self.lock:
+            rows = self.conn.execute('''
+            SELECT name, url, school FROM frontier
+            WHERE state IN ('pending', 'in_flight') OR (state = 'failed' AND attempts < ?)
+            ORDER BY seq
+            ''', (self.max_attempts,)).fetchall()
+        return [tuple(row) for row in rows]
+    
+    def _update(self, sql, params):
+        with self.lock:
+            with self.conn:
+                self.conn.execute(sql, params)
+    
+    def begin(self, url):
+        """Mark a URL in flight (counting the attempt) before fetching it"""
+        self._update("UPDATE frontier SET state = 'in_flight', attempts = attempts + 1, updated_at = ? WHERE url = ?",
+                     (time.time(), url))
+    
+    def complete(self, url, result):
+        """Commit a URL's extracted record (None for a profile unchanged since the last crawl)"""
+        self._update("UPDATE frontier SET state = 'done', result = ?, last_error = NULL, updated_at = ? WHERE url = ?",
+                     (json.dumps(result, ensure_ascii=False), time.time(), url))
+    
+    def fail(self, url, error):
+        self._update("UPDATE frontier SET state = 'failed', last_error = ?, updated_at = ? WHERE url = ?",
+                     (str(error)[:500], time.time(), url))
+    
+    def results(self):
+        """{profile_url: record} for every completed URL (None for unchanged profiles)"""
+        with self.lock:
+            rows = self.conn.execute("SELECT url, result FROM frontier WHERE state = 'done' ORDER BY seq").fetchall()
+        return {url: json.loads(result) for url, result in rows}
+    
+    def mark_stored(self, urls):
+        """Record that the completed records of ``urls`` have been stored elsewhere"""
+        with self.lock:
+            with self.conn:
+                self.conn.executemany('UPDATE frontier SET stored = 1 WHERE url = ?', ((url,) for url in urls))
+    
+    def unstored_results(self):
+        """{profile_url: record} for every extracted record not yet marked stored, in link order"""
+        with self.lock:
+            rows = self.conn.execute('''
+            SELECT url, result FROM frontier
+            WHERE state = 'done' AND stored = 0 AND result != 'null'
+            ORDER BY seq
+            ''').fetchall()
+        return {url: json.loads(result) for url, result in rows}
+    
+    def counts(self):
+        """Number of URLs in each state"""
+        with self.lock:
+            return dict(self.conn.execute('SELECT state, COUNT(*) FROM frontier GROUP BY state').fetchall())
+    
+    def finish(self):
+        """Mark the crawl complete, so the next run starts a new one"""
+        with self.lock:
+            with self.conn:
+                self._set_state('status', 'finished')
+                self._set_state('finished_at', str(time.time()))
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
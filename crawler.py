@@ -0,0 +1,271 @@
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Politeness defaults: concurrent requests per host, sustained requests/second per host, burst size
+DEFAULT_HOST_CONCURRENCY = 2
+DEFAULT_HOST_RATE = 1.0
+DEFAULT_HOST_BURST = 2
+
+def host_of(url):
+    """Network location of a URL, the unit politeness limits apply to"""
+    return urlparse(url).netloc.lower()
+
+def peak_rss_mib():
+    """Peak resident set size of this process in MiB (None where the platform doesn't report it)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, holding at most ``capacity``"""
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, deadline=None):
+        """Take one token, sleeping until one is available.
+        
+        With a ``deadline`` (time.monotonic() value), gives up and returns False
+        rather than wait past it; returns True once a token is taken.
+        """
+        if not self.rate:
+            return True
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                delay = (1 - self.tokens) / self.rate
+            if deadline is not None and now + delay > deadline:
+                return False
+            time.sleep(delay)
+
+class HostStats:
+    """Request counters for one host"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.busy = 0.0
+        self.first_start = None
+        self.last_end = None
+    
+    def record(self, start, end, size=0, error=False):
+        with self.lock:
+            self.requests += 1
+            self.errors += error
+            self.bytes += size
+            self.busy += end - start
+            self.first_start = start if self.first_start is None else min(self.first_start, start)
+            self.last_end = end if self.last_end is None else max(self.last_end, end)
+    
+    def as_dict(self):
+        with self.lock:
+            elapsed = (self.last_end - self.first_start) if self.requests else 0.0
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'bytes': self.bytes,
+                'elapsed': elapsed,
+                'pages_per_sec': self.requests / elapsed if elapsed else 0.0,
+                'avg_latency': self.busy / self.requests if self.requests else 0.0,
+            }
+
+class _HostState:
+    def __init__(self, concurrency, rate, burst):
+        self.concurrency = concurrency
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.stats = HostStats()
+
+class CrawlEngine:
+    """Concurrent fetching with per-host politeness.
+    
+    Every request to a host waits for one of that host's ``per_host_concurrency``
+    slots and a token from its bucket (``per_host_rate`` requests/second, bursts
+    of ``burst``), so different hosts are crawled in parallel while each one
+    sees a bounded, steady request rate. ``host_limits`` overrides the limits
+    for specific hosts: {host: (concurrency, rate, burst)}.
+    """
+    
+    def __init__(self, max_workers=16, per_host_concurrency=DEFAULT_HOST_CONCURRENCY,
+                 per_host_rate=DEFAULT_HOST_RATE, burst=DEFAULT_HOST_BURST, host_limits=None,
+                 session=None, timeout=30):
+        self.max_workers = max_workers
+        self.defaults = (per_host_concurrency, per_host_rate, burst)
+        self.host_limits = {host.lower(): limits for host, limits in (host_limits or {}).items()}
+        self.session = session or requests
+        self.timeout = timeout
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self.started = time.monotonic()
+    
+    def _host(self, host):
+        with self._hosts_lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _HostState(*self.host_limits.get(host, self.defaults))
+                self._hosts[host] = state
+            return state
+    
+    def _acquire(self, host, state, deadline):
+        """Take one of ``host``'s request slots and a rate token, or raise TimeoutError if not by ``deadline``"""
+        if deadline is None:
+            state.semaphore.acquire()
+            state.bucket.acquire()
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"deadline for {host} already passed")
+        if not state.semaphore.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise TimeoutError(f"no request slot for {host} before the deadline")
+        if not state.bucket.acquire(deadline):
+            state.semaphore.release()
+            raise TimeoutError(f"rate limit for {host} allows no request before the deadline")
+    
+    @contextmanager
+    def throttle(self, host, deadline=None):
+        """Hold one of ``host``'s request slots (after waiting for a rate token) for the block.
+        
+        Use it directly for calls that don't go through fetch(), e.g. client
+        libraries that talk to a rate-limited service. With a ``deadline``
+        (time.monotonic() value) it raises TimeoutError instead of waiting past it,
+        and the slot is given back once the deadline passes even if the block is
+        still running: a caller that stops waiting for a call it can't interrupt
+        doesn't leave the host blocked for the callers after it.
+        """
+        host = host.lower()
+        state = self._host(host)
+        self._acquire(host, state, deadline)
+        released = threading.Lock()
+        
+        def release():
+            if released.acquire(blocking=False):
+                state.semaphore.release()
+        
+        timer = None
+        if deadline is not None:
+            timer = threading.Timer(max(0.0, deadline - time.monotonic()), release)
+            timer.daemon = True
+            timer.start()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            state.stats.record(start, time.monotonic(), error=True)
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            release()
+        state.stats.record(start, time.monotonic())
+    
+    def fetch(self, url, deadline=None, **kwargs):
+        """GET ``url`` within its host's politeness limits.
+        
+        Sessions that keep a local cache (http_cache.CachedSession) answer fresh
+        entries through ``cached_response`` without taking a request slot. With
+        a ``deadline`` (time.monotonic() value), raises TimeoutError if the
+        host's limits would hold the request past it.
+        """
+        cached_response = getattr(self.session, 'cached_response', None)
+        if cached_response is not None:
+            response = cached_response(url, **kwargs)
+            if response is not None:
+                return response
+        kwargs.setdefault('timeout', self.timeout)
+        host = host_of(url)
+        state = self._host(host)
+        self._acquire(host, state, deadline)
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, **kwargs)
+        except Exception:
+            state.stats.record(start, time.monotonic(), error=True)
+            raise
+        finally:
+            state.semaphore.release()
+        state.stats.record(start, time.monotonic(), len(response.content),
+                           error=response.status_code >= 400)
+        return response
+    
+    def map(self, func, items, key=None):
+        """Run ``func`` over ``items`` on the worker pool and return the results in order.
+        
+        ``key(item)`` names the host an item's work goes to; at most that host's
+        concurrency limit of its items are in flight at once, so queued work for
+        a slow host never ties up workers other hosts could use. A task that
+        raises gets None as its result.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        pending = defaultdict(deque)
+        for index, item in enumerate(items):
+            pending[key(item).lower() if key else None].append(index)
+        
+        active = defaultdict(int)
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def launch(group):
+                limit = self._host(group).concurrency if group is not None else self.max_workers
+                while pending[group] and active[group] < limit:
+                    index = pending[group].popleft()
+                    active[group] += 1
+                    in_flight[pool.submit(func, items[index])] = (group, index)
+            
+            for group in list(pending):
+                launch(group)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group, index = in_flight.pop(future)
+                    active[group] -= 1
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        print(f"Crawl task for {group or 'item'} {index} failed: {e}")
+                    launch(group)
+        return results
+    
+    def host_stats(self):
+        """Per-host counters: requests, errors, bytes, elapsed, pages_per_sec, avg_latency"""
+        with self._hosts_lock:
+            hosts = dict(self._hosts)
+        return {host: state.stats.as_dict() for host, state in sorted(hosts.items())}
+    
+    def report(self):
+        """Print pages/sec and time-to-complete for every host crawled"""
+        stats = self.host_stats()
+        print(f"\n{'host':<32} {'pages':>6} {'errors':>6} {'time':>8} {'pages/s':>8} {'latency':>8}")
+        for host, s in stats.items():
+            print(f"{host:<32} {s['requests']:>6} {s['errors']:>6} {s['elapsed']:>7.1f}s "
+                  f"{s['pages_per_sec']:>8.2f} {s['avg_latency']:>7.2f}s")
+        total = sum(s['requests'] for s in stats.values())
+        elapsed = time.monotonic() - self.started
+        print(f"{'total':<32} {total:>6} {'':>6} {elapsed:>7.1f}s {total / elapsed if elapsed else 0:>8.2f}")
+        peak_rss = peak_rss_mib()
+        if peak_rss is not None:
+            print(f"Peak memory: {peak_rss:.0f} MiB")
+        return stats
@@ -0,0 +1,118 @@
+import logging
+import re
+import time
+
+from scholarly import scholarly
+
+from crawler import CrawlEngine
+from ga_tech_scraper import SCHOLAR_HOST
+from scholar_cache import default_scholar_cache
+
+logger = logging.getLogger("email_discovery")
+
+# Scholar publication fills spent on one faculty member per run
+EMAIL_DISCOVERY_BUDGET = 3
+# Low priority: one fill at a time, one every 10 seconds
+EMAIL_DISCOVERY_RATE = 0.1
+# Only publications after this year are searched for an address
+EMAIL_DISCOVERY_MIN_YEAR = 2015
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
+def publication_year(pub):
+    """A publication's year as an int, or None if missing or unparseable"""
+    try:
+        return int(pub.get('bib', {}).get('pub_year'))
+    except (TypeError, ValueError):
+        return None
+
+def recent_publications(author):
+    """The author's publications after EMAIL_DISCOVERY_MIN_YEAR, in profile order"""
+    recent = []
+    for pub in author.get('publications', []):
+        year = publication_year(pub)
+        if year is not None and year > EMAIL_DISCOVERY_MIN_YEAR:
+            recent.append(pub)
+    return recent
+
+def find_gatech_email(pub_filled):
+    """The first gatech.edu address in a filled publication, or None"""
+    if 'author_pub_id' not in pub_filled:
+        return None
+    for email in EMAIL_PATTERN.findall(str(pub_filled)):
+        if 'gatech.edu' in email:
+            return email
+    return None
+
+class EmailDiscoverer:
+    """Looks for faculty email addresses in their recent Google Scholar publications.
+    
+    A low-priority stage of its own, so verification no longer fills every
+    recent publication. Each faculty member without a gatech.edu address gets
+    at most ``budget`` publication fills per run, stopping at the first
+    address found. How many publications were tried is stored, so the next
+    run carries on after them; faculty with no Scholar profile or no address
+    in any recent publication are retried after EMAIL_DISCOVERY_RETRY_DAYS.
+    The author profile itself comes from the shared ScholarCache.
+    """
+    
+    def __init__(self, db, budget=EMAIL_DISCOVERY_BUDGET, rate=EMAIL_DISCOVERY_RATE, scholar_cache=None,
+                 fill=scholarly.fill):
+        self.db = db
+        self.budget = budget
+        self.scholar_cache = scholar_cache or default_scholar_cache()
+        self.fill = fill
+        self.engine = CrawlEngine(max_workers=1, host_limits={SCHOLAR_HOST: (1, rate, 1)})
+    
+    def discover(self, faculty):
+        """Spend up to ``budget`` fills on one faculty member; returns the recorded status"""
+        faculty_id, name = faculty['id'], faculty['name']
+        tried = faculty['publications_tried']
+        try:
+            # The same (name, department) lookup the verifier makes, so usually cached
+            author = self.scholar_cache.author(name, faculty['department'],
+                                               throttle=lambda: self.engine.throttle(SCHOLAR_HOST))
+        except Exception as e:
+            logger.warning(f"Scholar lookup for {name} failed: {e}")
+            self.db.record_email_discovery(faculty_id, 'pending', tried, 0, error=e)
+            return 'pending'
+        if not author:
+            self.db.record_email_discovery(faculty_id, 'no_profile', tried, 0)
+            return 'no_profile'
+        
+        recent = recent_publications(author)
+        requests = 0
+        for pub in recent[tried:]:
+            if requests >= self.budget:
+                break
+            requests += 1
+            tried += 1
+            try:
+                with self.engine.throttle(SCHOLAR_HOST):
+                    pub_filled = self.fill(pub)
+            except Exception as e:
+                # Likely blocked: leave the rest of this faculty member for a later run
+                logger.warning(f"Error filling publication details for {name}: {e}")
+                self.db.record_email_discovery(faculty_id, 'pending', tried, requests, error=e)
+                return 'pending'
+            email = find_gatech_email(pub_filled)
+            if email:
+                logger.info(f"Found email {email} for {name} after {requests} publication lookups")
+                self.db.record_email_discovery(faculty_id, 'found', tried, requests, email=email)
+                return 'found'
+        
+        status = 'pending' if tried < len(recent) else 'exhausted'
+        self.db.record_email_discovery(faculty_id, status, tried, requests)
+        return status
+    
+    def run(self, max_faculty=None):
+        """Try every candidate once (or the first ``max_faculty``); returns counts per status"""
+        counts = {'found': 0, 'pending': 0, 'exhausted': 0, 'no_profile': 0}
+        start = time.monotonic()
+        for faculty in self.db.get_email_discovery_candidates(max_faculty):
+            counts[self.discover(faculty)] += 1
+        
+        elapsed = time.monotonic() - start
+        logger.info(f"Email discovery: {counts['found']} found, {counts['pending']} to continue, "
+                    f"{counts['exhausted']} exhausted, {counts['no_profile']} without a Scholar profile "
+                    f"in {elapsed:.1f}s; totals now {self.db.get_email_discovery_status()}")
+        return counts
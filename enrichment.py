@@ -0,0 +1,79 @@
+import logging
+import time
+
+from crawler import CrawlEngine
+from faculty_db import ENRICHMENT_MAX_ATTEMPTS, ENRICHMENT_RETRY_DELAY
+from ga_tech_scraper import SCHOLAR_HOST, fetch_google_scholar_publications
+from scholar_cache import default_scholar_cache
+
+logger = logging.getLogger("enrichment")
+
+# Google Scholar is the most rate-limited upstream: one lookup at a time, one every 5 seconds
+ENRICHMENT_CONCURRENCY = 1
+ENRICHMENT_RATE = 0.2
+ENRICHMENT_BURST = 1
+
+class PublicationEnricher:
+    """Drains the enrichment queue, filling in publications from Google Scholar.
+    
+    Runs separately from the crawl: the scraper stores profile data and queues
+    each faculty member (FacultyDatabase.add_faculty_many(..., enrich=True)),
+    and this stage works through the queue with its own concurrency and rate
+    limit. Failed lookups are retried with exponential backoff up to
+    ``max_attempts``; because the queue lives in the database, an interrupted
+    run picks up where it stopped.
+    """
+    
+    def __init__(self, db, concurrency=ENRICHMENT_CONCURRENCY, rate=ENRICHMENT_RATE, burst=ENRICHMENT_BURST,
+                 max_attempts=ENRICHMENT_MAX_ATTEMPTS, retry_delay=ENRICHMENT_RETRY_DELAY,
+                 fetch=fetch_google_scholar_publications):
+        self.db = db
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.fetch = fetch
+        self.engine = CrawlEngine(max_workers=concurrency, host_limits={SCHOLAR_HOST: (concurrency, rate, burst)})
+    
+    def enrich(self, item):
+        """Look up one claimed queue item; returns 'done', 'pending' (will be retried) or 'failed'"""
+        faculty_id, name = item['faculty_id'], item['name']
+        if name is None:
+            # The faculty member was deleted after being queued
+            self.db.complete_enrichment(faculty_id, [])
+            return 'done'
+        try:
+            # Only requests that miss the Scholar cache wait for the rate limit
+            publications = self.fetch(name, throttle=lambda: self.engine.throttle(SCHOLAR_HOST))
+        except Exception as e:
+            status = self.db.fail_enrichment(faculty_id, e, self.max_attempts, self.retry_delay)
+            logger.warning(f"Enrichment attempt {item['attempts']} for {name} failed ({e}); {status}")
+            return status or 'pending'
+        self.db.complete_enrichment(faculty_id, publications)
+        logger.info(f"Enriched {name} with {len(publications)} publications")
+        return 'done'
+    
+    def run(self, max_items=None):
+        """Process due queue items until none are left (or ``max_items`` have been tried).
+        
+        Items waiting out a retry delay are left for a later run. Returns
+        counts of the outcomes: {'done', 'pending', 'failed'}.
+        """
+        counts = {'done': 0, 'pending': 0, 'failed': 0}
+        start = time.monotonic()
+        processed = 0
+        while max_items is None or processed < max_items:
+            limit = self.concurrency * 4
+            if max_items is not None:
+                limit = min(limit, max_items - processed)
+            items = self.db.claim_enrichment(limit)
+            if not items:
+                break
+            for status in self.engine.map(self.enrich, items):
+                counts[status or 'pending'] += 1
+            processed += len(items)
+        
+        elapsed = time.monotonic() - start
+        logger.info(f"Enrichment: {counts['done']} done, {counts['pending']} to retry, {counts['failed']} failed "
+                    f"in {elapsed:.1f}s; queue now {self.db.get_enrichment_status()}")
+        default_scholar_cache().report()
+        return counts
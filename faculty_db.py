@@ -1,7 +1,17 @@
 import sqlite3
+import base64
 import json
 import os
+import gzip
 import logging
+import queue
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from faculty_schema import REBUILD_SEARCH_INDEX, REBUILD_TRIGRAM_INDEX, migrate
 
 # Set up logging
 logging.basicConfig(
@@ -14,71 +24,411 @@ logging.basicConfig(
 )
 logger = logging.getLogger("faculty_db")
 
+# Columns returned by every faculty read, in row order
+FACULTY_COLUMNS = (
+    'id', 'name', 'email', 'department', 'school', 'research_interests',
+    'lab_affiliation', 'personal_website', 'profile_url', 'confidence_score'
+)
+FACULTY_SELECT = f"SELECT {', '.join(FACULTY_COLUMNS)} FROM faculty"
+
+# Fields written by add_faculty/add_faculty_many, in statement order
+FACULTY_WRITE_FIELDS = (
+    'name', 'email', 'department', 'school', 'research_interests',
+    'lab_affiliation', 'personal_website', 'profile_url'
+)
+# Rows per multi-row upsert statement (keeps bound parameters well under SQLite's limit)
+UPSERT_CHUNK_SIZE = 100
+
+# Connection settings applied to every pooled connection (busy_timeout in ms)
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,
+    'synchronous': 'NORMAL',
+    'cache_size': -32000,
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+# Read connections a pool keeps open; threads beyond this wait for one to be returned
+READ_POOL_SIZE = 8
+
+# Completeness score for one faculty row: 0.2 per populated field, plus 0.2 for having publications
+CONFIDENCE_SCORE_SQL = '''(
+    CASE 
+        WHEN email IS NOT NULL THEN 0.2 ELSE 0 
+    END +
+    CASE 
+        WHEN personal_website IS NOT NULL AND personal_website != 'N/A' THEN 0.2 ELSE 0 
+    END +
+    CASE 
+        WHEN profile_url IS NOT NULL AND profile_url != 'N/A' THEN 0.2 ELSE 0 
+    END +
+    CASE 
+        WHEN research_interests IS NOT NULL AND research_interests != 'N/A' THEN 0.2 ELSE 0 
+    END +
+    CASE 
+        WHEN EXISTS (SELECT 1 FROM publications WHERE publications.faculty_id = faculty.id LIMIT 1) THEN 0.2 ELSE 0 
+    END
+)'''
+
+# Substring match on department or school (two LIKE patterns), answered by the trigram
+# index; it can only constrain one column per LIKE, hence the UNION
+DEPARTMENT_MATCH_CONDITION = '''id IN (
+    SELECT rowid FROM faculty_trigram WHERE department LIKE ?
+    UNION SELECT rowid FROM faculty_trigram WHERE school LIKE ?
+)'''
+
+# Default and maximum page sizes for get_faculty_page
+FACULTY_PAGE_SIZE = 50
+FACULTY_PAGE_MAX = 500
+
+# Columns returned by get_provenance, in row order
+PROVENANCE_COLUMNS = ('source_name', 'source_url', 'first_seen', 'last_seen', 'seen_count')
+# Default age (days) after which superseded provenance rows are compacted away
+PROVENANCE_RETENTION_DAYS = 365
+
+# Publication enrichment queue: attempts before an item is marked failed, the
+# retry delay (seconds, doubled after every failed attempt, capped) and how long
+# a claimed item may run before another worker can take it over
+ENRICHMENT_MAX_ATTEMPTS = 5
+ENRICHMENT_RETRY_DELAY = 60
+ENRICHMENT_MAX_RETRY_DELAY = 6 * 3600
+ENRICHMENT_LEASE = 600
+# Days before faculty with no Scholar profile, or no email in any recent publication, are tried again
+EMAIL_DISCOVERY_RETRY_DAYS = 30
+
+# Verification scheduling: a source that errors or is deferred for a faculty member isn't
+# probed for them again for VERIFICATION_RETRY_DELAY seconds, doubled after every consecutive
+# failure and capped (a throttled outcome, where the verifier's own rate limits left the
+# probe no request slot, doesn't count); faculty verified in the last
+# VERIFICATION_MIN_INTERVAL seconds aren't due
+VERIFICATION_RETRY_DELAY = 12 * 3600
+VERIFICATION_MAX_RETRY_DELAY = 14 * 24 * 3600
+VERIFICATION_MIN_INTERVAL = 12 * 3600
+# Age of last_updated (days) at which a record counts as fully stale
+VERIFICATION_STALE_DAYS = 30
+# Verification priority of faculty row f joined with its verification_sources summary v:
+# staleness (capped at twice VERIFICATION_STALE_DAYS), missing confidence, 1 if never
+# verified, and half the share of sources whose last outcome was an error or deferral
+VERIFICATION_PRIORITY_SQL = f'''(
+    MIN((julianday('now') - julianday(COALESCE(f.last_updated, 0))) / {VERIFICATION_STALE_DAYS}, 2.0) +
+    (1.0 - COALESCE(f.confidence_score, 0)) +
+    CASE WHEN v.verified_at IS NULL THEN 1.0 ELSE 0 END +
+    COALESCE(0.5 * v.failing / v.sources, 0)
+)'''
+
+# Fields written by exports (database-specific fields are dropped)
+EXPORT_FIELDS = (
+    'name', 'email', 'department', 'school', 'research_interests',
+    'lab_affiliation', 'personal_website', 'profile_url', 'publications'
+)
+
+# Scraped link texts that are navigation entries rather than faculty members
+NON_FACULTY_NAMES = frozenset([
+    'home', 'directory', 'visitor parking information', 'main directory', 'day', 'welcome',
+    'undergraduate handbook', 'professional education', 'financial aid', 'faculty', 'staff', 
+    'office', 'about', 'contact', 'events', 'graduate handbook', 'student', 'advising', 
+    'administration', 'resources', 'faq', 'news', 'alumni', 'forms', 'information', 'handbook', 'overview'
+])
+
+# Full-text search columns and their BM25 weights (name matches rank highest)
+SEARCH_FIELDS = ('name', 'department', 'school', 'research_interests', 'publications')
+SEARCH_WEIGHTS = (10.0, 4.0, 2.0, 3.0, 1.0)
+
+def row_to_faculty(row, publications):
+    """Build a faculty record dict from a FACULTY_COLUMNS row"""
+    faculty = dict(zip(FACULTY_COLUMNS, row))
+    faculty['publications'] = publications
+    return faculty
+
+def encode_page_cursor(confidence_score, faculty_id):
+    """Opaque cursor for the page after a faculty row in (confidence_score, id) order"""
+    token = json.dumps([confidence_score, faculty_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(token).decode('ascii').rstrip('=')
+
+def decode_page_cursor(cursor):
+    """Inverse of encode_page_cursor; raises ValueError if the cursor is malformed"""
+    try:
+        token = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        confidence_score, faculty_id = json.loads(token)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    if not isinstance(confidence_score, (int, float)) or not isinstance(faculty_id, int):
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return confidence_score, faculty_id
+
+def to_export_record(faculty):
+    """Strip a faculty record down to the fields written by exports"""
+    return {field: faculty.get(field) for field in EXPORT_FIELDS}
+
+def build_match_query(text, fields=None, prefix=True):
+    """Turn free text into an FTS5 MATCH expression (all terms must match)"""
+    terms = re.findall(r'\w+', text.lower())
+    if not terms:
+        return None
+    
+    expression = ' '.join(f'"{term}"*' if prefix else f'"{term}"' for term in terms)
+    if fields:
+        unknown = set(fields) - set(SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown search fields: {', '.join(sorted(unknown))}")
+        expression = f"{{{' '.join(fields)}}} : ({expression})"
+    return expression
+
+def group_publications(rows):
+    """Group (faculty_id, title) rows into a faculty_id -> [titles] mapping"""
+    publications = defaultdict(list)
+    for faculty_id, title in rows:
+        publications[faculty_id].append(title)
+    return publications
+
+def is_faculty_record(faculty):
+    """Whether a scraped/imported record looks like a real faculty member"""
+    name = faculty.get('name', '')
+    return bool(name) and name.lower() not in NON_FACULTY_NAMES
+
+def detect_format(path):
+    """Guess 'jsonl' or 'json' from a data file name (ignoring a .gz suffix)"""
+    base = path[:-3] if path.endswith('.gz') else path
+    return 'jsonl' if base.endswith(('.jsonl', '.ndjson')) else 'json'
+
+def open_data_file(path, mode):
+    """Open a JSON/JSON Lines file for text reading or writing, gzip-compressed if it ends in .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def iter_json_array(f, chunk_size=1 << 16):
+    """Yield the items of a top-level JSON array, reading the file a chunk at a time"""
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("Expected a JSON array")
+    buffer = buffer[1:]
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer.startswith(']'):
+            return
+        if buffer.startswith(','):
+            buffer = buffer[1:].lstrip()
+        try:
+            item, end = decoder.raw_decode(buffer)
+            # A number cut off at the end of the buffer still decodes, so an item
+            # only counts once the delimiter after it has been read
+            complete = eof or buffer[end:].lstrip()[:1] in (',', ']')
+        except json.JSONDecodeError:
+            # Item is split across chunks (or the file is truncated)
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield item
+        buffer = buffer[end:]
+
+def iter_json_lines(f):
+    """Yield one record per non-blank line of a JSON Lines file"""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+def write_json_array(f, records):
+    """Stream records as an indented JSON array (same layout as json.dump(..., indent=2))"""
+    count = 0
+    f.write('[')
+    for record in records:
+        f.write(',\n' if count else '\n')
+        # JSON text never contains raw newlines inside strings, so indenting every line is safe
+        f.write('  ' + json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        count += 1
+    f.write('\n]' if count else ']')
+    return count
+
+def write_json_lines(f, records):
+    """Stream records as JSON Lines"""
+    count = 0
+    for record in records:
+        f.write(json.dumps(record, ensure_ascii=False))
+        f.write('\n')
+        count += 1
+    return count
+
+class ConnectionPool:
+    """Thread-safe SQLite connections for one database file.
+    
+    Reads check out one of at most ``max_readers`` read-only connections and
+    return it when done, so short-lived threads (one per request in a
+    threaded web server) reuse connections instead of each opening its own.
+    All writes go through a single writer connection guarded by a lock. WAL
+    mode lets readers keep going while a write transaction is open. Use
+    ConnectionPool.acquire() so every FacultyDatabase on the same file in a
+    process shares one writer.
+    """
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, db_path, pragmas=None, max_readers=READ_POOL_SIZE):
+        self.db_path = db_path
+        self.pragmas = dict(SQLITE_PRAGMAS, **(pragmas or {}))
+        self.users = 0
+        # The connection a thread has checked out, so nested reader() calls reuse it
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        # Most recently returned first, so the connections in use keep warm caches
+        self._idle_readers = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(max(max_readers, 1))
+        self._write_lock = threading.RLock()
+        self._watcher = None
+        self._watch_lock = threading.Lock()
+        self.commits = 0
+        self._writer = self._connect()
+        # WAL is a property of the database file, so it only needs setting once
+        self._writer.execute('PRAGMA journal_mode=WAL')
+    
+    @classmethod
+    def acquire(cls, db_path):
+        """Get the process-wide pool for a database file (release it with release())"""
+        key = db_path if db_path == ':memory:' else os.path.abspath(db_path)
+        with cls._shared_lock:
+            pool = cls._shared.get(key)
+            if pool is None or db_path == ':memory:':
+                pool = cls(db_path)
+                if db_path != ':memory:':
+                    cls._shared[key] = pool
+            pool.users += 1
+            return pool
+    
+    def release(self):
+        """Drop one user of a shared pool, closing its connections after the last one"""
+        with self._shared_lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            key = os.path.abspath(self.db_path)
+            if self._shared.get(key) is self:
+                del self._shared[key]
+        self.close()
+    
+    def _connect(self, read_only=False):
+        # Autocommit mode: write transactions are opened explicitly in writer()
+        conn = sqlite3.connect(self.db_path, timeout=self.pragmas['busy_timeout'] / 1000,
+                               isolation_level=None, check_same_thread=False)
+        for pragma, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {pragma}={value}')
+        if read_only:
+            conn.execute('PRAGMA query_only=ON')
+        return conn
+    
+    @contextmanager
+    def reader(self):
+        """Yield a read connection checked out from the pool (the same one for nested calls in a thread)"""
+        if self.db_path == ':memory:':
+            # Every connection to :memory: is a separate database, so share the writer
+            with self._write_lock:
+                yield self._writer
+            return
+        
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+        
+        with self._reader_slots:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                conn = self._connect(read_only=True)
+                with self._readers_lock:
+                    self._readers.append(conn)
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle_readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Yield the writer connection inside one transaction (committed on success, rolled back on error)"""
+        with self._write_lock:
+            conn = self._writer
+            outermost = not conn.in_transaction
+            if outermost:
+                conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                if outermost and conn.in_transaction:
+                    conn.rollback()
+                raise
+            if outermost and conn.in_transaction:
+                conn.commit()
+                self.commits += 1
+    
+    def generation(self):
+        """A value that changes whenever anything (including other processes) commits to the database"""
+        if self.db_path == ':memory:':
+            return self.commits
+        # data_version changes for commits made by any connection other than the one asking
+        with self._watch_lock:
+            if self._watcher is None:
+                self._watcher = self._connect(read_only=True)
+            return self._watcher.execute('PRAGMA data_version').fetchone()[0]
+    
+    def vacuum(self):
+        """Rebuild the database file, returning free pages to the filesystem"""
+        # VACUUM can't run inside a transaction, so it bypasses writer()
+        with self._write_lock:
+            self._writer.execute('VACUUM')
+    
+    def close(self):
+        """Close every connection owned by the pool"""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        with self._watch_lock:
+            if self._watcher is not None:
+                readers.append(self._watcher)
+                self._watcher = None
+        for conn in readers:
+            conn.close()
+        with self._write_lock:
+            self._writer.close()
+
 class FacultyDatabase:
     def __init__(self, db_path="faculty_data.db"):
         """Initialize the faculty database"""
         self.db_path = db_path
-        self.conn = None
-        self.cursor = None
+        self.pool = ConnectionPool.acquire(db_path)
         self.initialize_db()
     
     def initialize_db(self):
-        """Create the database and tables if they don't exist"""
-        try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
-            
-            # Create faculty table
-            self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS faculty (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT,
-                department TEXT,
-                school TEXT,
-                research_interests TEXT,
-                lab_affiliation TEXT,
-                personal_website TEXT,
-                profile_url TEXT,
-                confidence_score REAL DEFAULT 0.5,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(name, department)
-            )
-            ''')
-            
-            # Create publications table with foreign key to faculty
-            self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS publications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                faculty_id INTEGER,
-                title TEXT NOT NULL,
-                source TEXT,
-                FOREIGN KEY (faculty_id) REFERENCES faculty(id),
-                UNIQUE(faculty_id, title)
-            )
-            ''')
-            
-            # Create data_sources table to track where faculty info came from
-            self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS data_sources (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                faculty_id INTEGER,
-                source_name TEXT NOT NULL,
-                source_url TEXT,
-                data_retrieved TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (faculty_id) REFERENCES faculty(id)
-            )
-            ''')
-            
-            self.conn.commit()
+        """Create the database and apply any pending schema migrations"""
+        try:
+            applied = migrate(self.pool.writer)
+            if applied:
+                logger.info(f"Database schema migrated to version {applied[-1]}")
             logger.info("Database initialized successfully")
         except sqlite3.Error as e:
             logger.error(f"Database initialization error: {e}")
     
+    def rebuild_search_index(self):
+        """Repopulate the full-text and trigram search indexes from the faculty and publications tables"""
+        with self.pool.writer() as conn:
+            for statement in REBUILD_SEARCH_INDEX:
+                conn.execute(statement)
+            conn.execute(REBUILD_TRIGRAM_INDEX)
+        logger.info("Rebuilt faculty search index")
+    
     def close(self):
-        """Close the database connection"""
-        if self.conn:
-            self.conn.close()
+        """Release this instance's connections"""
+        if self.pool:
+            self.pool.release()
+            self.pool = None
     
     def add_faculty(self, faculty_data, source_name="scraper"):
         """Add or update a faculty member in the database"""
@@ -88,20 +438,85 @@ class FacultyDatabase:
             if not name:
                 logger.warning("Cannot add faculty without a name")
                 return None
-                
-            email = faculty_data.get('email')
-            department = faculty_data.get('department')
-            school = faculty_data.get('school')
-            research_interests = faculty_data.get('research_interests')
-            lab_affiliation = faculty_data.get('lab_affiliation')
-            personal_website = faculty_data.get('personal_website')
-            profile_url = faculty_data.get('profile_url')
-            
-            # Insert or update faculty record
-            self.cursor.execute('''
+            
+            with self.pool.writer() as conn:
+                faculty_id = self._write_faculty_batch(conn.cursor(), [faculty_data], source_name)[0]
+            
+            logger.info(f"Added/updated faculty: {name}")
+            return faculty_id
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error adding faculty {faculty_data.get('name')}: {e}")
+            return None
+    
+    def add_faculty_many(self, faculty_records, source_name="scraper", batch_size=500, enrich=False):
+        """Add or update many faculty members, committing once per batch.
+        
+        ``faculty_records`` can be any iterable (including a generator), so
+        large imports are never held in memory at once. With ``enrich`` every
+        faculty member written is queued for publication enrichment in the
+        same transaction. Returns the number of faculty members written.
+        """
+        written = 0
+        batch_number = 0
+        batch = []
+        
+        def flush():
+            nonlocal written, batch_number
+            batch_number += 1
+            start = time.perf_counter()
+            try:
+                with self.pool.writer() as conn:
+                    cursor = conn.cursor()
+                    faculty_ids = self._write_faculty_batch(cursor, batch, source_name)
+                    if enrich:
+                        self._enqueue_enrichment(cursor, faculty_ids)
+            except sqlite3.Error as e:
+                # The batch was rolled back; fall back to one record at a time so a
+                # single bad record doesn't sink the batch
+                logger.warning(f"Batch {batch_number} failed ({e}); retrying records individually")
+                faculty_ids = [faculty_id for faculty_id in (self.add_faculty(faculty, source_name) for faculty in batch)
+                               if faculty_id is not None]
+                if enrich:
+                    self.enqueue_enrichment(faculty_ids)
+                count = len(faculty_ids)
+            else:
+                count = len(batch)
+            elapsed = time.perf_counter() - start
+            written += count
+            logger.info(f"Batch {batch_number}: wrote {count} faculty in {elapsed:.3f}s "
+                        f"({count / elapsed if elapsed else 0:.0f} faculty/s)")
+            batch.clear()
+        
+        for faculty in faculty_records:
+            if not faculty.get('name'):
+                logger.warning("Cannot add faculty without a name")
+                continue
+            batch.append(faculty)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        
+        logger.info(f"Added/updated {written} faculty in {batch_number} batches from {source_name}")
+        return written
+    
+    def _write_faculty_batch(self, cursor, batch, source_name):
+        """Upsert a batch of faculty records and their publications inside the caller's transaction.
+        
+        Returns the faculty ids in the same order as ``batch``.
+        """
+        faculty_ids = {}
+        for start in range(0, len(batch), UPSERT_CHUNK_SIZE):
+            chunk = batch[start:start + UPSERT_CHUNK_SIZE]
+            placeholders = ', '.join([f"({', '.join('?' * len(FACULTY_WRITE_FIELDS))})"] * len(chunk))
+            params = [faculty.get(field) for faculty in chunk for field in FACULTY_WRITE_FIELDS]
+            
+            # Insert or update faculty records, getting ids back from the same statement
+            cursor.execute(f'''
             INSERT INTO faculty 
-            (name, email, department, school, research_interests, lab_affiliation, personal_website, profile_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ({', '.join(FACULTY_WRITE_FIELDS)})
+            VALUES {placeholders}
             ON CONFLICT(name, department) DO UPDATE SET
             email=excluded.email,
             school=excluded.school,
@@ -110,82 +525,76 @@ class FacultyDatabase:
             personal_website=excluded.personal_website,
             profile_url=excluded.profile_url,
             last_updated=CURRENT_TIMESTAMP
-            ''', (name, email, department, school, research_interests, lab_affiliation, personal_website, profile_url))
-            
-            # Get the faculty ID (either newly inserted or existing)
-            self.cursor.execute('SELECT id FROM faculty WHERE name=? AND department=?', (name, department))
-            faculty_id = self.cursor.fetchone()[0]
-            
-            # Add publications if available
-            publications = faculty_data.get('publications', [])
-            for pub in publications:
-                if pub:  # Skip empty publications
-                    self.cursor.execute('''
-                    INSERT OR IGNORE INTO publications (faculty_id, title, source)
-                    VALUES (?, ?, ?)
-                    ''', (faculty_id, pub, source_name))
-            
-            # Record the data source
-            self.cursor.execute('''
-            INSERT INTO data_sources (faculty_id, source_name, source_url)
-            VALUES (?, ?, ?)
-            ''', (faculty_id, source_name, profile_url))
-            
-            self.conn.commit()
-            logger.info(f"Added/updated faculty: {name}")
-            return faculty_id
+            RETURNING id, name, department
+            ''', params)
+            for faculty_id, name, department in cursor.fetchall():
+                faculty_ids[(name, department)] = faculty_id
+        
+        ids = [faculty_ids[(faculty['name'], faculty.get('department'))] for faculty in batch]
+        
+        # Add publications if available, skipping empty titles; the search index
+        # is refreshed once for the whole batch below
+        cursor.execute('UPDATE search_index_state SET deferred = 1')
+        cursor.executemany('''
+        INSERT OR IGNORE INTO publications (faculty_id, title, source)
+        VALUES (?, ?, ?)
+        ''', ((faculty_id, pub, source_name)
+              for faculty_id, faculty in zip(ids, batch)
+              for pub in faculty.get('publications') or [] if pub))
+        cursor.execute('UPDATE search_index_state SET deferred = 0')
+        cursor.execute('''
+        UPDATE faculty_fts
+        SET publications = (SELECT group_concat(title, ' ') FROM publications WHERE faculty_id = faculty_fts.rowid)
+        WHERE rowid IN (SELECT value FROM json_each(?))
+        ''', (json.dumps(ids),))
+        
+        # Record the data source; repeat observations only bump last_seen/seen_count
+        cursor.executemany('''
+        INSERT INTO data_sources (faculty_id, source_name, source_url)
+        VALUES (?, ?, ?)
+        ON CONFLICT(faculty_id, source_name, COALESCE(source_url, '')) DO UPDATE SET
+        last_seen=CURRENT_TIMESTAMP,
+        seen_count=seen_count + 1
+        ''', ((faculty_id, source_name, faculty.get('profile_url')) for faculty_id, faculty in zip(ids, batch)))
+        
+        return ids
+    
+    def _select_faculty(self, clause="", params=(), order_by=""):
+        """Fetch faculty with their publications in two queries.
+
+        ``clause`` is appended to ``SELECT ... FROM faculty`` (a WHERE clause
+        and/or JOIN). Publications for every matching row are read with one
+        grouped query instead of one query per faculty member.
+        """
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"{FACULTY_SELECT} {clause} {order_by}", params)
+            faculty_rows = cursor.fetchall()
+            if not faculty_rows:
+                return []
             
-        except sqlite3.Error as e:
-            logger.error(f"Error adding faculty {faculty_data.get('name')}: {e}")
-            self.conn.rollback()
-            return None
+            if clause:
+                cursor.execute(f'''
+                SELECT faculty_id, title FROM publications
+                WHERE faculty_id IN (SELECT id FROM faculty {clause})
+                ORDER BY faculty_id, title
+                ''', params)
+            else:
+                cursor.execute('SELECT faculty_id, title FROM publications ORDER BY faculty_id, title')
+            publications = group_publications(cursor.fetchall())
+        
+        return [row_to_faculty(row, publications.get(row[0], [])) for row in faculty_rows]
     
     def get_faculty_by_name(self, name, fuzzy_match=True):
         """Get faculty by name, with optional fuzzy matching"""
         try:
             if fuzzy_match:
-                # Use SQLite's LIKE for basic fuzzy matching
-                self.cursor.execute('''
-                SELECT id, name, email, department, school, research_interests, 
-                       lab_affiliation, personal_website, profile_url, confidence_score
-                FROM faculty 
-                WHERE name LIKE ?
-                ''', (f"%{name}%",))
-            else:
-                # Exact match
-                self.cursor.execute('''
-                SELECT id, name, email, department, school, research_interests, 
-                       lab_affiliation, personal_website, profile_url, confidence_score
-                FROM faculty 
-                WHERE name = ?
-                ''', (name,))
-            
-            faculty_rows = self.cursor.fetchall()
-            faculty_list = []
-            
-            for row in faculty_rows:
-                faculty_id = row[0]
-                
-                # Get publications for this faculty
-                self.cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (faculty_id,))
-                publications = [pub[0] for pub in self.cursor.fetchall()]
-                
-                faculty = {
-                    'id': faculty_id,
-                    'name': row[1],
-                    'email': row[2],
-                    'department': row[3],
-                    'school': row[4],
-                    'research_interests': row[5],
-                    'lab_affiliation': row[6],
-                    'personal_website': row[7],
-                    'profile_url': row[8],
-                    'confidence_score': row[9],
-                    'publications': publications
-                }
-                faculty_list.append(faculty)
-            
-            return faculty_list
+                # Use SQLite's LIKE for basic fuzzy matching, answered by the trigram index
+                return self._select_faculty(
+                    "WHERE id IN (SELECT rowid FROM faculty_trigram WHERE name LIKE ?)", (f"%{name}%",)
+                )
+            # Exact match
+            return self._select_faculty("WHERE name = ?", (name,))
             
         except sqlite3.Error as e:
             logger.error(f"Error getting faculty by name {name}: {e}")
@@ -195,39 +604,10 @@ class FacultyDatabase:
         """Search for faculty by department keyword"""
         try:
             # Use SQLite's LIKE for keyword matching in department or school
-            self.cursor.execute('''
-            SELECT id, name, email, department, school, research_interests, 
-                   lab_affiliation, personal_website, profile_url, confidence_score
-            FROM faculty 
-            WHERE department LIKE ? OR school LIKE ?
-            ''', (f"%{department_keyword}%", f"%{department_keyword}%"))
-            
-            faculty_rows = self.cursor.fetchall()
-            faculty_list = []
-            
-            for row in faculty_rows:
-                faculty_id = row[0]
-                
-                # Get publications for this faculty
-                self.cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (faculty_id,))
-                publications = [pub[0] for pub in self.cursor.fetchall()]
-                
-                faculty = {
-                    'id': faculty_id,
-                    'name': row[1],
-                    'email': row[2],
-                    'department': row[3],
-                    'school': row[4],
-                    'research_interests': row[5],
-                    'lab_affiliation': row[6],
-                    'personal_website': row[7],
-                    'profile_url': row[8],
-                    'confidence_score': row[9],
-                    'publications': publications
-                }
-                faculty_list.append(faculty)
-            
-            return faculty_list
+            return self._select_faculty(
+                f"WHERE {DEPARTMENT_MATCH_CONDITION}",
+                (f"%{department_keyword}%", f"%{department_keyword}%")
+            )
             
         except sqlite3.Error as e:
             logger.error(f"Error searching faculty by department {department_keyword}: {e}")
@@ -236,36 +616,7 @@ class FacultyDatabase:
     def get_faculty_by_id(self, faculty_id):
         """Get faculty by ID"""
         try:
-            self.cursor.execute('''
-            SELECT id, name, email, department, school, research_interests, 
-                   lab_affiliation, personal_website, profile_url, confidence_score
-            FROM faculty 
-            WHERE id = ?
-            ''', (faculty_id,))
-            
-            row = self.cursor.fetchone()
-            if not row:
-                return []
-                
-            # Get publications for this faculty
-            self.cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (faculty_id,))
-            publications = [pub[0] for pub in self.cursor.fetchall()]
-            
-            faculty = {
-                'id': row[0],
-                'name': row[1],
-                'email': row[2],
-                'department': row[3],
-                'school': row[4],
-                'research_interests': row[5],
-                'lab_affiliation': row[6],
-                'personal_website': row[7],
-                'profile_url': row[8],
-                'confidence_score': row[9],
-                'publications': publications
-            }
-            
-            return [faculty]
+            return self._select_faculty("WHERE id = ?", (faculty_id,))
             
         except sqlite3.Error as e:
             logger.error(f"Error getting faculty by ID {faculty_id}: {e}")
@@ -274,188 +625,604 @@ class FacultyDatabase:
     def get_all_faculty(self, min_confidence=0.0):
         """Get all faculty with confidence score above threshold"""
         try:
-            self.cursor.execute('''
-            SELECT id, name, email, department, school, research_interests, 
-                   lab_affiliation, personal_website, profile_url, confidence_score
-            FROM faculty 
-            WHERE confidence_score >= ?
-            ORDER BY confidence_score DESC
-            ''', (min_confidence,))
+            return self._select_faculty(
+                "WHERE confidence_score >= ?", (min_confidence,),
+                order_by="ORDER BY confidence_score DESC"
+            )
             
-            faculty_rows = self.cursor.fetchall()
-            faculty_list = []
+        except sqlite3.Error as e:
+            logger.error(f"Error getting all faculty: {e}")
+            return []
+    
+    def search_faculty(self, query, fields=None, limit=20, prefix=True):
+        """Ranked full-text search over names, departments, interests and publication titles.
+        
+        Every term in ``query`` must match; with ``prefix`` each term also
+        matches longer words ("bio" finds "Biomedical"). ``fields`` restricts
+        the search to a subset of SEARCH_FIELDS. Results are ordered by BM25.
+        """
+        try:
+            match = build_match_query(query, fields, prefix)
+            if not match:
+                return []
             
-            for row in faculty_rows:
-                faculty_id = row[0]
+            weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+            return self._select_faculty(
+                f'''JOIN (
+                    SELECT rowid AS hit_id, bm25(faculty_fts, {weights}) AS hit_rank
+                    FROM faculty_fts WHERE faculty_fts MATCH ?
+                    ORDER BY hit_rank LIMIT ?
+                ) AS hits ON hits.hit_id = faculty.id''',
+                (match, limit),
+                order_by="ORDER BY hits.hit_rank"
+            )
+            
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error searching faculty for {query!r}: {e}")
+            return []
+    
+    def get_provenance(self, faculty_id):
+        """Where a faculty member's data came from, most recently seen first"""
+        try:
+            with self.pool.reader() as conn:
+                cursor = conn.execute('''
+                SELECT source_name, source_url, first_seen, last_seen, seen_count
+                FROM data_sources WHERE faculty_id = ?
+                ORDER BY last_seen DESC, id DESC
+                ''', (faculty_id,))
+                return [dict(zip(PROVENANCE_COLUMNS, row)) for row in cursor.fetchall()]
                 
-                # Get publications for this faculty
-                self.cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (faculty_id,))
-                publications = [pub[0] for pub in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Error getting provenance for faculty ID {faculty_id}: {e}")
+            return []
+    
+    def compact_provenance(self, retention_days=PROVENANCE_RETENTION_DAYS, vacuum=False):
+        """Drop provenance older than ``retention_days`` and rows for deleted faculty.
+        
+        The most recent observation from each source is always kept, so every
+        faculty member retains at least one row per source. ``vacuum`` also
+        rebuilds the database file to hand the freed pages back to the OS.
+        Returns the number of rows removed, or None on error.
+        """
+        try:
+            with self.pool.writer() as conn:
+                removed = conn.execute('''
+                DELETE FROM data_sources WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, last_seen, ROW_NUMBER() OVER (
+                            PARTITION BY faculty_id, source_name ORDER BY last_seen DESC, id DESC
+                        ) AS recency
+                        FROM data_sources
+                    )
+                    WHERE recency > 1 AND last_seen < datetime('now', ?)
+                )
+                ''', (f"-{int(retention_days)} days",)).rowcount
+                removed += conn.execute(
+                    'DELETE FROM data_sources WHERE faculty_id NOT IN (SELECT id FROM faculty)'
+                ).rowcount
+            
+            if vacuum:
+                self.pool.vacuum()
+            logger.info(f"Compacted provenance: removed {removed} rows older than {retention_days} days")
+            return removed
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error compacting provenance: {e}")
+            return None
+    
+    def get_profile_fingerprints(self):
+        """Content fingerprints from the last crawl: {profile_url: fingerprint}"""
+        try:
+            with self.pool.reader() as conn:
+                return dict(conn.execute('SELECT profile_url, fingerprint FROM profile_fingerprints').fetchall())
                 
-                faculty = {
-                    'id': faculty_id,
-                    'name': row[1],
-                    'email': row[2],
-                    'department': row[3],
-                    'school': row[4],
-                    'research_interests': row[5],
-                    'lab_affiliation': row[6],
-                    'personal_website': row[7],
-                    'profile_url': row[8],
-                    'confidence_score': row[9],
-                    'publications': publications
-                }
-                faculty_list.append(faculty)
-            
-            return faculty_list
+        except sqlite3.Error as e:
+            logger.error(f"Error getting profile fingerprints: {e}")
+            return {}
+    
+    def save_profile_fingerprints(self, fingerprints):
+        """Record {profile_url: fingerprint} from a crawl; last_changed moves only when a fingerprint differs"""
+        try:
+            with self.pool.writer() as conn:
+                conn.executemany('''
+                INSERT INTO profile_fingerprints (profile_url, fingerprint) VALUES (?, ?)
+                ON CONFLICT(profile_url) DO UPDATE SET
+                last_changed=CASE WHEN fingerprint = excluded.fingerprint THEN last_changed ELSE CURRENT_TIMESTAMP END,
+                last_checked=CURRENT_TIMESTAMP,
+                fingerprint=excluded.fingerprint
+                ''', fingerprints.items())
+            return True
             
         except sqlite3.Error as e:
-            logger.error(f"Error getting all faculty: {e}")
+            logger.error(f"Error saving profile fingerprints: {e}")
+            return False
+    
+    def _enqueue_enrichment(self, cursor, faculty_ids):
+        """(Re)queue faculty for publication enrichment inside the caller's transaction.
+        
+        Items already being worked on are left alone.
+        """
+        cursor.executemany('''
+        INSERT INTO enrichment_queue (faculty_id) VALUES (?)
+        ON CONFLICT(faculty_id) DO UPDATE SET
+        status='pending',
+        attempts=0,
+        next_attempt_at=CURRENT_TIMESTAMP,
+        last_error=NULL,
+        enqueued_at=CURRENT_TIMESTAMP,
+        updated_at=CURRENT_TIMESTAMP
+        WHERE status != 'running'
+        ''', ((faculty_id,) for faculty_id in faculty_ids))
+    
+    def enqueue_enrichment(self, faculty_ids):
+        """Queue faculty for publication enrichment"""
+        try:
+            with self.pool.writer() as conn:
+                self._enqueue_enrichment(conn.cursor(), faculty_ids)
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error queueing faculty for enrichment: {e}")
+            return False
+    
+    def claim_enrichment(self, limit, lease=ENRICHMENT_LEASE):
+        """Claim up to ``limit`` queue items that are due, oldest first.
+        
+        Claimed items are marked running for ``lease`` seconds; an item whose
+        worker died is claimed again once its lease expires. Returns a list of
+        {'faculty_id', 'name', 'attempts'} dicts.
+        """
+        try:
+            with self.pool.writer() as conn:
+                rows = conn.execute('''
+                UPDATE enrichment_queue SET
+                status='running',
+                attempts=attempts + 1,
+                next_attempt_at=datetime('now', ?),
+                updated_at=CURRENT_TIMESTAMP
+                WHERE faculty_id IN (
+                    SELECT faculty_id FROM enrichment_queue
+                    WHERE status IN ('pending', 'running') AND next_attempt_at <= CURRENT_TIMESTAMP
+                    ORDER BY next_attempt_at
+                    LIMIT ?
+                )
+                RETURNING faculty_id, attempts, (SELECT name FROM faculty WHERE id = faculty_id)
+                ''', (f"+{int(lease)} seconds", limit)).fetchall()
+            return [{'faculty_id': faculty_id, 'name': name, 'attempts': attempts}
+                    for faculty_id, attempts, name in rows]
+                    
+        except sqlite3.Error as e:
+            logger.error(f"Error claiming enrichment work: {e}")
             return []
     
-    def update_faculty(self, faculty_id, updates):
-        """Update faculty record with new information"""
+    def complete_enrichment(self, faculty_id, publications, source_name="google_scholar"):
+        """Store a claimed item's publications and mark it done, in one transaction"""
         try:
-            # Handle basic fields
-            update_fields = []
-            update_values = []
+            with self.pool.writer() as conn:
+                conn.executemany('''
+                INSERT OR IGNORE INTO publications (faculty_id, title, source)
+                VALUES (?, ?, ?)
+                ''', ((faculty_id, pub, source_name) for pub in publications if pub))
+                conn.execute('''
+                UPDATE enrichment_queue SET status='done', last_error=NULL, updated_at=CURRENT_TIMESTAMP
+                WHERE faculty_id = ?
+                ''', (faculty_id,))
+            return True
             
-            for field in ['name', 'email', 'department', 'school', 'research_interests', 
-                          'lab_affiliation', 'personal_website', 'profile_url', 'confidence_score']:
-                if field in updates:
-                    update_fields.append(f"{field} = ?")
-                    update_values.append(updates[field])
+        except sqlite3.Error as e:
+            logger.error(f"Error storing publications for faculty ID {faculty_id}: {e}")
+            return False
+    
+    def fail_enrichment(self, faculty_id, error, max_attempts=ENRICHMENT_MAX_ATTEMPTS,
+                        retry_delay=ENRICHMENT_RETRY_DELAY):
+        """Record a failed attempt: retry with exponential backoff, or mark failed after ``max_attempts``.
+        
+        Returns the item's new status ('pending' or 'failed'), or None on error.
+        """
+        try:
+            with self.pool.writer() as conn:
+                row = conn.execute('''
+                UPDATE enrichment_queue SET
+                status=CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                next_attempt_at=datetime('now', printf('+%d seconds', MIN(? << (attempts - 1), ?))),
+                last_error=?,
+                updated_at=CURRENT_TIMESTAMP
+                WHERE faculty_id = ?
+                RETURNING status
+                ''', (max_attempts, int(retry_delay), ENRICHMENT_MAX_RETRY_DELAY, str(error)[:500], faculty_id)).fetchone()
+            return row[0] if row else None
             
-            if update_fields:
-                # Add faculty_id to values
-                update_values.append(faculty_id)
+        except sqlite3.Error as e:
+            logger.error(f"Error recording enrichment failure for faculty ID {faculty_id}: {e}")
+            return None
+    
+    def get_enrichment_status(self):
+        """Number of enrichment queue items in each status"""
+        try:
+            with self.pool.reader() as conn:
+                return dict(conn.execute(
+                    'SELECT status, COUNT(*) FROM enrichment_queue GROUP BY status'
+                ).fetchall())
                 
-                # Construct and execute update query
-                update_query = f"UPDATE faculty SET {', '.join(update_fields)}, last_updated = CURRENT_TIMESTAMP WHERE id = ?"
-                self.cursor.execute(update_query, update_values)
-            
-            # Handle new publications if any
-            if 'new_publications' in updates and updates['new_publications']:
-                for pub in updates['new_publications']:
-                    self.cursor.execute('''
-                    INSERT OR IGNORE INTO publications (faculty_id, title, source)
-                    VALUES (?, ?, ?)
-                    ''', (faculty_id, pub, 'verification'))
-            
-            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error getting enrichment queue status: {e}")
+            return {}
+    
+    def log_verification(self, faculty_id, outcomes, retry_delay=VERIFICATION_RETRY_DELAY):
+        """Record a verification run's (source, status, confidence, elapsed) outcomes.
+        
+        Each source's scheduling state is updated in the same transaction: an
+        'ok' outcome clears its backoff, a 'throttled' one leaves it as it was,
+        anything else backs it off for ``retry_delay`` seconds, doubled per
+        consecutive failure.
+        """
+        # Throttled probes never reached the source, so they say nothing about it
+        scheduled = [outcome for outcome in outcomes if outcome[1] != 'throttled']
+        try:
+            with self.pool.writer() as conn:
+                conn.executemany('''
+                INSERT INTO verification_log (faculty_id, source, status, confidence, elapsed)
+                VALUES (?, ?, ?, ?, ?)
+                ''', ((faculty_id, *outcome) for outcome in outcomes))
+                conn.executemany('''
+                INSERT OR IGNORE INTO verification_sources (faculty_id, source, last_status) VALUES (?, ?, ?)
+                ''', ((faculty_id, source, status) for source, status, _, _ in scheduled))
+                # Every expression sees the row as it was, so the delay uses the previous failure count
+                conn.executemany('''
+                UPDATE verification_sources SET
+                last_status=:status,
+                last_confidence=CASE WHEN :status = 'ok' THEN :confidence ELSE last_confidence END,
+                failures=CASE WHEN :status = 'ok' THEN 0 ELSE failures + 1 END,
+                retry_after=CASE WHEN :status = 'ok' THEN NULL
+                    ELSE datetime('now', printf('+%d seconds', MIN(:delay << failures, :max_delay))) END,
+                verified_at=CURRENT_TIMESTAMP
+                WHERE faculty_id = :faculty_id AND source = :source
+                ''', ({'faculty_id': faculty_id, 'source': source, 'status': status, 'confidence': confidence,
+                       'delay': int(retry_delay), 'max_delay': VERIFICATION_MAX_RETRY_DELAY}
+                      for source, status, confidence, _ in scheduled))
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error logging verification for faculty ID {faculty_id}: {e}")
+            return False
+    
+    def get_verification_log(self, faculty_id, limit=20):
+        """A faculty member's most recent per-source verification outcomes, newest first"""
+        try:
+            with self.pool.reader() as conn:
+                rows = conn.execute('''
+                SELECT source, status, confidence, elapsed, verified_at FROM verification_log
+                WHERE faculty_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+                ''', (faculty_id, limit)).fetchall()
+            return [{'source': source, 'status': status, 'confidence': confidence, 'elapsed': elapsed,
+                     'verified_at': verified_at} for source, status, confidence, elapsed, verified_at in rows]
+                     
+        except sqlite3.Error as e:
+            logger.error(f"Error getting verification log for faculty ID {faculty_id}: {e}")
+            return []
+    
+    def get_verification_candidates(self, sources, min_confidence=0.0, limit=None,
+                                    min_interval=VERIFICATION_MIN_INTERVAL):
+        """Faculty due for verification, highest priority (VERIFICATION_PRIORITY_SQL) first.
+        
+        Faculty verified in the last ``min_interval`` seconds aren't due, nor
+        are those with every one of the ``sources`` (the number of sources
+        verification probes) backed off after failures. Returns a list of
+        {'id', 'name', 'priority'} dicts.
+        """
+        try:
+            with self.pool.reader() as conn:
+                rows = conn.execute(f'''
+                SELECT f.id, f.name, {VERIFICATION_PRIORITY_SQL} AS priority
+                FROM faculty f
+                LEFT JOIN (
+                    SELECT faculty_id, MAX(verified_at) AS verified_at, COUNT(*) AS sources,
+                           SUM(last_status != 'ok') AS failing, SUM(retry_after > CURRENT_TIMESTAMP) AS backed_off
+                    FROM verification_sources GROUP BY faculty_id
+                ) v ON v.faculty_id = f.id
+                WHERE f.confidence_score >= ?
+                AND (v.verified_at IS NULL OR v.verified_at < datetime('now', ?))
+                AND COALESCE(v.backed_off, 0) < ?
+                ORDER BY priority DESC, f.id
+                LIMIT ?
+                ''', (min_confidence, f"-{int(min_interval)} seconds", sources,
+                      -1 if limit is None else limit)).fetchall()
+            return [{'id': faculty_id, 'name': name, 'priority': priority} for faculty_id, name, priority in rows]
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error getting verification candidates: {e}")
+            return []
+    
+    def get_backed_off_sources(self, faculty_id):
+        """Sources not to probe for a faculty member yet, as {source: confidence from its last 'ok' outcome}"""
+        try:
+            with self.pool.reader() as conn:
+                return dict(conn.execute('''
+                SELECT source, last_confidence FROM verification_sources
+                WHERE faculty_id = ? AND retry_after > CURRENT_TIMESTAMP
+                ''', (faculty_id,)).fetchall())
+                
+        except sqlite3.Error as e:
+            logger.error(f"Error getting backed-off sources for faculty ID {faculty_id}: {e}")
+            return {}
+    
+    def get_email_discovery_candidates(self, limit=None, retry_days=EMAIL_DISCOVERY_RETRY_DAYS):
+        """Faculty without a gatech.edu email whose email discovery isn't finished, least recently tried first.
+        
+        Those found to have no Scholar profile, or whose recent publications
+        were all tried, come back after ``retry_days``. Returns a list of
+        {'id', 'name', 'department', 'publications_tried', 'requests'} dicts.
+        """
+        try:
+            with self.pool.reader() as conn:
+                rows = conn.execute('''
+                SELECT f.id, f.name, f.department, COALESCE(d.publications_tried, 0), COALESCE(d.requests, 0)
+                FROM faculty f
+                LEFT JOIN email_discovery d ON d.faculty_id = f.id
+                WHERE (f.email IS NULL OR f.email NOT LIKE '%gatech.edu%')
+                AND (d.status IS NULL OR d.status = 'pending'
+                     OR (d.status IN ('exhausted', 'no_profile') AND d.last_attempt_at < datetime('now', ?)))
+                ORDER BY d.last_attempt_at, f.id
+                LIMIT ?
+                ''', (f"-{int(retry_days)} days", -1 if limit is None else limit)).fetchall()
+            return [{'id': faculty_id, 'name': name, 'department': department, 'publications_tried': tried,
+                     'requests': requests} for faculty_id, name, department, tried, requests in rows]
+                     
+        except sqlite3.Error as e:
+            logger.error(f"Error getting email discovery candidates: {e}")
+            return []
+    
+    def record_email_discovery(self, faculty_id, status, publications_tried, requests, email=None, error=None):
+        """Record an email discovery attempt; a found email is stored on the faculty record in the same transaction"""
+        try:
+            with self.pool.writer() as conn:
+                conn.execute('''
+                INSERT INTO email_discovery (faculty_id, status, publications_tried, requests, email, last_error)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(faculty_id) DO UPDATE SET
+                status=excluded.status,
+                publications_tried=excluded.publications_tried,
+                requests=requests + excluded.requests,
+                email=excluded.email,
+                last_error=excluded.last_error,
+                last_attempt_at=CURRENT_TIMESTAMP
+                ''', (faculty_id, status, publications_tried, requests, email, error and str(error)[:500]))
+                if email:
+                    conn.execute('''
+                    UPDATE faculty SET email = ?, last_updated = CURRENT_TIMESTAMP WHERE id = ?
+                    ''', (email, faculty_id))
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error recording email discovery for faculty ID {faculty_id}: {e}")
+            return False
+    
+    def get_email_discovery_status(self):
+        """Number of faculty in each email discovery status"""
+        try:
+            with self.pool.reader() as conn:
+                return dict(conn.execute(
+                    'SELECT status, COUNT(*) FROM email_discovery GROUP BY status'
+                ).fetchall())
+                
+        except sqlite3.Error as e:
+            logger.error(f"Error getting email discovery status: {e}")
+            return {}
+    
+    def update_faculty(self, faculty_id, updates):
+        """Update faculty record with new information"""
+        try:
+            with self.pool.writer() as conn:
+                # Handle basic fields
+                update_fields = []
+                update_values = []
+                
+                for field in ['name', 'email', 'department', 'school', 'research_interests', 
+                              'lab_affiliation', 'personal_website', 'profile_url', 'confidence_score']:
+                    if field in updates:
+                        update_fields.append(f"{field} = ?")
+                        update_values.append(updates[field])
+                
+                if update_fields:
+                    # Add faculty_id to values
+                    update_values.append(faculty_id)
+                    
+                    # Construct and execute update query
+                    update_query = f"UPDATE faculty SET {', '.join(update_fields)}, last_updated = CURRENT_TIMESTAMP WHERE id = ?"
+                    conn.execute(update_query, update_values)
+                
+                # Handle new publications if any
+                if 'new_publications' in updates and updates['new_publications']:
+                    for pub in updates['new_publications']:
+                        conn.execute('''
+                        INSERT OR IGNORE INTO publications (faculty_id, title, source)
+                        VALUES (?, ?, ?)
+                        ''', (faculty_id, pub, 'verification'))
+            
             logger.info(f"Updated faculty ID {faculty_id}")
             return True
             
         except sqlite3.Error as e:
             logger.error(f"Error updating faculty ID {faculty_id}: {e}")
-            self.conn.rollback()
             return False
     
+    def _with_publications(self, cursor, faculty_rows):
+        """Build faculty records for a bounded list of rows with one publications query"""
+        cursor.execute('''
+        SELECT faculty_id, title FROM publications
+        WHERE faculty_id IN (SELECT value FROM json_each(?))
+        ORDER BY faculty_id, title
+        ''', (json.dumps([row[0] for row in faculty_rows]),))
+        publications = group_publications(cursor)
+        return [row_to_faculty(row, publications.get(row[0], [])) for row in faculty_rows]
+    
+    def count_faculty(self, min_confidence=0.0):
+        """Number of faculty with confidence score above threshold"""
+        try:
+            with self.pool.reader() as conn:
+                return conn.execute(
+                    'SELECT COUNT(*) FROM faculty WHERE confidence_score >= ?', (min_confidence,)
+                ).fetchone()[0]
+                
+        except sqlite3.Error as e:
+            logger.error(f"Error counting faculty: {e}")
+            return 0
+    
+    def get_faculty_page(self, cursor=None, limit=FACULTY_PAGE_SIZE, min_confidence=0.0, department=None):
+        """One page of faculty ordered by confidence score (highest first), then id.
+        
+        ``cursor`` is the ``next_cursor`` returned with the previous page (None
+        for the first page). Pages are located with a keyset condition on
+        (confidence_score, id) rather than OFFSET, so each page costs the same
+        however deep it is, and rows added or removed meanwhile never shift
+        later pages. ``limit`` is capped at FACULTY_PAGE_MAX. ``department``
+        keeps faculty whose department or school contains that keyword. Returns (faculty_list, next_cursor); next_cursor
+        is None on the last page. Raises ValueError for a malformed cursor.
+        """
+        limit = max(1, min(limit, FACULTY_PAGE_MAX))
+        conditions = ['confidence_score >= ?']
+        params = [min_confidence]
+        if cursor is not None:
+            conditions.append('(confidence_score, id) < (?, ?)')
+            params.extend(decode_page_cursor(cursor))
+        if department:
+            conditions.append(DEPARTMENT_MATCH_CONDITION)
+            params.extend([f"%{department}%"] * 2)
+        
+        try:
+            with self.pool.reader() as conn:
+                db_cursor = conn.cursor()
+                db_cursor.execute(f'''
+                {FACULTY_SELECT} WHERE {' AND '.join(conditions)}
+                ORDER BY confidence_score DESC, id DESC LIMIT ?
+                ''', (*params, limit + 1))
+                faculty_rows = db_cursor.fetchall()
+                has_more = len(faculty_rows) > limit
+                faculty_rows = faculty_rows[:limit]
+                faculty_list = self._with_publications(db_cursor, faculty_rows) if faculty_rows else []
+            
+            next_cursor = None
+            if has_more:
+                last = faculty_list[-1]
+                next_cursor = encode_page_cursor(last['confidence_score'], last['id'])
+            return faculty_list, next_cursor
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error getting faculty page: {e}")
+            return [], None
+    
+    def iter_faculty(self, min_confidence=0.0, order_by_confidence=False, chunk_size=500):
+        """Stream faculty records (with publications) without loading the whole table.
+        
+        Rows are stepped through a dedicated cursor in chunks of ``chunk_size``,
+        and each chunk costs one extra query for its publications.
+        """
+        order_by = "ORDER BY confidence_score DESC" if order_by_confidence else "ORDER BY id"
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            publications_cursor = conn.cursor()
+            try:
+                cursor.execute(f"{FACULTY_SELECT} WHERE confidence_score >= ? {order_by}", (min_confidence,))
+                while True:
+                    faculty_rows = cursor.fetchmany(chunk_size)
+                    if not faculty_rows:
+                        break
+                    
+                    yield from self._with_publications(publications_cursor, faculty_rows)
+            finally:
+                cursor.close()
+                publications_cursor.close()
+    
+    def _import_records(self, records, source_file):
+        """Bulk-import parsed faculty records, skipping non-faculty entries"""
+        faculty_count = self.add_faculty_many(
+            (faculty for faculty in records if is_faculty_record(faculty)),
+            source_name="json_import"
+        )
+        logger.info(f"Imported {faculty_count} faculty members from {source_file}")
+        return True
+    
     def import_from_json(self, json_file):
-        """Import faculty data from a JSON file"""
+        """Import faculty data from a JSON file (a .gz suffix is read as gzip)"""
         try:
             if not os.path.exists(json_file):
                 logger.error(f"JSON file not found: {json_file}")
                 return False
                 
-            with open(json_file, 'r', encoding='utf-8') as f:
-                faculty_data = json.load(f)
-            
-            # Filter out non-faculty entries
-            non_faculty_names = set([
-                'home', 'directory', 'visitor parking information', 'main directory', 'day', 'welcome',
-                'undergraduate handbook', 'professional education', 'financial aid', 'faculty', 'staff', 
-                'office', 'about', 'contact', 'events', 'graduate handbook', 'student', 'advising', 
-                'administration', 'resources', 'faq', 'news', 'alumni', 'forms', 'information', 'handbook', 'overview'
-            ])
-            
-            faculty_count = 0
-            for faculty in faculty_data:
-                name = faculty.get('name', '').lower()
-                if name and name not in non_faculty_names:
-                    self.add_faculty(faculty, source_name="json_import")
-                    faculty_count += 1
-            
-            logger.info(f"Imported {faculty_count} faculty members from {json_file}")
-            return True
+            # Parse the array incrementally instead of json.load-ing the whole file
+            with open_data_file(json_file, 'r') as f:
+                return self._import_records(iter_json_array(f), json_file)
             
         except Exception as e:
             logger.error(f"Error importing from JSON: {e}")
             return False
     
-    def export_to_json(self, json_file):
-        """Export faculty data to a JSON file"""
+    def import_from_jsonl(self, jsonl_file):
+        """Import faculty data from a JSON Lines file, one record per line (.gz is read as gzip)"""
         try:
-            self.cursor.execute('''
-            SELECT id, name, email, department, school, research_interests, 
-                   lab_affiliation, personal_website, profile_url
-            FROM faculty
-            ''')
+            if not os.path.exists(jsonl_file):
+                logger.error(f"JSON Lines file not found: {jsonl_file}")
+                return False
             
-            faculty_rows = self.cursor.fetchall()
-            faculty_list = []
+            with open_data_file(jsonl_file, 'r') as f:
+                return self._import_records(iter_json_lines(f), jsonl_file)
             
-            for row in faculty_rows:
-                faculty_id = row[0]
-                
-                # Get publications for this faculty
-                self.cursor.execute('SELECT title FROM publications WHERE faculty_id = ?', (faculty_id,))
-                publications = [pub[0] for pub in self.cursor.fetchall()]
-                
-                faculty = {
-                    'name': row[1],
-                    'email': row[2],
-                    'department': row[3],
-                    'school': row[4],
-                    'research_interests': row[5],
-                    'lab_affiliation': row[6],
-                    'personal_website': row[7],
-                    'profile_url': row[8],
-                    'publications': publications
-                }
-                faculty_list.append(faculty)
-            
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(faculty_list, indent=2, ensure_ascii=False, fp=f)
-            
-            logger.info(f"Exported {len(faculty_list)} faculty members to {json_file}")
+        except Exception as e:
+            logger.error(f"Error importing from JSON Lines: {e}")
+            return False
+    
+    def export_to_json(self, json_file, min_confidence=0.0):
+        """Export faculty data to a JSON file (a .gz suffix writes gzip)"""
+        try:
+            with open_data_file(json_file, 'w') as f:
+                count = write_json_array(f, (to_export_record(faculty) for faculty in self.iter_faculty(min_confidence)))
+            
+            logger.info(f"Exported {count} faculty members to {json_file}")
             return True
             
         except Exception as e:
             logger.error(f"Error exporting to JSON: {e}")
             return False
     
-    def update_confidence_scores(self):
-        """Update confidence scores based on data completeness"""
-        try:
-            self.cursor.execute('''
-            UPDATE faculty
-            SET confidence_score = (
-                CASE 
-                    WHEN email IS NOT NULL THEN 0.2 ELSE 0 
-                END +
-                CASE 
-                    WHEN personal_website IS NOT NULL AND personal_website != 'N/A' THEN 0.2 ELSE 0 
-                END +
-                CASE 
-                    WHEN profile_url IS NOT NULL AND profile_url != 'N/A' THEN 0.2 ELSE 0 
-                END +
-                CASE 
-                    WHEN research_interests IS NOT NULL AND research_interests != 'N/A' THEN 0.2 ELSE 0 
-                END +
-                CASE 
-                    WHEN EXISTS (SELECT 1 FROM publications WHERE publications.faculty_id = faculty.id LIMIT 1) THEN 0.2 ELSE 0 
-                END
-            )
-            ''')
+    def export_to_jsonl(self, jsonl_file, min_confidence=0.0):
+        """Export faculty data as JSON Lines, one record per line (a .gz suffix writes gzip)"""
+        try:
+            with open_data_file(jsonl_file, 'w') as f:
+                count = write_json_lines(f, (to_export_record(faculty) for faculty in self.iter_faculty(min_confidence)))
+            
+            logger.info(f"Exported {count} faculty members to {jsonl_file}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error exporting to JSON Lines: {e}")
+            return False
+    
+    def update_confidence_scores(self, full=False):
+        """Update confidence scores based on data completeness.
+        
+        Only faculty queued in confidence_dirty (by triggers, whenever a scored
+        field or their publications change) are rescored. ``full`` rescores
+        every row, as a maintenance operation.
+        """
+        try:
+            with self.pool.writer() as conn:
+                if full:
+                    cursor = conn.execute(f"UPDATE faculty SET confidence_score = {CONFIDENCE_SCORE_SQL}")
+                else:
+                    cursor = conn.execute(f'''
+                    UPDATE faculty SET confidence_score = {CONFIDENCE_SCORE_SQL}
+                    WHERE id IN (SELECT faculty_id FROM confidence_dirty)
+                    ''')
+                updated = cursor.rowcount
+                conn.execute('DELETE FROM confidence_dirty')
             
-            self.conn.commit()
-            logger.info("Updated confidence scores for all faculty")
+            logger.info(f"Updated confidence scores for {updated} {'faculty (full recompute)' if full else 'changed faculty'}")
             return True
             
         except sqlite3.Error as e:
             logger.error(f"Error updating confidence scores: {e}")
-            self.conn.rollback()
             return False
 
 # Example usage
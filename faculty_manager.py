@@ -1,9 +1,15 @@
 import os
-import json
 import logging
 import argparse
-from faculty_db import FacultyDatabase
-from faculty_verifier import FacultyVerifier
+from itertools import chain
+from faculty_db import (
+    PROVENANCE_RETENTION_DAYS, FacultyDatabase, detect_format, open_data_file, to_export_record,
+    write_json_array, write_json_lines
+)
+from crawl_frontier import CrawlFrontier
+from email_discovery import EmailDiscoverer
+from enrichment import PublicationEnricher
+from faculty_verifier import VERIFICATION_WORKERS, FacultyVerifier
 from ga_tech_scraper import scrape_ga_tech_faculty, validate_url
 
 # Set up logging
@@ -28,14 +34,18 @@ class FacultyManager:
         self.db.close()
         self.verifier.close()
     
-    def initialize_from_json(self, json_file="ga_tech_faculty.json"):
-        """Initialize the database from an existing JSON file"""
+    def initialize_from_json(self, json_file="ga_tech_faculty.json", input_format=None):
+        """Initialize the database from an existing JSON or JSON Lines file"""
         if not os.path.exists(json_file):
             logger.error(f"JSON file not found: {json_file}")
             return False
         
-        logger.info(f"Initializing database from {json_file}")
-        success = self.db.import_from_json(json_file)
+        input_format = input_format or detect_format(json_file)
+        logger.info(f"Initializing database from {json_file} ({input_format})")
+        if input_format == 'jsonl':
+            success = self.db.import_from_jsonl(json_file)
+        else:
+            success = self.db.import_from_json(json_file)
         
         if success:
             # Update confidence scores
@@ -44,24 +54,50 @@ class FacultyManager:
         
         return success
     
-    def scrape_and_update(self):
-        """Scrape faculty data and update the database"""
+    def scrape_and_update(self, incremental=True):
+        """Scrape faculty data and update the database.
+        
+        With ``incremental`` (the default) profiles whose content fingerprint
+        matches the previous crawl are skipped: no extraction, Google Scholar
+        lookup or database write. Without it every profile is re-extracted, in a
+        fresh crawl rather than resuming an unfinished incremental one.
+        
+        Extracted profiles are written in batches while the crawl runs, so an
+        interrupted scrape keeps every batch it finished.
+        """
         try:
             logger.info("Starting faculty scraping")
-            faculty_list = scrape_ga_tech_faculty()
+            fingerprints = self.db.get_profile_fingerprints() if incremental else {}
+            unchanged = []
+            
+            def store(batch):
+                # Add the faculty members in one transaction, queueing each one for publication
+                # enrichment; fingerprints are saved only once the data they describe is stored
+                self.db.add_faculty_many(batch, source_name="scraper", enrich=True)
+                self.db.update_confidence_scores()
+                self.db.save_profile_fingerprints({faculty['profile_url']: faculty['profile_fingerprint']
+                                                   for faculty in batch})
             
-            if not faculty_list:
+            # Publications are filled in by the enrichment stage (enrich_publications), not during the crawl
+            # The crawl frontier checkpoints every profile, so an interrupted scrape resumes
+            frontier = CrawlFrontier()
+            try:
+                # A full re-crawl starts afresh rather than reuse an unfinished crawl's unchanged profiles
+                faculty_list = scrape_ga_tech_faculty(fingerprints=fingerprints, unchanged=unchanged,
+                                                      enrich_publications=False, frontier=frontier,
+                                                      resume=incremental, store=store)
+            finally:
+                frontier.close()
+            
+            if not faculty_list and not unchanged:
                 logger.error("No faculty data scraped")
                 return False
             
-            logger.info(f"Scraped {len(faculty_list)} faculty members")
-            
-            # Add each faculty member to the database
-            for faculty in faculty_list:
-                self.db.add_faculty(faculty, source_name="scraper")
+            logger.info(f"Scraped {len(faculty_list)} new or changed faculty members, "
+                        f"skipped {len(unchanged)} unchanged profiles")
             
-            # Update confidence scores
-            self.db.update_confidence_scores()
+            # New and changed profiles were stored by the crawl; mark the unchanged ones as checked
+            self.db.save_profile_fingerprints({url: fingerprints[url] for url in unchanged if url in fingerprints})
             
             logger.info("Faculty data updated successfully")
             return True
@@ -70,11 +106,27 @@ class FacultyManager:
             logger.error(f"Error in scrape_and_update: {e}")
             return False
     
-    def verify_faculty_data(self, min_confidence=0.3, max_faculty=None):
-        """Verify faculty data using multiple sources"""
+    def enrich_publications(self, max_items=None):
+        """Fill in publications for faculty queued by scraping, from Google Scholar"""
+        try:
+            logger.info("Starting publication enrichment")
+            counts = PublicationEnricher(self.db).run(max_items)
+            if counts['done'] or counts['pending'] or counts['failed']:
+                # Update confidence scores for the faculty that gained publications
+                self.db.update_confidence_scores()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error in enrich_publications: {e}")
+            return False
+    
+    def verify_faculty_data(self, min_confidence=0.3, max_faculty=None, workers=VERIFICATION_WORKERS,
+                            time_budget=None, request_budget=None):
+        """Verify the faculty most in need of it using multiple sources, ``workers`` at a time, within the budgets"""
         try:
             logger.info("Starting faculty verification")
-            success = self.verifier.verify_all_faculty(min_confidence, max_faculty)
+            success = self.verifier.verify_all_faculty(min_confidence, max_faculty, workers=workers,
+                                                       time_budget=time_budget, request_budget=request_budget)
             
             if success:
                 # Update confidence scores after verification
@@ -87,59 +139,73 @@ class FacultyManager:
             logger.error(f"Error in verify_faculty_data: {e}")
             return False
     
-    def export_to_json(self, json_file="verified_faculty.json", min_confidence=0.0):
-        """Export faculty data to a JSON file with minimum confidence threshold"""
+    def discover_emails(self, max_faculty=None):
+        """Look for missing gatech.edu emails in recent Google Scholar publications, a few per faculty member"""
         try:
-            logger.info(f"Exporting faculty data to {json_file}")
+            logger.info("Starting email discovery")
+            counts = EmailDiscoverer(self.db).run(max_faculty)
+            if counts['found']:
+                self.db.update_confidence_scores()
+            return True
             
-            # Get all faculty with confidence score above threshold
-            faculty_list = self.db.get_all_faculty(min_confidence)
+        except Exception as e:
+            logger.error(f"Error in discover_emails: {e}")
+            return False
+    
+    def recompute_confidence_scores(self):
+        """Rescore every faculty member (routine updates only rescore changed rows)"""
+        logger.info("Recomputing confidence scores for all faculty")
+        return self.db.update_confidence_scores(full=True)
+    
+    def compact_provenance(self, retention_days=PROVENANCE_RETENTION_DAYS, vacuum=False):
+        """Trim superseded data_sources history older than retention_days"""
+        logger.info(f"Compacting provenance history (retention {retention_days} days)")
+        removed = self.db.compact_provenance(retention_days, vacuum=vacuum)
+        return removed is not None
+    
+    def export_to_json(self, json_file="verified_faculty.json", min_confidence=0.0, output_format=None):
+        """Export faculty data to a JSON or JSON Lines file with minimum confidence threshold"""
+        try:
+            output_format = output_format or detect_format(json_file)
+            logger.info(f"Exporting faculty data to {json_file} ({output_format})")
             
-            if not faculty_list:
+            # Stream faculty with confidence score above threshold, highest first
+            faculty_records = self.db.iter_faculty(min_confidence, order_by_confidence=True)
+            first = next(faculty_records, None)
+            if first is None:
                 logger.warning("No faculty data to export")
                 return False
             
-            # Prepare data for export
-            export_data = []
-            for faculty in faculty_list:
-                # Validate URLs before export
-                profile_url = faculty.get('profile_url')
-                if profile_url and profile_url != 'N/A':
-                    if not validate_url(profile_url):
-                        faculty['profile_url'] = 'N/A'
-                
-                personal_website = faculty.get('personal_website')
-                if personal_website and personal_website != 'N/A':
-                    if not validate_url(personal_website):
-                        faculty['personal_website'] = 'N/A'
-                
-                # Remove database-specific fields
-                export_faculty = {
-                    'name': faculty.get('name'),
-                    'email': faculty.get('email'),
-                    'department': faculty.get('department'),
-                    'school': faculty.get('school'),
-                    'research_interests': faculty.get('research_interests'),
-                    'lab_affiliation': faculty.get('lab_affiliation'),
-                    'personal_website': faculty.get('personal_website'),
-                    'profile_url': faculty.get('profile_url'),
-                    'publications': faculty.get('publications', [])
-                }
-                export_data.append(export_faculty)
-            
-            # Write to JSON file
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, indent=2, ensure_ascii=False, fp=f)
-            
-            logger.info(f"Exported {len(export_data)} faculty members to {json_file}")
+            # Write to the output file one record at a time
+            write_records = write_json_lines if output_format == 'jsonl' else write_json_array
+            with open_data_file(json_file, 'w') as f:
+                count = write_records(f, (self._prepare_export(faculty) for faculty in chain([first], faculty_records)))
+            
+            logger.info(f"Exported {count} faculty members to {json_file}")
             return True
             
         except Exception as e:
             logger.error(f"Error in export_to_json: {e}")
             return False
     
+    def _prepare_export(self, faculty):
+        """Validate URLs and drop database-specific fields from a faculty record"""
+        # Validate URLs before export
+        profile_url = faculty.get('profile_url')
+        if profile_url and profile_url != 'N/A':
+            if not validate_url(profile_url):
+                faculty['profile_url'] = 'N/A'
+        
+        personal_website = faculty.get('personal_website')
+        if personal_website and personal_website != 'N/A':
+            if not validate_url(personal_website):
+                faculty['personal_website'] = 'N/A'
+        
+        # Remove database-specific fields
+        return to_export_record(faculty)
+    
     def run_full_pipeline(self, json_output="verified_faculty.json"):
-        """Run the full faculty data pipeline: scrape, verify, and export"""
+        """Run the full faculty data pipeline: scrape, enrich, verify, discover emails, and export"""
         try:
             logger.info("Starting full faculty data pipeline")
             
@@ -148,12 +214,20 @@ class FacultyManager:
             if not scrape_success:
                 logger.warning("Scraping failed, trying to use existing data")
             
-            # Step 2: Verify faculty data (limit to 50 for demo purposes)
+            # Step 2: Fill in publications for the faculty scraping queued
+            if not self.enrich_publications():
+                logger.warning("Publication enrichment encountered issues")
+            
+            # Step 3: Verify faculty data (limit to 50 for demo purposes)
             verify_success = self.verify_faculty_data(min_confidence=0.3, max_faculty=50)
             if not verify_success:
                 logger.warning("Verification process encountered issues")
             
-            # Step 3: Export verified data
+            # Step 4: Spend the remaining Scholar allowance on missing emails
+            if not self.discover_emails(max_faculty=50):
+                logger.warning("Email discovery encountered issues")
+            
+            # Step 5: Export verified data
             export_success = self.export_to_json(json_file=json_output, min_confidence=0.4)
             
             if export_success:
@@ -172,13 +246,38 @@ def main():
     parser = argparse.ArgumentParser(description="Faculty data management tool")
     parser.add_argument('--init', action='store_true', help='Initialize database from existing JSON')
     parser.add_argument('--scrape', action='store_true', help='Scrape and update faculty data')
+    parser.add_argument('--rescrape-all', action='store_true',
+                        help='With --scrape, re-extract every profile even if unchanged since the last crawl '
+                             '(never resumes an unfinished incremental crawl)')
+    parser.add_argument('--enrich', action='store_true',
+                        help='Fill in publications for faculty queued by scraping (Google Scholar)')
     parser.add_argument('--verify', action='store_true', help='Verify faculty data')
+    parser.add_argument('--discover-emails', action='store_true',
+                        help='Look for missing emails in recent Google Scholar publications (a few lookups per faculty per run)')
     parser.add_argument('--export', action='store_true', help='Export faculty data to JSON')
+    parser.add_argument('--recompute-confidence', action='store_true',
+                        help='Recompute confidence scores for every faculty member')
+    parser.add_argument('--compact-provenance', action='store_true',
+                        help='Remove superseded data source history older than --retention-days')
     parser.add_argument('--full', action='store_true', help='Run full pipeline')
     parser.add_argument('--input', type=str, default='ga_tech_faculty.json', help='Input JSON file')
     parser.add_argument('--output', type=str, default='verified_faculty.json', help='Output JSON file')
+    parser.add_argument('--input-format', choices=['json', 'jsonl'], default=None,
+                        help='Input file format (default: from the file name, .jsonl/.ndjson for JSON Lines)')
+    parser.add_argument('--output-format', choices=['json', 'jsonl'], default=None,
+                        help='Output file format (default: from the file name, .jsonl/.ndjson for JSON Lines)')
+    parser.add_argument('--gzip', action='store_true', help='Gzip-compress the exported file')
     parser.add_argument('--confidence', type=float, default=0.4, help='Minimum confidence score')
     parser.add_argument('--max', type=int, default=None, help='Maximum number of faculty to process')
+    parser.add_argument('--workers', type=int, default=VERIFICATION_WORKERS,
+                        help='Faculty verified concurrently by --verify (each upstream host keeps its own rate limit)')
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help='Seconds after which --verify starts no more faculty (most stale and least confident go first)')
+    parser.add_argument('--request-budget', type=int, default=None,
+                        help='Requests (HTTP fetches and Scholar lookups) after which --verify starts no more faculty')
+    parser.add_argument('--retention-days', type=int, default=PROVENANCE_RETENTION_DAYS,
+                        help='Days of data source history kept by --compact-provenance')
+    parser.add_argument('--vacuum', action='store_true', help='Shrink the database file after --compact-provenance')
     
     args = parser.parse_args()
     
@@ -186,22 +285,39 @@ def main():
     
     try:
         if args.init:
-            manager.initialize_from_json(args.input)
+            manager.initialize_from_json(args.input, input_format=args.input_format)
         
         if args.scrape:
-            manager.scrape_and_update()
+            manager.scrape_and_update(incremental=not args.rescrape_all)
+        
+        if args.enrich:
+            manager.enrich_publications(max_items=args.max)
         
         if args.verify:
-            manager.verify_faculty_data(min_confidence=args.confidence, max_faculty=args.max)
+            manager.verify_faculty_data(min_confidence=args.confidence, max_faculty=args.max, workers=args.workers,
+                                        time_budget=args.time_budget, request_budget=args.request_budget)
+        
+        if args.discover_emails:
+            manager.discover_emails(max_faculty=args.max)
+        
+        if args.recompute_confidence:
+            manager.recompute_confidence_scores()
+        
+        if args.compact_provenance:
+            manager.compact_provenance(args.retention_days, vacuum=args.vacuum)
         
         if args.export:
-            manager.export_to_json(json_file=args.output, min_confidence=args.confidence)
+            output = args.output
+            if args.gzip and not output.endswith('.gz'):
+                output += '.gz'
+            manager.export_to_json(json_file=output, min_confidence=args.confidence, output_format=args.output_format)
         
         if args.full:
             manager.run_full_pipeline(json_output=args.output)
         
         # If no arguments provided, show help
-        if not (args.init or args.scrape or args.verify or args.export or args.full):
+        if not (args.init or args.scrape or args.enrich or args.verify or args.discover_emails or args.recompute_confidence
+                or args.compact_provenance or args.export or args.full):
             parser.print_help()
     
     finally:
@@ -0,0 +1,405 @@
+import logging
+
+logger = logging.getLogger("faculty_schema")
+
+# Repopulate the search indexes from the faculty and publications tables
+REBUILD_SEARCH_INDEX = (
+    'DELETE FROM faculty_fts',
+    '''
+    INSERT INTO faculty_fts (rowid, name, department, school, research_interests, publications)
+    SELECT f.id, f.name, f.department, f.school, f.research_interests,
+           (SELECT group_concat(title, ' ') FROM publications WHERE faculty_id = f.id)
+    FROM faculty f
+    ''',
+)
+REBUILD_TRIGRAM_INDEX = "INSERT INTO faculty_trigram (faculty_trigram) VALUES ('rebuild')"
+
+def _table_exists(cursor, name):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+    return cursor.fetchone() is not None
+
+def create_base_tables(cursor):
+    """Version 1: the faculty, publications and data_sources tables"""
+    # Create faculty table
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS faculty (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT,
+        department TEXT,
+        school TEXT,
+        research_interests TEXT,
+        lab_affiliation TEXT,
+        personal_website TEXT,
+        profile_url TEXT,
+        confidence_score REAL DEFAULT 0.5,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(name, department)
+    )
+    ''')
+    
+    # Create publications table with foreign key to faculty
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS publications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        faculty_id INTEGER,
+        title TEXT NOT NULL,
+        source TEXT,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id),
+        UNIQUE(faculty_id, title)
+    )
+    ''')
+    
+    # Create data_sources table to track where faculty info came from
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS data_sources (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        faculty_id INTEGER,
+        source_name TEXT NOT NULL,
+        source_url TEXT,
+        data_retrieved TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    )
+    ''')
+
+def create_search_index(cursor):
+    """Version 2: the FTS5 search index and the triggers that keep it in sync"""
+    index_exists = _table_exists(cursor, 'faculty_fts')
+    
+    # One row per faculty member (rowid = faculty.id); publication titles are concatenated
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS faculty_fts USING fts5(
+        name, department, school, research_interests, publications,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    ''')
+    
+    insert_faculty_row = '''
+        INSERT INTO faculty_fts (rowid, name, department, school, research_interests, publications)
+        VALUES (new.id, new.name, new.department, new.school, new.research_interests,
+                (SELECT group_concat(title, ' ') FROM publications WHERE faculty_id = new.id));
+    '''
+    
+    # Bulk writes set search_index_state.deferred inside their transaction and
+    # refresh the publications column once per batch instead of once per title
+    cursor.execute('CREATE TABLE IF NOT EXISTS search_index_state (deferred INTEGER NOT NULL)')
+    cursor.execute('INSERT INTO search_index_state (deferred) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM search_index_state)')
+    refresh_publications = '''
+        UPDATE faculty_fts
+        SET publications = (SELECT group_concat(title, ' ') FROM publications WHERE faculty_id = {0}.faculty_id)
+        WHERE rowid = {0}.faculty_id;
+    '''
+    
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS faculty_fts_insert AFTER INSERT ON faculty BEGIN
+        {insert_faculty_row}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS faculty_fts_update
+    AFTER UPDATE OF name, department, school, research_interests ON faculty BEGIN
+        DELETE FROM faculty_fts WHERE rowid = old.id;
+        {insert_faculty_row}
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS faculty_fts_delete AFTER DELETE ON faculty BEGIN
+        DELETE FROM faculty_fts WHERE rowid = old.id;
+    END
+    ''')
+    
+    # Databases indexed before search_index_state existed have unconditional triggers
+    for trigger in ('publications_fts_insert', 'publications_fts_update', 'publications_fts_delete'):
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    cursor.execute(f'''
+    CREATE TRIGGER publications_fts_insert AFTER INSERT ON publications
+    WHEN (SELECT deferred FROM search_index_state) = 0 BEGIN
+        {refresh_publications.format('new')}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER publications_fts_update AFTER UPDATE OF faculty_id, title ON publications
+    WHEN (SELECT deferred FROM search_index_state) = 0 BEGIN
+        {refresh_publications.format('old')}
+        {refresh_publications.format('new')}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER publications_fts_delete AFTER DELETE ON publications
+    WHEN (SELECT deferred FROM search_index_state) = 0 BEGIN
+        {refresh_publications.format('old')}
+    END
+    ''')
+    
+    if not index_exists:
+        for statement in REBUILD_SEARCH_INDEX:
+            cursor.execute(statement)
+
+def create_secondary_indexes(cursor):
+    """Version 3: indexes for confidence filtering and foreign-key lookups"""
+    # get_all_faculty/iter_faculty filter and sort on confidence_score
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_faculty_confidence ON faculty (confidence_score)')
+    # publications.faculty_id lookups use the UNIQUE(faculty_id, title) index, which also
+    # covers the grouped title reads; data_sources had nothing on its foreign key
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_data_sources_faculty ON data_sources (faculty_id)')
+
+def create_trigram_index(cursor):
+    """Version 4: trigram index so substring (LIKE '%...%') searches avoid table scans"""
+    index_exists = _table_exists(cursor, 'faculty_trigram')
+    
+    # External content table: only the trigram index is stored, rows are read from faculty
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS faculty_trigram USING fts5(
+        name, department, school,
+        content = 'faculty', content_rowid = 'id',
+        tokenize = 'trigram'
+    )
+    ''')
+    
+    insert_row = '''
+        INSERT INTO faculty_trigram (rowid, name, department, school)
+        VALUES (new.id, new.name, new.department, new.school);
+    '''
+    delete_row = '''
+        INSERT INTO faculty_trigram (faculty_trigram, rowid, name, department, school)
+        VALUES ('delete', old.id, old.name, old.department, old.school);
+    '''
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS faculty_trigram_insert AFTER INSERT ON faculty BEGIN
+        {insert_row}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS faculty_trigram_update
+    AFTER UPDATE OF name, department, school ON faculty BEGIN
+        {delete_row}
+        {insert_row}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS faculty_trigram_delete AFTER DELETE ON faculty BEGIN
+        {delete_row}
+    END
+    ''')
+    
+    if not index_exists:
+        cursor.execute(REBUILD_TRIGRAM_INDEX)
+
+def create_confidence_tracking(cursor):
+    """Version 5: queue faculty whose confidence inputs changed for incremental rescoring"""
+    cursor.execute('CREATE TABLE IF NOT EXISTS confidence_dirty (faculty_id INTEGER PRIMARY KEY)')
+    
+    # An upsert clause rather than OR IGNORE: a trigger's OR IGNORE is overridden by the
+    # conflict handling of the statement that fired it (e.g. the faculty upsert)
+    mark = 'INSERT INTO confidence_dirty (faculty_id) VALUES ({0}) ON CONFLICT DO NOTHING;'
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS confidence_faculty_insert AFTER INSERT ON faculty BEGIN
+        {mark.format('new.id')}
+    END
+    ''')
+    # confidence_score is listed so a score written directly is rescored like before;
+    # update_confidence_scores re-marks the rows it writes, then clears the whole queue
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS confidence_faculty_update
+    AFTER UPDATE OF email, personal_website, profile_url, research_interests, confidence_score ON faculty BEGIN
+        {mark.format('new.id')}
+    END
+    ''')
+    # Bulk writes (search_index_state.deferred) upsert every faculty row they add
+    # publications for, which already marks it
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS confidence_publications_insert AFTER INSERT ON publications
+    WHEN (SELECT deferred FROM search_index_state) = 0 BEGIN
+        {mark.format('new.faculty_id')}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS confidence_publications_update AFTER UPDATE OF faculty_id ON publications BEGIN
+        {mark.format('old.faculty_id')}
+        {mark.format('new.faculty_id')}
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS confidence_publications_delete AFTER DELETE ON publications BEGIN
+        {mark.format('old.faculty_id')}
+    END
+    ''')
+    
+    # Scores written before tracking existed may be stale
+    cursor.execute('INSERT OR IGNORE INTO confidence_dirty (faculty_id) SELECT id FROM faculty')
+
+def dedupe_data_sources(cursor):
+    """Version 6: one data_sources row per (faculty, source, url) observation with first/last seen and a count"""
+    cursor.execute("SELECT 1 FROM pragma_table_info('data_sources') WHERE name = 'seen_count'")
+    if cursor.fetchone() is not None:
+        return
+    
+    cursor.execute('''
+    CREATE TABLE data_sources_dedup (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        faculty_id INTEGER,
+        source_name TEXT NOT NULL,
+        source_url TEXT,
+        first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        seen_count INTEGER NOT NULL DEFAULT 1,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    )
+    ''')
+    cursor.execute('''
+    INSERT INTO data_sources_dedup (faculty_id, source_name, source_url, first_seen, last_seen, seen_count)
+    SELECT faculty_id, source_name, source_url, MIN(data_retrieved), MAX(data_retrieved), COUNT(*)
+    FROM data_sources
+    GROUP BY faculty_id, source_name, COALESCE(source_url, '')
+    ORDER BY MIN(id)
+    ''')
+    cursor.execute('DROP TABLE data_sources')
+    cursor.execute('ALTER TABLE data_sources_dedup RENAME TO data_sources')
+    # Upsert target for recording observations; its faculty_id prefix serves get_provenance
+    cursor.execute('''
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_data_sources_observation
+    ON data_sources (faculty_id, source_name, COALESCE(source_url, ''))
+    ''')
+
+def create_profile_fingerprints(cursor):
+    """Version 7: content fingerprints of crawled profile pages, for incremental re-crawls"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS profile_fingerprints (
+        profile_url TEXT PRIMARY KEY,
+        fingerprint TEXT NOT NULL,
+        last_changed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_checked TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) WITHOUT ROWID
+    ''')
+
+def create_enrichment_queue(cursor):
+    """Version 8: persistent queue of faculty awaiting publication enrichment"""
+    # next_attempt_at is when a pending item may next be tried, or when a running item's lease expires
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS enrichment_queue (
+        faculty_id INTEGER PRIMARY KEY,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_error TEXT,
+        enqueued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    )
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_enrichment_queue_ready ON enrichment_queue (status, next_attempt_at)
+    ''')
+
+def create_verification_log(cursor):
+    """Version 9: per-source outcome of every verification run"""
+    # status is 'ok', 'error' or 'deferred' (still running when its timeout or the faculty's budget ran out),
+    # or 'throttled' (still waiting on the verifier's rate limits then)
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS verification_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        faculty_id INTEGER NOT NULL,
+        source TEXT NOT NULL,
+        status TEXT NOT NULL,
+        confidence REAL,
+        elapsed REAL,
+        verified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    )
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_verification_log_faculty ON verification_log (faculty_id, verified_at)
+    ''')
+
+def create_email_discovery(cursor):
+    """Version 10: progress of email discovery from Scholar publications, per faculty member"""
+    # publications_tried counts recent publications already filled, so a later run continues after them;
+    # status is 'pending', 'found', 'exhausted' (every recent publication tried) or 'no_profile'
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS email_discovery (
+        faculty_id INTEGER PRIMARY KEY,
+        status TEXT NOT NULL,
+        publications_tried INTEGER NOT NULL DEFAULT 0,
+        requests INTEGER NOT NULL DEFAULT 0,
+        email TEXT,
+        last_error TEXT,
+        last_attempt_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    )
+    ''')
+
+def create_verification_sources(cursor):
+    """Version 11: latest verification outcome and failure backoff per faculty member and source"""
+    # failures counts consecutive error/deferred outcomes; the source isn't probed again
+    # for that faculty member before retry_after. last_confidence is from the last 'ok' outcome.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS verification_sources (
+        faculty_id INTEGER NOT NULL,
+        source TEXT NOT NULL,
+        last_status TEXT NOT NULL,
+        last_confidence REAL,
+        failures INTEGER NOT NULL DEFAULT 0,
+        retry_after TIMESTAMP,
+        verified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (faculty_id, source),
+        FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+    ) WITHOUT ROWID
+    ''')
+    # Seed from the log, so faculty verified before this version aren't treated as never verified
+    cursor.execute('''
+    INSERT OR IGNORE INTO verification_sources (faculty_id, source, last_status, last_confidence, verified_at)
+    SELECT faculty_id, source, status, CASE WHEN status = 'ok' THEN confidence END, verified_at FROM verification_log
+    WHERE id IN (SELECT MAX(id) FROM verification_log GROUP BY faculty_id, source)
+    ''')
+
+# Ordered schema migrations: (version, description, step). Steps must be idempotent,
+# since databases created before schema_version existed already have some of them.
+SCHEMA_MIGRATIONS = (
+    (1, "Create faculty, publications and data_sources tables", create_base_tables),
+    (2, "Add FTS5 faculty search index", create_search_index),
+    (3, "Index confidence_score and foreign-key columns", create_secondary_indexes),
+    (4, "Add trigram index for substring name/department search", create_trigram_index),
+    (5, "Track faculty with stale confidence scores", create_confidence_tracking),
+    (6, "Deduplicate data_sources into first/last seen observations", dedupe_data_sources),
+    (7, "Store profile page fingerprints for incremental re-crawls", create_profile_fingerprints),
+    (8, "Add publication enrichment queue", create_enrichment_queue),
+    (9, "Log per-source verification outcomes", create_verification_log),
+    (10, "Track email discovery from Scholar publications", create_email_discovery),
+    (11, "Track per-source verification outcomes for scheduling", create_verification_sources),
+)
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+def get_schema_version(conn):
+    """Return the highest applied migration version (0 for a new database)"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+def migrate(writer):
+    """Apply pending migrations in order, each in its own transaction.
+    
+    ``writer`` is a context manager factory yielding a connection inside a
+    write transaction (ConnectionPool.writer). The version is re-read inside
+    every transaction, so concurrent processes never apply a step twice.
+    Returns the list of versions applied.
+    """
+    with writer() as conn:
+        if get_schema_version(conn) >= SCHEMA_VERSION:
+            return []
+    
+    applied = []
+    for version, description, step in SCHEMA_MIGRATIONS:
+        with writer() as conn:
+            if get_schema_version(conn) >= version:
+                continue
+            step(conn.cursor())
+            conn.execute('INSERT INTO schema_version (version, description) VALUES (?, ?)', (version, description))
+        logger.info(f"Applied schema migration {version}: {description}")
+        applied.append(version)
+    return applied
@@ -0,0 +1,155 @@
+import logging
+import re
+import sys
+import threading
+import time
+
+from faculty_db import FACULTY_COLUMNS, is_faculty_record
+
+logger = logging.getLogger("faculty_snapshot")
+
+def normalize_name(name):
+    """Lookup key for a person's name: titles, punctuation and whitespace removed, lowercased"""
+    if not name:
+        return ''
+    name = re.sub(r"^(Dr\.|Professor)\s+", "", name)
+    name = re.sub(r"[^a-zA-Z\s]", "", name)  # Remove punctuation
+    return ''.join(name.lower().split())
+
+class FacultyRecord:
+    """Immutable, slot-based faculty record.
+    
+    Supports the read side of the dict interface (``record['email']``,
+    ``record.get('email')``) so it can stand in for the dicts returned by
+    FacultyDatabase; call to_dict() where a real dict is needed (e.g. JSON).
+    """
+    __slots__ = FACULTY_COLUMNS + ('publications',)
+    FIELDS = __slots__
+    
+    def __init__(self, faculty):
+        for field in FACULTY_COLUMNS:
+            object.__setattr__(self, field, faculty.get(field))
+        object.__setattr__(self, 'publications', tuple(faculty.get('publications') or ()))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("FacultyRecord is immutable")
+    
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key, default=None):
+        value = getattr(self, key) if key in self.FIELDS else None
+        return default if value is None else value
+    
+    def to_dict(self):
+        faculty = {field: getattr(self, field) for field in FACULTY_COLUMNS}
+        faculty['publications'] = list(self.publications)
+        return faculty
+    
+    def __repr__(self):
+        return f"FacultyRecord(id={self.id!r}, name={self.name!r})"
+
+class FacultySnapshot:
+    """Read-only, in-memory copy of the faculty table with prebuilt lookup maps.
+    
+    ``generation`` is the database generation (ConnectionPool.generation) the
+    snapshot was loaded at. Snapshots are never modified: a newer one is
+    built and swapped in by FacultySnapshotCache.
+    """
+    
+    def __init__(self, records, generation=None):
+        self.records = tuple(records)
+        self.generation = generation
+        self.by_id = {record.id: record for record in self.records}
+        
+        self.by_name = {}
+        self.by_department = {}
+        self.by_school = {}
+        for record in self.records:
+            if is_faculty_record(record):
+                self.by_name.setdefault(normalize_name(record.name), record)
+            if record.department:
+                self.by_department.setdefault(record.department, []).append(record)
+            if record.school:
+                self.by_school.setdefault(record.school, []).append(record)
+        self.by_department = {key: tuple(value) for key, value in self.by_department.items()}
+        self.by_school = {key: tuple(value) for key, value in self.by_school.items()}
+    
+    @classmethod
+    def load(cls, db):
+        """Read every faculty member (with publications) from a FacultyDatabase"""
+        generation = db.pool.generation()
+        
+        def build(faculty):
+            # Department and school names repeat across thousands of rows; share one copy each
+            for field in ('department', 'school'):
+                if faculty[field]:
+                    faculty[field] = sys.intern(faculty[field])
+            return FacultyRecord(faculty)
+        
+        start = time.perf_counter()
+        snapshot = cls((build(faculty) for faculty in db.iter_faculty()), generation)
+        logger.info(f"Loaded faculty snapshot of {len(snapshot)} records in {time.perf_counter() - start:.3f}s")
+        return snapshot
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+    
+    def get(self, faculty_id):
+        return self.by_id.get(faculty_id)
+    
+    def find_by_name(self, name):
+        """Exact match on the normalized name"""
+        return self.by_name.get(normalize_name(name))
+    
+    def search_department(self, keyword, limit=None):
+        """Faculty whose department or school contains ``keyword`` (case-insensitive), in id order"""
+        keyword = keyword.lower()
+        matches = {}
+        for index in (self.by_department, self.by_school):
+            for value, records in index.items():
+                if keyword in value.lower():
+                    for record in records:
+                        matches[record.id] = record
+        results = [matches[faculty_id] for faculty_id in sorted(matches)]
+        return results[:limit] if limit is not None else results
+
+class FacultySnapshotCache:
+    """Hands out the current FacultySnapshot, reloading it when the database changes.
+    
+    The database generation is checked at most every ``check_interval``
+    seconds. A reload happens in one request thread while the others keep
+    serving the previous snapshot; the new one replaces it with a single
+    attribute assignment.
+    """
+    
+    def __init__(self, db, check_interval=1.0):
+        self.db = db
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+    
+    def get(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reload_lock:
+                if self._snapshot is None:
+                    self._snapshot = FacultySnapshot.load(self.db)
+                    self._checked_at = time.monotonic()
+                return self._snapshot
+        
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self.db.pool.generation() != snapshot.generation and self._reload_lock.acquire(blocking=False):
+                try:
+                    self._snapshot = FacultySnapshot.load(self.db)
+                finally:
+                    self._reload_lock.release()
+        return self._snapshot
@@ -1,11 +1,14 @@
-import requests
 import logging
 import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 from bs4 import BeautifulSoup
-from scholarly import scholarly
+from crawler import CrawlEngine
 from faculty_db import FacultyDatabase
-from ga_tech_scraper import create_session, validate_url
+from ga_tech_scraper import SCHOLAR_HOST, http_sessions, validate_url
+from http_cache import CachedSession, HTTPCache
+from scholar_cache import default_scholar_cache
 
 # Set up logging
 logging.basicConfig(
@@ -18,18 +21,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger("faculty_verifier")
 
+# Longest each source probe is waited for (seconds). The HTTP probes time out each
+# request after 10s (DBLP tries two URLs); Google Scholar fills the author profile
+# through scholarly, which sets no timeout of its own.
+VERIFICATION_SOURCE_TIMEOUTS = {
+    'google_scholar': 60,
+    'dblp': 25,
+    'department_website': 15,
+    'personal_website': 15,
+}
+# Latency budget for verifying one faculty member: sources still running are deferred
+VERIFICATION_BUDGET = 60
+# Seconds past a probe's deadline its result is still waited for, so a probe that gives up
+# waiting on its host's limits at the deadline is recorded as throttled rather than deferred
+VERIFICATION_DEADLINE_GRACE = 0.5
+# Faculty verified at once by verify_all_faculty
+VERIFICATION_WORKERS = 4
+# Per-upstream (concurrency, requests/second, burst) limits; every other host, such as each
+# university's web server, gets the CrawlEngine defaults. Only requests that miss the
+# Scholar cache take a Scholar slot and token, so Scholar sees one request at a time.
+VERIFICATION_HOST_LIMITS = {
+    SCHOLAR_HOST: (1, 0.2, 1),
+    'dblp.org': (2, 1.0, 2),
+}
+
 class FacultyVerifier:
     def __init__(self, db_path="faculty_data.db"):
         """Initialize the faculty verifier with database connection"""
         self.db = FacultyDatabase(db_path)
-        self.session = create_session()
+        # Keep-alive sessions (with retries and timeouts) shared with the scraper; pages
+        # fetched recently by either are served from the HTTP cache or revalidated
+        self.http_cache = HTTPCache()
+        self.session = CachedSession(http_sessions, self.http_cache)
+        # Per-upstream politeness limits in place of a fixed sleep between faculty
+        self.engine = CrawlEngine(host_limits=VERIFICATION_HOST_LIMITS, session=self.session, timeout=10)
+        # Flags set in a probe's thread: ``throttled`` when a host's limits kept it from running
+        # before its deadline, ``failed`` when a request or the probe itself failed
+        self._probe = threading.local()
+        # Scholar profiles filled by the scraper's publication lookups are reused here, and vice versa
+        self.scholar_cache = default_scholar_cache()
     
     def close(self):
-        """Close database connection"""
+        """Close database connection and HTTP cache"""
         self.db.close()
+        self.http_cache.close()
     
-    def verify_faculty(self, faculty_id=None, name=None):
-        """Verify faculty information using multiple sources"""
+    def verify_faculty(self, faculty_id=None, name=None, budget=VERIFICATION_BUDGET):
+        """Verify faculty information using multiple sources.
+        
+        The sources are probed concurrently. A source that hasn't answered within
+        its VERIFICATION_SOURCE_TIMEOUTS entry or ``budget`` seconds overall is
+        recorded as deferred and counts as no evidence, so a faculty member takes
+        about as long as the slowest source that answers in time; one whose
+        host's limits left it no request slot in time is recorded as throttled,
+        which isn't held against the source when scheduling. Sources backed
+        off after failing for this faculty member are skipped, keeping the
+        confidence of their last successful run.
+        """
         if faculty_id is None and name is None:
             logger.error("Either faculty_id or name must be provided")
             return False
@@ -48,12 +96,13 @@ class FacultyVerifier:
         logger.info(f"Verifying faculty: {faculty['name']}")
         
         # Initialize verification results
-        verification_results = {
-            'google_scholar': self._verify_google_scholar(faculty),
-            'dblp': self._verify_dblp(faculty),
-            'department_website': self._verify_department_website(faculty),
-            'personal_website': self._verify_personal_website(faculty)
-        }
+        start = time.monotonic()
+        verification_results = self._run_verification_sources(faculty, budget,
+                                                               skip=self.db.get_backed_off_sources(faculty['id']))
+        self.db.log_verification(faculty['id'], [
+            (source, result['status'], result.get('confidence', 0), result['elapsed'])
+            for source, result in verification_results.items() if result['status'] != 'skipped'
+        ])
         
         # Calculate overall confidence score
         confidence_score = sum(result.get('confidence', 0) for result in verification_results.values()) / len(verification_results)
@@ -61,27 +110,113 @@ class FacultyVerifier:
         # Update faculty record with verified information
         self._update_faculty_with_verified_info(faculty, verification_results, confidence_score)
         
-        logger.info(f"Verification complete for {faculty['name']} with confidence score {confidence_score:.2f}")
+        deferred = [source for source, result in verification_results.items()
+                    if result['status'] in ('deferred', 'throttled')]
+        skipped = [source for source, result in verification_results.items() if result['status'] == 'skipped']
+        logger.info(f"Verification complete for {faculty['name']} with confidence score {confidence_score:.2f} "
+                    f"in {time.monotonic() - start:.1f}s" + (f" (deferred: {', '.join(deferred)})" if deferred else "")
+                    + (f" (backed off: {', '.join(skipped)})" if skipped else ""))
         return True
     
-    def _verify_google_scholar(self, faculty):
-        """Verify faculty information using Google Scholar"""
+    def _run_verification_sources(self, faculty, budget, skip=None):
+        """Probe every source concurrently, returning {source: result} with each result's status and elapsed time.
+        
+        Sources in ``skip`` ({source: previous confidence}) aren't probed; their
+        result has status 'skipped' and the previous confidence.
+        """
+        skip = skip or {}
+        probes = {
+            'google_scholar': self._verify_google_scholar,
+            'dblp': self._verify_dblp,
+            'department_website': self._verify_department_website,
+            'personal_website': self._verify_personal_website
+        }
+        skipped = {source: {'source': source, 'confidence': skip[source] or 0.0, 'data': {}, 'status': 'skipped',
+                            'elapsed': 0.0} for source in probes if source in skip}
+        probes = {source: probe for source, probe in probes.items() if source not in skip}
+        
+        def timed(source, probe, deadline):
+            probe_start = time.monotonic()
+            self._probe.throttled = False
+            self._probe.failed = False
+            try:
+                result = dict(probe(faculty, deadline))
+                # A probe that found nothing is 'ok'; one whose requests failed is an 'error'
+                result['status'] = 'throttled' if self._probe.throttled else 'error' if self._probe.failed else 'ok'
+            except Exception as e:
+                logger.error(f"Error in {source} verification: {e}")
+                result = {'source': source, 'confidence': 0.0, 'data': {}, 'status': 'error'}
+            result['elapsed'] = time.monotonic() - probe_start
+            return result
+        
+        start = time.monotonic()
+        deadlines = {source: start + min(VERIFICATION_SOURCE_TIMEOUTS[source], budget) for source in probes}
+        executor = ThreadPoolExecutor(max_workers=max(len(probes), 1), thread_name_prefix="verify")
+        # A probe still waiting on its host's limits at its deadline gives up (throttled); one
+        # that got its request out is left to finish in the background rather than waited for.
+        # Throttle slots are given back at the deadline, so an overrunning probe doesn't hold
+        # up the same host's probes for the next faculty member
+        futures = {source: executor.submit(timed, source, probe, deadlines[source]) for source, probe in probes.items()}
+        executor.shutdown(wait=False)
+        
+        verification_results = {}
+        for source, future in futures.items():
+            deadline = deadlines[source]
+            try:
+                result = future.result(timeout=max(0.0, deadline + VERIFICATION_DEADLINE_GRACE - time.monotonic()))
+            except FutureTimeoutError:
+                elapsed = time.monotonic() - start
+                logger.warning(f"Deferring {source} verification for {faculty['name']}: no answer after {elapsed:.1f}s")
+                future.add_done_callback(
+                    lambda late, source=source: logger.info(
+                        f"Deferred {source} verification for {faculty['name']} finished late, not merged"))
+                result = {'source': source, 'confidence': 0.0, 'data': {}, 'status': 'deferred', 'elapsed': elapsed}
+            verification_results[source] = result
+        verification_results.update(skipped)
+        return verification_results
+    
+    def _verify_google_scholar(self, faculty, deadline=None):
+        """Verify faculty information using Google Scholar, within SCHOLAR_HOST's limits"""
+        try:
+            return self._search_google_scholar(faculty, throttle=lambda: self.engine.throttle(SCHOLAR_HOST, deadline))
+        except TimeoutError as e:
+            self._probe.throttled = True
+            logger.warning(f"Skipping Google Scholar verification for {faculty['name']}: {e}")
+            return {'source': 'google_scholar', 'confidence': 0.0, 'data': {}}
+    
+    def _fetch(self, url, deadline, not_found_ok=False):
+        """GET a page within its host's limits, marking the probe throttled if they hold it past ``deadline``.
+        
+        Network errors and error responses mark the probe failed; with
+        ``not_found_ok`` a 404 or 410 only means there is nothing to verify.
+        """
+        try:
+            response = self.engine.fetch(url, deadline, timeout=10)
+        except TimeoutError:
+            self._probe.throttled = True
+            raise
+        except Exception:
+            self._probe.failed = True
+            raise
+        if response.status_code >= 400 and not (not_found_ok and response.status_code in (404, 410)):
+            logger.warning(f"HTTP {response.status_code} from {url}")
+            self._probe.failed = True
+        return response
+    
+    def _search_google_scholar(self, faculty, throttle=None):
+        """Verify faculty information using Google Scholar; ``throttle`` paces requests that miss the cache"""
         try:
             logger.info(f"Verifying {faculty['name']} on Google Scholar")
             result = {'source': 'google_scholar', 'confidence': 0.0, 'data': {}}
             
-            # Search for the author
-            search_query = scholarly.search_author(f"{faculty['name']} {faculty['department']}")
-            author = next(search_query, None)
+            # Search for the author and get detailed author information, unless cached
+            author = self.scholar_cache.author(faculty['name'], faculty['department'], throttle)
             
             if not author:
                 logger.info(f"No Google Scholar profile found for {faculty['name']}")
                 return result
             
-            # Get detailed author information
             try:
-                author = scholarly.fill(author)
-                
                 # Extract and verify information
                 verified_data = {}
                 
@@ -113,38 +248,26 @@ class FacultyVerifier:
                     verified_data['personal_website'] = homepage
                     result['confidence'] += 0.2
                 
-                # Get email domains from publications if available
-                email_domains = set()
-                for pub in author.get('publications', []):
-                    if 'bib' in pub and 'pub_year' in pub['bib'] and int(pub['bib'].get('pub_year', 0)) > 2015:
-                        # Recent publication might have email
-                        try:
-                            pub_filled = scholarly.fill(pub)
-                            if 'author_pub_id' in pub_filled:
-                                email_pattern = r'[\w.+-]+@[\w-]+\.[\w.-]+'
-                                pub_text = str(pub_filled)
-                                emails = re.findall(email_pattern, pub_text)
-                                for email in emails:
-                                    if 'gatech.edu' in email:
-                                        verified_data['email'] = email
-                                        result['confidence'] += 0.2
-                                        break
-                        except Exception as e:
-                            logger.warning(f"Error filling publication details: {e}")
+                # Emails in recent publications are found by the email discovery stage
                 
                 result['data'] = verified_data
                 logger.info(f"Google Scholar verification for {faculty['name']}: {result['confidence']:.2f} confidence")
                 
             except Exception as e:
                 logger.error(f"Error filling Google Scholar author details: {e}")
+                self._probe.failed = True
             
             return result
             
+        except TimeoutError:
+            # Held past the deadline by SCHOLAR_HOST's limits: _verify_google_scholar defers the probe
+            raise
         except Exception as e:
             logger.error(f"Error in Google Scholar verification: {e}")
+            self._probe.failed = True
             return {'source': 'google_scholar', 'confidence': 0.0, 'data': {}}
     
-    def _verify_dblp(self, faculty):
+    def _verify_dblp(self, faculty, deadline=None):
         """Verify faculty information using DBLP"""
         try:
             logger.info(f"Verifying {faculty['name']} on DBLP")
@@ -169,7 +292,8 @@ class FacultyVerifier:
                 dblp_url = f"https://dblp.org/pid/{name_format}.html"
                 
                 try:
-                    response = self.session.get(dblp_url, timeout=10)
+                    # DBLP answers 404 for a pid that doesn't exist
+                    response = self._fetch(dblp_url, deadline, not_found_ok=True)
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.text, 'html.parser')
                         
@@ -219,14 +343,16 @@ class FacultyVerifier:
                 
                 except Exception as e:
                     logger.warning(f"Error checking DBLP format {name_format}: {e}")
+                    self._probe.failed = True
             
             return result
             
         except Exception as e:
             logger.error(f"Error in DBLP verification: {e}")
+            self._probe.failed = True
             return {'source': 'dblp', 'confidence': 0.0, 'data': {}}
     
-    def _verify_department_website(self, faculty):
+    def _verify_department_website(self, faculty, deadline=None):
         """Verify faculty information using department website"""
         try:
             logger.info(f"Verifying {faculty['name']} on department website")
@@ -242,7 +368,7 @@ class FacultyVerifier:
                 return result
             
             try:
-                response = self.session.get(profile_url, timeout=10)
+                response = self._fetch(profile_url, deadline)
                 if response.status_code != 200:
                     return result
                 
@@ -293,14 +419,16 @@ class FacultyVerifier:
                 
             except Exception as e:
                 logger.warning(f"Error fetching department profile: {e}")
+                self._probe.failed = True
             
             return result
             
         except Exception as e:
             logger.error(f"Error in department website verification: {e}")
+            self._probe.failed = True
             return {'source': 'department_website', 'confidence': 0.0, 'data': {}}
     
-    def _verify_personal_website(self, faculty):
+    def _verify_personal_website(self, faculty, deadline=None):
         """Verify faculty information using personal website"""
         try:
             logger.info(f"Verifying {faculty['name']} on personal website")
@@ -316,7 +444,7 @@ class FacultyVerifier:
                 return result
             
             try:
-                response = self.session.get(personal_website, timeout=10)
+                response = self._fetch(personal_website, deadline)
                 if response.status_code != 200:
                     return result
                 
@@ -369,11 +497,13 @@ class FacultyVerifier:
                 
             except Exception as e:
                 logger.warning(f"Error fetching personal website: {e}")
+                self._probe.failed = True
             
             return result
             
         except Exception as e:
             logger.error(f"Error in personal website verification: {e}")
+            self._probe.failed = True
             return {'source': 'personal_website', 'confidence': 0.0, 'data': {}}
     
     def _update_faculty_with_verified_info(self, faculty, verification_results, confidence_score):
@@ -448,34 +578,87 @@ class FacultyVerifier:
         
         return intersection / union if union > 0 else 0.0
     
-    def verify_all_faculty(self, min_confidence=0.0, max_faculty=None):
-        """Verify all faculty in the database"""
+    def verify_all_faculty(self, min_confidence=0.0, max_faculty=None, workers=VERIFICATION_WORKERS,
+                           time_budget=None, request_budget=None):
+        """Verify the faculty most in need of it, highest priority first, until due faculty or a budget run out.
+        
+        Priority comes from the database's verification schedule: how long ago
+        a record was last updated, how low its confidence is, whether it was
+        ever verified and how many sources failed last time; faculty verified
+        recently or with every source backed off aren't due. Up to ``workers``
+        faculty are verified at once, each upstream paced by
+        VERIFICATION_HOST_LIMITS. No faculty member is started once
+        ``time_budget`` seconds have passed or the engine has made
+        ``request_budget`` requests (HTTP fetches and Scholar lookups); those
+        already started finish within VERIFICATION_BUDGET.
+        """
         try:
-            # Get all faculty with confidence score above threshold
-            faculty_list = self.db.get_all_faculty(min_confidence)
-            
-            if max_faculty is not None and max_faculty > 0:
-                faculty_list = faculty_list[:max_faculty]
-            
-            logger.info(f"Verifying {len(faculty_list)} faculty members")
-            
-            for i, faculty in enumerate(faculty_list):
+            candidates = self.db.get_verification_candidates(len(VERIFICATION_SOURCE_TIMEOUTS), min_confidence,
+                                                             max_faculty if max_faculty and max_faculty > 0 else None)
+            total = len(candidates)
+            if not total:
+                logger.info("No faculty are due for verification")
+                return True
+            
+            logger.info(f"Verifying up to {total} due faculty members (priority {candidates[0]['priority']:.2f} "
+                        f"down to {candidates[-1]['priority']:.2f}) with {workers} workers"
+                        + (f", time budget {time_budget}s" if time_budget else "")
+                        + (f", request budget {request_budget}" if request_budget else ""))
+            
+            def verify(faculty):
                 try:
-                    logger.info(f"Verifying faculty {i+1}/{len(faculty_list)}: {faculty['name']}")
                     self.verify_faculty(faculty_id=faculty['id'])
-                    
-                    # Be nice to external services
-                    time.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Error verifying faculty {faculty['name']}: {e}")
             
-            logger.info(f"Completed verification of {len(faculty_list)} faculty members")
+            start = time.monotonic()
+            requests_before = self._request_count()
+            exhausted = None
+            completed = 0
+            queue = iter(candidates)
+            running = set()
+            with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="verify-faculty") as pool:
+                while True:
+                    # Start the next faculty only while a worker is free and the budgets allow
+                    while len(running) < max(workers, 1) and exhausted is None:
+                        if time_budget is not None and time.monotonic() - start >= time_budget:
+                            exhausted = 'time'
+                        elif request_budget is not None and self._request_count() - requests_before >= request_budget:
+                            exhausted = 'request'
+                        else:
+                            faculty = next(queue, None)
+                            if faculty is None:
+                                break
+                            running.add(pool.submit(verify, faculty))
+                    
+                    if not running:
+                        break
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for _ in done:
+                        completed += 1
+                        self._log_progress(completed, total, start)
+            
+            logger.info(f"Completed verification of {completed} of {total} due faculty members in "
+                        f"{time.monotonic() - start:.1f}s with {self._request_count() - requests_before} requests"
+                        + (f", stopped by the {exhausted} budget" if exhausted else ""))
+            self.scholar_cache.report()
             return True
             
         except Exception as e:
             logger.error(f"Error in verify_all_faculty: {e}")
             return False
+    
+    def _request_count(self):
+        """Requests the engine has made so far, across every host"""
+        return sum(stats['requests'] for stats in self.engine.host_stats().values())
+    
+    def _log_progress(self, completed, total, start):
+        """Log how many faculty are verified, the rate so far and the estimated time left"""
+        elapsed = time.monotonic() - start
+        rate = completed / elapsed if elapsed else 0.0
+        eta = (total - completed) / rate if rate else 0.0
+        logger.info(f"Verified {completed}/{total} ({completed / total:.0%}) at {rate * 60:.1f}/min, "
+                    f"ETA {time.strftime('%H:%M:%S', time.gmtime(eta))}")
 
 # Example usage
 if __name__ == "__main__":
@@ -1,58 +1,395 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import hashlib
 import json
-import time
+import os
 import re
+import threading
+from collections import namedtuple
 from urllib.parse import urlparse, urljoin
-from scholarly import scholarly
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def get_publications_from_google_scholar(name, affiliation="Georgia Tech"):
-    """Get publications for a professor using Google Scholar via scholarly"""
+from crawl_frontier import CrawlFrontier
+from crawler import CrawlEngine, host_of
+from http_cache import CachedSession, HTTPCache
+from scholar_cache import default_scholar_cache
+
+# Google Scholar (queried through scholarly) is throttled like any other crawled host
+SCHOLAR_HOST = "scholar.google.com"
+# Per-host (concurrency, requests/second, burst) overrides for the faculty crawl
+CRAWL_HOST_LIMITS = {
+    SCHOLAR_HOST: (1, 1.0, 1),
+}
+# Link text suggesting a personal site (the professor's first and last names are added per profile)
+WEBSITE_LINK_TERMS = ['website', 'homepage', 'personal', 'lab', 'group', 'research', 'project']
+# Text near which a link is taken as the professor's website
+WEBSITE_KEYWORDS = ['website', 'homepage', 'personal page', 'lab page', 'research group']
+WEBSITE_KEYWORD_PATTERNS = [(keyword, re.compile(keyword, re.IGNORECASE)) for keyword in WEBSITE_KEYWORDS]
+WEBSITE_KEYWORD_PATTERN = re.compile('|'.join(WEBSITE_KEYWORDS), re.IGNORECASE)
+EXTERNAL_HREF_PATTERN = re.compile('^https?://')
+# Common TLDs for academic and personal sites
+ACADEMIC_TLDS = ['.edu', '.org', '.io', '.net', 'github.io', '.me']
+# URL fragments that rule a link out, per website detection strategy
+WEBSITE_EXCLUDES_BY_TEXT = ['qualtrics', 'gatech.edu', 'forms.', 'survey.',
+                            'twitter.com', 'linkedin.com', 'facebook.com', 'youtube.com']
+WEBSITE_EXCLUDES_BY_NAME = ['qualtrics', 'gatech.edu', 'twitter', 'linkedin', 'facebook']
+WEBSITE_EXCLUDES_NEARBY = ['qualtrics', 'gatech.edu', 'twitter', 'linkedin']
+WEBSITE_EXCLUDES_BY_TLD = ['qualtrics', 'gatech.edu', 'twitter.com', 'linkedin.com']
+
+# Profile pages are parsed with lxml when it is installed
+try:
+    import lxml  # noqa: F401
+    PROFILE_PARSER = 'lxml'
+except ImportError:
+    PROFILE_PARSER = 'html.parser'
+# Restricts fast profile parsing to the PROFILE_REGION_SELECTORS elements
+PROFILE_REGION_STRAINER = SoupStrainer(
+    ['h1', 'article'], class_=re.compile(r'(^|\s)(page-title|node--type-coc-person)(\s|$)')
+)
+
+# Returned by a profile task when the page matches its stored fingerprint
+PROFILE_UNCHANGED = object()
+# Part of every profile fingerprint; bump it when extraction changes so all profiles are re-extracted
+PROFILE_FINGERPRINT_VERSION = 1
+# Extracted profiles handed to a crawl's ``store`` at a time
+PROFILE_STORE_BATCH = 25
+# Parts of a profile page extract_professor_info reads: the title and the person article
+PROFILE_REGION_SELECTORS = ('h1.page-title', 'article.node--type-coc-person')
+
+# Faculty directory link selectors, tried in order of specificity
+FACULTY_LINK_SELECTORS = [
+    # Original GT CoC selectors
+    'div.views-row div.profile-card__content a[href*="/people/"]',
+    'div.views-row a[href*="/people/"]',
+    # Common faculty directory selectors
+    'div.faculty-listing a',
+    'div.directory-listing a',
+    'div.faculty-card a',
+    'div.people-listing a',
+    # Generic article/content selectors
+    'article h3 a',
+    'div.content a[href*="/faculty/"]',
+    'div.content a[href*="/profile/"]',
+    # Really broad fallbacks
+    'a[href*="/faculty/"]',
+    'a[href*="/profile/"]',
+    'a[href*="/people/"]'
+]
+SELECTOR_CACHE_PATH = "selector_cache.json"
+
+# A faculty directory entry, detached from the page it was found on. It is also
+# the (name, profile_url, school_name) task the profile stage and CrawlFrontier work on.
+FacultyLink = namedtuple('FacultyLink', ['name', 'url', 'school'])
+
+# HTTP client defaults shared by the scraper, the verifier and the web app
+HTTP_TIMEOUT = (5, 20)  # (connect, read) seconds
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5  # waits 0.5s, 1s, 2s, ... between retries (or the server's Retry-After)
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_POOL_SIZE = 10  # keep-alive connections held per host
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+class TimeoutSession(requests.Session):
+    """Session that applies a default (connect, read) timeout to every request.
+    
+    A request made with no timeout (or ``timeout=None``) gets ``self.timeout``
+    rather than waiting forever on a hung socket.
+    """
+    
+    def __init__(self, timeout=HTTP_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+    
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().request(method, url, **kwargs)
+
+def create_session(retries=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR, timeout=HTTP_TIMEOUT,
+                   pool_size=HTTP_POOL_SIZE):
+    """Create a keep-alive session with bounded retries, default timeouts and gzip.
+    
+    Idempotent requests (GET/HEAD/OPTIONS) that fail to connect or get a 429
+    or 5xx are retried up to ``retries`` times with exponential backoff; the
+    last response is returned rather than raised, so callers still check
+    ``status_code`` as before.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = TimeoutSession(timeout)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+class HostSessions:
+    """Pooled keep-alive sessions, one per host, created on first use.
+    
+    Exposes get/head/post like a session and routes each call to its host's
+    session, so connections (and their TLS handshakes) are reused across every
+    request to that host while hosts don't contend for one session's pool.
+    """
+    
+    def __init__(self, **session_options):
+        self.session_options = session_options
+        self._sessions = {}
+        self._lock = threading.Lock()
+    
+    def for_url(self, url):
+        host = host_of(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = create_session(**self.session_options)
+                self._sessions[host] = session
+            return session
+    
+    def request(self, method, url, **kwargs):
+        return self.for_url(url).request(method, url, **kwargs)
+    
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+    
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+    
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+# Process-wide sessions shared by the scraper, verifier and web app
+http_sessions = HostSessions()
+
+def validate_url(url, check_reachable=False):
+    """Check that ``url`` is an absolute http(s) URL.
+    
+    With ``check_reachable=True`` it must also answer a HEAD request (through
+    the shared sessions) with a status below 400.
+    """
+    if not url or not isinstance(url, str):
+        return False
     try:
-        print(f"Searching Google Scholar for {name} at {affiliation}...")
-        # Search for the author
-        search_query = scholarly.search_author(f"{name} {affiliation}")
-        
-        # Try to get the first author result
-        author = next(search_query, None)
-        
-        if not author:
-            print(f"No Google Scholar profile found for {name}")
-            return []
-            
-        # Fill in all available details for the author
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return False
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return False
+    if not check_reachable:
+        return True
+    try:
+        response = http_sessions.head(url, allow_redirects=True)
+        return response.status_code < 400
+    except requests.RequestException:
+        return False
+
+class SelectorCache:
+    """The directory selector that last found faculty links on each site, kept in a JSON file.
+    
+    process_faculty_page tries a site's recorded selector before the
+    FACULTY_LINK_SELECTORS cascade, so later pages of a paginated listing and
+    later crawls go straight to it. An entry is dropped as soon as its
+    selector stops finding faculty links, and the cascade's new winner is
+    recorded in its place.
+    """
+    
+    def __init__(self, path=SELECTOR_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'invalidated': 0}
+        self.dirty = False
         try:
-            author = scholarly.fill(author)
-            
-            # Get the publications (limit to top 5 most cited)
-            publications = sorted(
-                author.get('publications', []), 
-                key=lambda x: x.get('num_citations', 0), 
-                reverse=True
-            )[:5]
-            
-            # Extract publication titles
-            publication_titles = []
-            for pub in publications:
-                if 'bib' in pub and 'title' in pub['bib']:
-                    publication_titles.append(pub['bib']['title'])
-                    
-            print(f"Found {len(publication_titles)} publications for {name} on Google Scholar")
-            return publication_titles
-            
-        except Exception as e:
-            print(f"Error filling author details for {name}: {e}")
-            return []
-            
+            with open(path, encoding='utf-8') as f:
+                self.selectors = json.load(f)
+        except (OSError, ValueError):
+            self.selectors = {}
+    
+    def get(self, domain):
+        with self.lock:
+            selector = self.selectors.get(domain)
+            if selector is None:
+                self.stats['misses'] += 1
+            return selector
+    
+    def hit(self, domain):
+        with self.lock:
+            self.stats['hits'] += 1
+    
+    def record(self, domain, selector):
+        with self.lock:
+            if self.selectors.get(domain) != selector:
+                self.selectors[domain] = selector
+                self.dirty = True
+    
+    def invalidate(self, domain):
+        with self.lock:
+            if self.selectors.pop(domain, None) is not None:
+                self.stats['invalidated'] += 1
+                self.dirty = True
+    
+    def save(self):
+        """Write the selectors back if they changed (atomically, via a temporary file)"""
+        with self.lock:
+            if not self.dirty:
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.selectors, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+    
+    def report(self):
+        s = self.stats
+        print(f"Selector cache: {s['hits']} pages matched by a cached selector, {s['misses']} without one, "
+              f"{s['invalidated']} invalidated, {len(self.selectors)} sites known")
+        return dict(s)
+
+def create_crawl_engine(cache=None, **kwargs):
+    """CrawlEngine for the faculty crawl: shared keep-alive sessions and per-host limits.
+    
+    Pages go through ``cache`` (an HTTPCache; the on-disk cache at its default
+    path if None), so re-crawls of unchanged profiles cost a 304 or nothing.
+    Pass ``cache=False`` to always download.
+    """
+    if cache is None:
+        cache = HTTPCache()
+    kwargs.setdefault('host_limits', CRAWL_HOST_LIMITS)
+    kwargs.setdefault('session', CachedSession(http_sessions, cache) if cache else http_sessions)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT)
+    return CrawlEngine(**kwargs)
+
+def fetch_google_scholar_publications(name, affiliation="Georgia Tech", cache=None, throttle=None):
+    """Titles of a professor's 5 most cited publications on Google Scholar, via scholarly.
+    
+    The filled author profile comes from ``cache`` (the shared ScholarCache by
+    default) when it was looked up recently; ``throttle`` is entered around
+    each request actually sent to Scholar (see ScholarCache.author). Returns an empty list when no
+    Scholar profile matches; lookup errors (blocking, timeouts, parse
+    failures) are raised for the caller to retry.
+    """
+    print(f"Searching Google Scholar for {name} at {affiliation}...")
+    # Search for the author and fill in all available details, unless cached
+    author = (cache or default_scholar_cache()).author(name, affiliation, throttle)
+    
+    if not author:
+        print(f"No Google Scholar profile found for {name}")
+        return []
+    
+    # Get the publications (limit to top 5 most cited)
+    publications = sorted(
+        author.get('publications', []), 
+        key=lambda x: x.get('num_citations', 0), 
+        reverse=True
+    )[:5]
+    
+    # Extract publication titles
+    publication_titles = []
+    for pub in publications:
+        if 'bib' in pub and 'title' in pub['bib']:
+            publication_titles.append(pub['bib']['title'])
+    
+    print(f"Found {len(publication_titles)} publications for {name} on Google Scholar")
+    return publication_titles
+
+def get_publications_from_google_scholar(name, affiliation="Georgia Tech", throttle=None):
+    """Get publications for a professor using Google Scholar via scholarly (an empty list on errors)"""
+    try:
+        return fetch_google_scholar_publications(name, affiliation, throttle=throttle)
     except Exception as e:
         print(f"Error searching Google Scholar for {name}: {e}")
         
     return []
 
-def scrape_ga_tech_faculty():
-    """Scrape Georgia Tech College of Computing faculty information"""
+def scrape_ga_tech_faculty(engine=None, fingerprints=None, unchanged=None, enrich_publications=True, frontier=None,
+                           selector_cache=None, resume=True, store=None):
+    """Scrape Georgia Tech College of Computing faculty information.
+    
+    Requests go through a CrawlEngine: school sites are crawled in parallel
+    while each host is held to its own concurrency and rate limits.
+    
+    With ``fingerprints`` ({profile_url: fingerprint} from the previous crawl),
+    profiles whose content is unchanged are skipped and their URLs appended to
+    ``unchanged``; the professors returned carry their new ``profile_fingerprint``.
+    
+    ``enrich_publications=False`` leaves ``publications`` empty instead of
+    querying Google Scholar during the crawl, for callers that queue
+    enrichment as a separate stage (see enrichment.py).
+    
+    With a CrawlFrontier every profile outcome is committed to it as it completes.
+    If the frontier holds an unfinished crawl started with the same options
+    (fingerprinting and enrichment on or off) it is resumed: the directories
+    are not re-read and only pending, interrupted and failed profiles are
+    fetched. An unfinished crawl with other options is discarded, since its
+    records have a different shape, and so is any unfinished crawl with
+    ``resume=False`` (a full re-crawl must not reuse profiles an incremental
+    crawl skipped as unchanged). The crawl is marked finished once no URL is
+    left to retry.
+    
+    With ``store`` (a callable taking a list of professor records) the crawl
+    hands on extracted profiles in batches as it goes, so an interrupted run
+    keeps what it got through; see process_profile_tasks.
+    
+    Directory pages are read with a SelectorCache (``selector_cache``, by
+    default the one in SELECTOR_CACHE_PATH), saved when the directories are done.
+    """
     base_url = "https://www.cc.gatech.edu"
+    engine = engine or create_crawl_engine()
+    
+    # Stored records depend on these: fingerprinted crawls store None for unchanged
+    # profiles and a profile_fingerprint on the rest, enriched ones their publications
+    options = {'fingerprints': fingerprints is not None, 'enrich_publications': bool(enrich_publications)}
+    resume = resume and frontier is not None and frontier.in_progress()
+    if resume and frontier.options() != options:
+        print(f"Not resuming the unfinished crawl: it was started with {frontier.options()}, "
+              f"this run uses {options}")
+        resume = False
+    
+    if resume:
+        tasks = frontier.tasks()
+        print(f"Resuming crawl of {len(tasks)} profiles: {frontier.counts()}")
+    else:
+        selector_cache = selector_cache if selector_cache is not None else SelectorCache()
+        tasks = resolve_profile_links(crawl_directories(engine, base_url, selector_cache))
+        selector_cache.save()
+        selector_cache.report()
+        if frontier is not None:
+            frontier.start(tasks, options)
+    
+    # Dictionary to store professor information, using URLs as keys to avoid duplicates
+    professors_dict = {}
+    process_profile_tasks(tasks, professors_dict, base_url, engine, fingerprints, unchanged, enrich_publications,
+                          frontier, store)
+    engine.report()
+    if isinstance(engine.session, CachedSession):
+        engine.session.report()
+    if frontier is not None:
+        if frontier.remaining():
+            print(f"Crawl incomplete, run again to retry failed profiles: {frontier.counts()}")
+        else:
+            frontier.finish()
     
+    # Convert dictionary to list for output
+    professors = list(professors_dict.values())
+    return professors
+
+
+def crawl_directories(engine, base_url, selector_cache=None):
+    """Crawl every school's faculty directory and return its FacultyLinks in school order"""
     # Schools to scrape within cc.gatech.edu domain
     schools = [
         {"name": "College of Computing (General)", "url": f"{base_url}/people/faculty"}
@@ -69,216 +406,504 @@ def scrape_ga_tech_faculty():
     # Add all schools to our list
     schools.extend(school_specific_urls)
     
-    # Dictionary to store professor information, using URLs as keys to avoid duplicates
-    professors_dict = {}
+    # Directory pages: one task per school, so the school sites are crawled in parallel
+    school_links = engine.map(
+        lambda school: crawl_school_directory(engine, school, base_url, selector_cache),
+        schools, key=lambda school: host_of(school["url"])
+    )
     
-    # Process each school
-    for school in schools:
-        school_name = school["name"]
-        faculty_url = school["url"]
+    # Profiles from every school are fetched together; a professor listed by several
+    # schools is attributed to the first one, as when schools were crawled in order
+    profile_links = []
+    for school, faculty_links in zip(schools, school_links):
+        faculty_links = faculty_links or []
+        print(f"Found {len(faculty_links)} faculty in {school['name']}")
+        profile_links.extend(faculty_links)
+    return profile_links
+
+
+def crawl_school_directory(engine, school, base_url, selector_cache=None):
+    """Fetch a school's faculty directory (following pagination) and return its FacultyLinks.
+    
+    Each page's links are turned into FacultyLinks and its tree released
+    before the next page is fetched, so memory holds one directory page per
+    school rather than every page crawled.
+    """
+    school_name = school["name"]
+    faculty_url = school["url"]
+    
+    # Try to fetch all faculty members at once by adding a large items_per_page parameter
+    all_faculty_url = f"{faculty_url}?items_per_page=1000"
+    print(f"\nAttempting to fetch faculty from {school_name} at {all_faculty_url}")
+    
+    try:
+        soup = BeautifulSoup(engine.fetch(all_faculty_url).text, 'html.parser')
         
-        # Try to fetch all faculty members at once by adding a large items_per_page parameter
-        all_faculty_url = f"{faculty_url}?items_per_page=1000"
-        print(f"\nAttempting to fetch faculty from {school_name} at {all_faculty_url}")
+        # Save HTML to help with debugging (just for the first school)
+        if school_name == "College of Computing (General)":
+            with open('faculty_page.html', 'w', encoding='utf-8') as f:
+                f.write(soup.prettify())
+            print("Saved faculty page HTML for debugging")
         
-        try:
-            resp = requests.get(all_faculty_url)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Save HTML to help with debugging (just for the first school)
-            if school_name == "College of Computing (General)":
-                with open('faculty_page.html', 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
-                print("Saved faculty page HTML for debugging")
+        # Process the faculty page and find faculty links
+        # Extract base domain from the URL
+        school_url = school["url"]
+        if school_url.startswith('http'):
+            # For full URLs, parse the domain
+            parsed_url = urlparse(school_url)
+            school_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        else:
+            # For relative URLs, use the base_url
+            school_base_url = base_url
+        
+        faculty_links = faculty_link_records(process_faculty_page(soup, school_name, school_base_url, selector_cache),
+                                             school_name, base_url)
+        next_url = next_page_url(soup, base_url)
+        # Nothing refers to the tree any more; decompose() frees it now rather than at the next GC cycle
+        soup.decompose()
+        
+        # Follow pagination if needed
+        current_page = 0
+        while True:
+            current_page += 1
+            if next_url:
+                print(f"Fetching page {current_page + 1} from {next_url}")
+                try:
+                    # The engine's per-host rate limit replaces the fixed delay between pages
+                    soup = BeautifulSoup(engine.fetch(next_url).text, 'html.parser')
                     
-            # Process the faculty page and find faculty links
-            # Extract base domain from the URL
-            school_url = school["url"]
-            if school_url.startswith('http'):
-                # For full URLs, parse the domain
-                parsed_url = urlparse(school_url)
-                school_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            else:
-                # For relative URLs, use the base_url
-                school_base_url = base_url
-                
-            faculty_links = process_faculty_page(soup, school_name, school_base_url)
-            
-            # Follow pagination if needed
-            current_page = 0
-            while True:
-                current_page += 1
-                # Look for "next" link in pagination
-                next_link = soup.select_one('a[rel="next"], li.pager__item--next a, a.pager-next')
-                if next_link and 'href' in next_link.attrs:
-                    next_url = next_link['href']
-                    # Make sure it's a full URL
-                    if next_url.startswith('/'):
-                        next_url = base_url + next_url
-                    elif not next_url.startswith(('http://', 'https://')):
-                        next_url = base_url + '/' + next_url
-                        
-                    print(f"Fetching page {current_page + 1} from {next_url}")
-                    try:
-                        next_resp = requests.get(next_url)
-                        soup = BeautifulSoup(next_resp.text, 'html.parser')
-                        
-                        # Process the next page
-                        new_links = process_faculty_page(soup, school_name, school_base_url)
-                        if new_links:
-                            faculty_links.extend(new_links)
-                            print(f"Total faculty links found so far in {school_name}: {len(faculty_links)}")
-                        else:
-                            print("No new faculty links found on this page. Stopping pagination.")
-                            break
-                            
-                        # Add a small delay between requests to be respectful
-                        time.sleep(1)
-                    except Exception as e:
-                        print(f"Error fetching next page: {e}")
+                    # Process the next page
+                    new_links = process_faculty_page(soup, school_name, school_base_url, selector_cache)
+                    new_records = faculty_link_records(new_links, school_name, base_url)
+                    next_url = next_page_url(soup, base_url)
+                    soup.decompose()
+                    if new_links:
+                        faculty_links.extend(new_records)
+                        print(f"Total faculty links found so far in {school_name}: {len(faculty_links)}")
+                    else:
+                        print("No new faculty links found on this page. Stopping pagination.")
                         break
-                else:
-                    print("No more pagination links found.")
+                except Exception as e:
+                    print(f"Error fetching next page: {e}")
                     break
-            
-            # Process all faculty from this school
-            print(f"Found {len(faculty_links)} faculty in {school_name}")
-            process_faculty_profiles(faculty_links, professors_dict, base_url, school_name)
-            
-        except Exception as e:
-            print(f"Error processing {school_name}: {e}")
+            else:
+                print("No more pagination links found.")
+                break
+        
+        return faculty_links
+        
+    except Exception as e:
+        print(f"Error processing {school_name}: {e}")
+        return []
+
+
+def next_page_url(page_soup, base_url):
+    """Absolute URL of a directory page's "next" pagination link, or None"""
+    next_link = page_soup.select_one('a[rel="next"], li.pager__item--next a, a.pager-next')
+    if not next_link or 'href' not in next_link.attrs:
+        return None
+    next_url = next_link['href']
+    # Make sure it's a full URL
+    if next_url.startswith('/'):
+        next_url = base_url + next_url
+    elif not next_url.startswith(('http://', 'https://')):
+        next_url = base_url + '/' + next_url
+    return next_url
+
+
+def faculty_link_records(faculty_links, school_name, base_url):
+    """Turn faculty link Tags into FacultyLinks with absolute URLs, which keep no reference to the page"""
+    records = []
+    for faculty_link in faculty_links:
+        name = faculty_link.get_text(strip=True)
+        href = faculty_link.get('href')
+        if href is None:
+            print(f"Skipping {name} from {school_name}: link has no URL")
+            continue
+        
+        # Make sure href is a valid URL
+        if href.startswith(('http://', 'https://')):
+            profile_url = href  # Already absolute URL
+        else:
+            # Use urljoin to handle both relative URLs and path-absolute URLs
+            profile_url = urljoin(base_url, href)
+        records.append(FacultyLink(name, str(profile_url), school_name))
+    return records
+
+
+def faculty_links_for_selector(page_soup, selector):
+    """Links on a directory page that ``selector`` picks out and that look like faculty names"""
+    valid_links = []
     
-    # Convert dictionary to list for output
-    professors = list(professors_dict.values())
-    return professors
+    # Filter links to exclude navigation links
+    for link in page_soup.select(selector):
+        text = link.get_text(strip=True)
+        
+        # Skip navigation links, empty links, or overly short names
+        if (not text or len(text) < 4 or ' ' not in text or 
+            any(x in text.lower() for x in ['faculty', 'staff', 'student', 'alumni', 'board', 'people', 'directory'])):
+            continue
+        
+        # Make sure it looks like a person name (contains a space, not too short)
+        if len(text.split()) >= 2:
+            valid_links.append(link)
+    return valid_links
 
 
-def process_faculty_page(page_soup, school_name, base_url):
-    """Process a faculty directory page to extract faculty links"""
+def fallback_faculty_links(page_soup):
+    """Every link on the page that might be a faculty profile, when no selector matches"""
     page_faculty_links = []
+    all_links = page_soup.select('a')
+    for link in all_links:
+        href = link.get('href', '')
+        text = link.get_text(strip=True)
+        
+        # Only include links that look like individual faculty profiles (e.g., names with spaces)
+        if (text and len(text) > 5 and ' ' in text and 
+            not any(x in text.lower() for x in ['faculty', 'staff', 'student', 'alumni', 'board', 'people']) and
+            not href.startswith('#') and
+            not href.startswith('mailto:') and
+            not any(x in href.lower() for x in ['index', 'search', 'contact', 'about', 'home', 'catalog'])):
+            # If the name looks like a person (contains at least a first and last name)
+            if len(text.split()) >= 2:
+                page_faculty_links.append(link)
+    return page_faculty_links
+
+
+def process_faculty_page(page_soup, school_name, base_url, selector_cache=None):
+    """Process a faculty directory page to extract faculty links.
     
-    # Try multiple selectors for different site structures
-    selectors = [
-        # Original GT CoC selectors
-        'div.views-row div.profile-card__content a[href*="/people/"]',
-        'div.views-row a[href*="/people/"]',
-        # Common faculty directory selectors
-        'div.faculty-listing a',
-        'div.directory-listing a',
-        'div.faculty-card a',
-        'div.people-listing a',
-        # Generic article/content selectors
-        'article h3 a',
-        'div.content a[href*="/faculty/"]',
-        'div.content a[href*="/profile/"]',
-        # Really broad fallbacks
-        'a[href*="/faculty/"]',
-        'a[href*="/profile/"]',
-        'a[href*="/people/"]'
-    ]
+    With a SelectorCache, the selector that last worked for ``base_url``'s
+    host is tried first and the cascade only runs when it no longer finds
+    any faculty links (the entry is then replaced by the new winner, or
+    dropped if only the scan over every link finds faculty).
+    """
+    domain = host_of(base_url)
+    if selector_cache is not None:
+        selector = selector_cache.get(domain)
+        if selector is not None:
+            page_faculty_links = faculty_links_for_selector(page_soup, selector)
+            if page_faculty_links:
+                selector_cache.hit(domain)
+                print(f"Found {len(page_faculty_links)} faculty links using cached selector '{selector}' "
+                      f"for {school_name}")
+                return page_faculty_links
+            print(f"Cached selector '{selector}' no longer matches for {school_name}, trying all selectors")
+            selector_cache.invalidate(domain)
     
     # Try each selector in order of specificity
-    for selector in selectors:
-        faculty_links = page_soup.select(selector)
-        valid_links = []
-        
-        # Filter links to exclude navigation links
-        for link in faculty_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-            
-            # Skip navigation links, empty links, or overly short names
-            if (not text or len(text) < 4 or ' ' not in text or 
-                any(x in text.lower() for x in ['faculty', 'staff', 'student', 'alumni', 'board', 'people', 'directory'])):
-                continue
-            
-            # Make sure it looks like a person name (contains a space, not too short)
-            if len(text.split()) >= 2:
-                valid_links.append(link)
-        
-        if valid_links:
-            print(f"Found {len(valid_links)} faculty links using selector '{selector}' for {school_name}")
-            page_faculty_links.extend(valid_links)
-            break
-    
-    # If still no links found, try an even more general approach with all links that might be faculty
-    if not page_faculty_links:
-        all_links = page_soup.select('a')
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-            
-            # Only include links that look like individual faculty profiles (e.g., names with spaces)
-            if (text and len(text) > 5 and ' ' in text and 
-                not any(x in text.lower() for x in ['faculty', 'staff', 'student', 'alumni', 'board', 'people']) and
-                not href.startswith('#') and
-                not href.startswith('mailto:') and
-                not any(x in href.lower() for x in ['index', 'search', 'contact', 'about', 'home', 'catalog'])):
-                # If the name looks like a person (contains at least a first and last name)
-                if len(text.split()) >= 2:
-                    page_faculty_links.append(link)
-        
+    for selector in FACULTY_LINK_SELECTORS:
+        page_faculty_links = faculty_links_for_selector(page_soup, selector)
         if page_faculty_links:
-            print(f"Fallback: Found {len(page_faculty_links)} potential faculty links in {school_name}")
+            print(f"Found {len(page_faculty_links)} faculty links using selector '{selector}' for {school_name}")
+            if selector_cache is not None:
+                selector_cache.record(domain, selector)
+            return page_faculty_links
     
+    # If still no links found, try an even more general approach with all links that might be faculty.
+    # This is never cached: it finds something on almost any page, so it would never be invalidated.
+    page_faculty_links = fallback_faculty_links(page_soup)
+    if page_faculty_links:
+        print(f"Fallback: Found {len(page_faculty_links)} potential faculty links in {school_name}")
     return page_faculty_links
 
 
-def process_faculty_profiles(faculty_links, professors_dict, base_url, school_name):
+def process_faculty_profiles(faculty_links, professors_dict, base_url, school_name, engine=None):
     """Process faculty profiles and add them to the professors dictionary"""
-    # Limit for testing if needed
-    # MAX_FACULTY = 5
-    # if len(faculty_links) > MAX_FACULTY:
-    #     print(f"Limiting to first {MAX_FACULTY} faculty members for testing")
-    #     faculty_links = faculty_links[:MAX_FACULTY]
+    return process_profile_links(faculty_link_records(faculty_links, school_name, base_url), professors_dict, base_url,
+                                 engine)
+
+
+def parse_profile_page(html, fast=True):
+    """Parse a profile page for extract_professor_info and profile_fingerprint.
     
-    for i, faculty_link in enumerate(faculty_links):
-        name = faculty_link.get_text(strip=True)
-        href = faculty_link.get('href')
-        
-        # Make sure href is a valid URL
-        if href.startswith(('http://', 'https://')):
-            profile_url = href  # Already absolute URL
-        else:
-            # Use urljoin to handle both relative URLs and path-absolute URLs
-            profile_url = urljoin(base_url, href)
-            
+    ``fast`` builds a tree of just the PROFILE_REGION_SELECTORS elements with
+    PROFILE_PARSER, falling back to the whole page when the person article is
+    missing; ``fast=False`` parses the whole page with html.parser.
+    """
+    if not fast:
+        return BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, PROFILE_PARSER, parse_only=PROFILE_REGION_STRAINER)
+    if soup.select_one(PROFILE_REGION_SELECTORS[-1]) is None:
+        soup = BeautifulSoup(html, PROFILE_PARSER)
+    return soup
+
+
+def profile_fingerprint(prof_soup, name, school_name):
+    """Hash of everything extract_professor_info depends on for a profile page.
+    
+    Covers the PROFILE_REGION_SELECTORS parts of the page (the whole page if
+    none are found) plus the link name and school, which the extraction falls
+    back on, so navigation and footer changes don't count as profile changes.
+    """
+    region = [tag for selector in PROFILE_REGION_SELECTORS for tag in prof_soup.select(selector)] or [prof_soup]
+    digest = hashlib.sha256(f"{PROFILE_FINGERPRINT_VERSION}\0{name}\0{school_name}".encode('utf-8'))
+    for tag in region:
+        digest.update(b'\0')
+        digest.update(str(tag).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def process_profile_links(profile_links, professors_dict, base_url, engine=None, fingerprints=None, unchanged=None,
+                          enrich_publications=True):
+    """Fetch and extract FacultyLinks concurrently into professors_dict"""
+    tasks = resolve_profile_links(profile_links, claimed=professors_dict)
+    return process_profile_tasks(tasks, professors_dict, base_url, engine, fingerprints, unchanged,
+                                 enrich_publications)
+
+
+def resolve_profile_links(profile_links, claimed=()):
+    """Drop duplicate FacultyLinks, keeping the first school that lists a professor.
+    
+    URLs in ``claimed`` are skipped too. The FacultyLinks returned are the
+    (name, profile_url, school_name) tasks for process_profile_tasks.
+    """
+    tasks = []
+    claimed = set(claimed)
+    for faculty_link in profile_links:
         # Skip if we've already processed this professor
-        if profile_url in professors_dict:
-            print(f"Skipping duplicate professor: {name} at {profile_url}")
+        if faculty_link.url in claimed:
+            print(f"Skipping duplicate professor: {faculty_link.name} at {faculty_link.url}")
             continue
-            
-        print(f"Processing {i+1}/{len(faculty_links)} in {school_name}: {name} at {profile_url}")
-        
+        claimed.add(faculty_link.url)
+        tasks.append(faculty_link)
+    return tasks
+
+
+def process_profile_tasks(tasks, professors_dict, base_url, engine=None, fingerprints=None, unchanged=None,
+                          enrich_publications=True, frontier=None, store=None):
+    """Fetch and extract (name, profile_url, school_name) tasks concurrently into professors_dict.
+    
+    Profiles are fetched through the crawl engine (per-host limits instead of a
+    fixed sleep per profile); Google Scholar lookups are throttled as their own
+    host, or skipped with ``enrich_publications=False``. A profile whose
+    fingerprint matches ``fingerprints`` skips extraction and the Scholar
+    lookup and is appended to ``unchanged`` instead.
+    
+    With a CrawlFrontier holding ``tasks``, only its remaining URLs are
+    fetched, every outcome is committed to it as it completes, and the
+    results come from the frontier, so they include earlier interrupted runs.
+    
+    With ``store``, extracted records are passed to it PROFILE_STORE_BATCH at a
+    time as they complete (from the worker threads), and whatever is left at
+    the end in one last call: records of a partial batch, of a batch whose
+    store raised and, with a frontier, of an earlier run interrupted before
+    storing them. The frontier marks each stored batch.
+    """
+    engine = engine or create_crawl_engine()
+    unchanged = [] if unchanged is None else unchanged
+    batch = []
+    stored = set()
+    batch_lock = threading.Lock()
+    
+    def store_batch(records):
+        store(records)
+        urls = [record['profile_url'] for record in records]
+        with batch_lock:
+            stored.update(urls)
+        if frontier is not None:
+            frontier.mark_stored(urls)
+    
+    def collect(professor_data):
+        """Add a completed record to the batch, storing the batch once it is full"""
+        with batch_lock:
+            batch.append(professor_data)
+            if len(batch) < PROFILE_STORE_BATCH:
+                return
+            records = batch[:]
+            batch.clear()
         try:
-            prof_resp = requests.get(profile_url)
-            prof_soup = BeautifulSoup(prof_resp.text, 'html.parser')
+            store_batch(records)
+        except Exception as e:
+            # Left unstored, so they are retried when the crawl ends
+            print(f"Error storing {len(records)} profiles: {e}")
+    
+    def process_profile(task):
+        name, profile_url, school_name = task
+        print(f"Processing {name} from {school_name} at {profile_url}")
+        if frontier is not None:
+            frontier.begin(profile_url)
+        try:
+            prof_resp = engine.fetch(profile_url)
+            prof_soup = parse_profile_page(prof_resp.text)
+            
+            if fingerprints is not None:
+                fingerprint = profile_fingerprint(prof_soup, name, school_name)
+                if fingerprints.get(profile_url) == fingerprint:
+                    print(f"Unchanged since last crawl: {name} from {school_name}")
+                    if frontier is not None:
+                        frontier.complete(profile_url, None)
+                    return PROFILE_UNCHANGED
             
             # Extract info using our existing extraction logic
-            professor_data = extract_professor_info(prof_soup, name, profile_url, school_name, base_url)
+            professor_data = extract_professor_info(prof_soup, name, profile_url, school_name, base_url,
+                                                    fetch_publications=False)
+            if enrich_publications:
+                professor_data['publications'] = get_publications_from_google_scholar(
+                    professor_data['name'], throttle=lambda: engine.throttle(SCHOLAR_HOST))
+            if fingerprints is not None:
+                professor_data['profile_fingerprint'] = fingerprint
+            if frontier is not None:
+                frontier.complete(profile_url, professor_data)
             
-            # Add to our dictionary with profile URL as key to avoid duplicates
-            professors_dict[profile_url] = professor_data
             print(f"Successfully processed {name} from {school_name}")
-            
-            # Be respectful with rate limiting
-            time.sleep(1)
+            return professor_data
             
         except Exception as e:
             print(f"Error processing {name} from {school_name}: {e}")
+            if frontier is not None:
+                frontier.fail(profile_url, e)
+            return None
+    
+    def process_and_collect(task):
+        professor_data = process_profile(task)
+        if store is not None and professor_data is not None and professor_data is not PROFILE_UNCHANGED:
+            collect(professor_data)
+        return professor_data
+    
+    if frontier is None:
+        results = engine.map(process_and_collect, tasks, key=lambda task: host_of(task[1]))
+    else:
+        engine.map(process_and_collect, frontier.remaining(), key=lambda task: host_of(task[1]))
+        # Outcomes of this run and the interrupted runs before it; the frontier stores None for unchanged profiles
+        completed = frontier.results()
+        results = [(completed[profile_url] or PROFILE_UNCHANGED) if profile_url in completed else None
+                   for name, profile_url, school_name in tasks]
+    
+    # Add to our dictionary with profile URL as key to avoid duplicates, in link order
+    for (name, profile_url, school_name), professor_data in zip(tasks, results):
+        if professor_data is PROFILE_UNCHANGED:
+            unchanged.append(profile_url)
+        elif professor_data is not None:
+            professors_dict[profile_url] = professor_data
+    if fingerprints is not None:
+        print(f"Skipped {len(unchanged)} unchanged profiles")
+    
+    if store is not None:
+        if frontier is not None:
+            leftover = list(frontier.unstored_results().values())
+        else:
+            leftover = [professor_data for profile_url, professor_data in professors_dict.items()
+                        if profile_url not in stored]
+        if leftover:
+            store_batch(leftover)
             
     return professors_dict
 
 
-def extract_professor_info(prof_soup, name, profile_url, school_name, base_url="https://www.cc.gatech.edu"):
-    """Extract all information for a professor from their profile page"""
+def find_personal_website(prof_soup, name, base_url="https://www.cc.gatech.edu"):
+    """Pick a professor's personal website from the links on their profile page.
+    
+    Strategies in priority order: (1) an external link whose text suggests a
+    personal site, (2) a link whose URL contains the professor's name, (3) a
+    link near a website-related keyword, (4) any external link with an
+    academic TLD. Links are scanned once, classified for strategies 1, 2 and 4
+    together; strategy 3 runs only if 1 and 2 find nothing.
+    """
+    professor_first_name = name.split()[0].lower()
+    professor_last_name = name.split()[-1].lower()
+    link_terms = WEBSITE_LINK_TERMS + [professor_first_name, professor_last_name]
+    # Common patterns for faculty websites
+    name_patterns = [
+        f'~{professor_last_name}',                   # ~/lastname
+        f'~{professor_first_name}',                  # ~/firstname
+        f'{professor_first_name}{professor_last_name}',  # firstnamelastname
+        f'{professor_last_name}.{professor_first_name}',  # lastname.firstname
+        f'{professor_first_name}.{professor_last_name}',  # firstname.lastname
+        f'{professor_first_name}-{professor_last_name}',  # firstname-lastname
+        f'/{professor_last_name}/',                   # /lastname/
+        f'users/{professor_first_name}',              # users/firstname
+        f'people/{professor_last_name}',              # people/lastname
+        f'faculty/{professor_last_name}',             # faculty/lastname
+    ]
+    
+    by_link_text = by_name_pattern = by_tld = None
+    for a in prof_soup.find_all('a', href=True):
+        href = a['href']
+        if not href.startswith('http'):
+            continue
+        lowered = href.lower()
+        internal = href.startswith(base_url)
+        
+        # Strategy 1: external link with explicit website-related text
+        if (href.startswith(('http://', 'https://')) and not internal and
+                not any(exclude in lowered for exclude in WEBSITE_EXCLUDES_BY_TEXT)):
+            text = a.get_text(strip=True).lower()
+            if any(term in text for term in link_terms):
+                by_link_text = href
+                break
+        
+        # Strategy 2: name-based pattern in the URL
+        if (by_name_pattern is None and
+                not any(exclude in lowered for exclude in WEBSITE_EXCLUDES_BY_NAME) and
+                any(pattern in lowered for pattern in name_patterns)):
+            by_name_pattern = href
+        
+        # Strategy 4: external link with an academic TLD
+        if (by_tld is None and not internal and
+                not any(exclude in lowered for exclude in WEBSITE_EXCLUDES_BY_TLD) and
+                any(tld in lowered for tld in ACADEMIC_TLDS)):
+            by_tld = href
+    
+    if by_link_text:
+        print(f"Found website via explicit link text: {by_link_text}")
+        return by_link_text
+    if by_name_pattern:
+        print(f"Found website via name pattern in URL: {by_name_pattern}")
+        return by_name_pattern
+    
+    # Strategy 3: links in proximity to website-related keywords, looking up to 3
+    # levels above each keyword match. Every match is considered in turn, and once
+    # a website is found a later match replaces it only through a link under its
+    # direct parent: the last match with a link right beside it wins, otherwise
+    # the first match with a link further up.
+    keyword_strings = prof_soup.find_all(string=WEBSITE_KEYWORD_PATTERN)
+    matches = [(keyword, element)
+               for keyword, pattern in WEBSITE_KEYWORD_PATTERNS
+               for element in keyword_strings if pattern.search(element)]
+    nearby = {}
+    
+    def nearby_link(parent):
+        if id(parent) not in nearby:
+            nearby[id(parent)] = None
+            for link in parent.find_all('a', href=EXTERNAL_HREF_PATTERN):
+                href = link.get('href')
+                if (href and not href.startswith(base_url) and
+                        not any(exclude in href.lower() for exclude in WEBSITE_EXCLUDES_NEARBY)):
+                    nearby[id(parent)] = href
+                    break
+        return nearby[id(parent)]
+    
+    for keyword, element in reversed(matches):
+        if element.parent and nearby_link(element.parent):
+            print(f"Found website near keyword '{keyword}': {nearby_link(element.parent)}")
+            return nearby_link(element.parent)
+    for keyword, element in matches:
+        parent = element.parent
+        for _ in range(3):  # Check up to 3 levels up
+            if not parent:
+                break
+            if nearby_link(parent):
+                print(f"Found website near keyword '{keyword}': {nearby_link(parent)}")
+                return nearby_link(parent)
+            parent = parent.parent
+    
+    if by_tld:
+        print(f"Found academic website by TLD: {by_tld}")
+    return by_tld
+
+
+def extract_professor_info(prof_soup, name, profile_url, school_name, base_url="https://www.cc.gatech.edu",
+                           fetch_publications=True):
+    """Extract all information for a professor from their profile page.
+    
+    With ``fetch_publications=False`` the Google Scholar lookup is skipped and
+    ``publications`` is left empty for the caller to fill in.
+    """
     # Save profile HTML for debugging (uncomment if needed)
     # with open(f'profile_{name.replace(" ", "_")}.html', 'w', encoding='utf-8') as f:
     #     f.write(prof_soup.prettify())
     
-    # Extract all content as text for analysis
-    page_text = prof_soup.get_text(" ", strip=True)
-    
     # Name (from profile page)
     name_tag = prof_soup.select_one('h1.page-title span') or prof_soup.select_one('h1.page-title')
     if name_tag:
@@ -291,9 +916,9 @@ def extract_professor_info(prof_soup, name, profile_url, school_name, base_url="
     if email_tag:
         email = email_tag.get_text(strip=True)
     
-    # 2. Look for text that matches email pattern
+    # 2. Look for text that matches email pattern (the page text is only built when needed)
     if not email:
-        email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', page_text)
+        email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', prof_soup.get_text(" ", strip=True))
         if email_match:
             email = email_match.group(0)
     
@@ -325,107 +950,13 @@ def extract_professor_info(prof_soup, name, profile_url, school_name, base_url="
             research_interests = '; '.join(research_sections)
     
     # Personal Website - Comprehensive detection
-    website = None
-    professor_first_name = name.split()[0].lower()
-    professor_last_name = name.split()[-1].lower()
-    
-    # Strategy 1: Look for links with explicit website-related text
-    for a in prof_soup.select('a'):
-        href = a.get('href', '')
-        text = a.get_text(strip=True).lower()
-        # Only consider external links (exclude gatech.edu and form links)
-        if (href.startswith(('http://', 'https://')) and 
-            not href.startswith(base_url) and
-            not any(exclude in href.lower() for exclude in 
-                ['qualtrics', 'gatech.edu', 'forms.', 'survey.', 
-                 'twitter.com', 'linkedin.com', 'facebook.com', 'youtube.com'])):
-            # Check if link text suggests it's a personal site
-            if any(term in text for term in 
-                  ['website', 'homepage', 'personal', 'lab', 'group', 'research', 
-                   'project', professor_first_name, professor_last_name]):
-                website = href
-                print(f"Found website via explicit link text: {website}")
-                break
-    
-    # Strategy 2: Search for name-based patterns in URLs
-    if not website:
-        for a in prof_soup.select('a[href^="http"]'):
-            href = a.get('href', '').lower()
-            # Skip inappropriate links
-            if any(exclude in href for exclude in 
-                  ['qualtrics', 'gatech.edu', 'twitter', 'linkedin', 'facebook']):
-                continue
-                
-            # Common patterns for faculty websites
-            name_patterns = [
-                f'~{professor_last_name}',                   # ~/lastname
-                f'~{professor_first_name}',                  # ~/firstname
-                f'{professor_first_name}{professor_last_name}',  # firstnamelastname
-                f'{professor_last_name}.{professor_first_name}',  # lastname.firstname
-                f'{professor_first_name}.{professor_last_name}',  # firstname.lastname
-                f'{professor_first_name}-{professor_last_name}',  # firstname-lastname
-                f'/{professor_last_name}/',                   # /lastname/
-                f'users/{professor_first_name}',              # users/firstname
-                f'people/{professor_last_name}',              # people/lastname
-                f'faculty/{professor_last_name}',             # faculty/lastname
-            ]
-            
-            if any(pattern in href for pattern in name_patterns):
-                website = a.get('href')
-                print(f"Found website via name pattern in URL: {website}")
-                break
-    
-    # Strategy 3: Look for links in proximity to website-related keywords
-    if not website:
-        website_keywords = ['website', 'homepage', 'personal page', 'lab page', 'research group']
-        for keyword in website_keywords:
-            elements = prof_soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-            for element in elements:
-                # Get parent and check nearby links
-                parent = element.parent
-                for _ in range(3):  # Check up to 3 levels up
-                    if not parent:
-                        break
-                        
-                    # Find nearby links
-                    links = parent.find_all('a', href=re.compile('^https?://'))
-                    for link in links:
-                        href = link.get('href')
-                        if (href and 
-                            not href.startswith(base_url) and 
-                            not any(exclude in href.lower() for exclude in 
-                                   ['qualtrics', 'gatech.edu', 'twitter', 'linkedin'])):
-                            website = href
-                            print(f"Found website near keyword '{keyword}': {website}")
-                            break
-                    
-                    if website:
-                        break
-                    parent = parent.parent
-                    
-    # Strategy 4: Look for any external links that might be personal sites
-    if not website:
-        # Common TLDs for academic and personal sites
-        academic_tlds = ['.edu', '.org', '.io', '.net', 'github.io', '.me']
-        
-        for a in prof_soup.select('a[href^="http"]'):
-            href = a.get('href', '')
-            
-            # Skip internal links and social media
-            if (href.startswith(base_url) or 
-                any(exclude in href.lower() for exclude in 
-                   ['qualtrics', 'gatech.edu', 'twitter.com', 'linkedin.com'])):
-                continue
-                
-            # Prioritize links with academic TLDs
-            if any(tld in href.lower() for tld in academic_tlds):
-                website = href
-                print(f"Found academic website by TLD: {website}")
-                break
+    website = find_personal_website(prof_soup, name, base_url)
     
     # Get publications from Google Scholar
-    print(f"Fetching publications for {name} from Google Scholar...")
-    publications = get_publications_from_google_scholar(name)
+    publications = []
+    if fetch_publications:
+        print(f"Fetching publications for {name} from Google Scholar...")
+        publications = get_publications_from_google_scholar(name)
     
     # Create professor data dictionary
     professor_data = {
@@ -442,7 +973,10 @@ def extract_professor_info(prof_soup, name, profile_url, school_name, base_url="
     return professor_data
 
 if __name__ == "__main__":
-    profs = scrape_ga_tech_faculty()
+    # Progress is kept in the crawl frontier, so an interrupted run resumes where it stopped
+    frontier = CrawlFrontier()
+    profs = scrape_ga_tech_faculty(frontier=frontier)
+    frontier.close()
     
     # Save to a JSON file
     with open('ga_tech_faculty.json', 'w', encoding='utf-8') as f:
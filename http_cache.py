@@ -0,0 +1,235 @@
+import sqlite3
+import json
+import logging
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger("http_cache")
+
+HTTP_CACHE_PATH = "http_cache.db"
+# Entries are served without contacting the server for this long after they were fetched or revalidated
+DEFAULT_CACHE_TTL = 24 * 3600
+# Per-domain TTLs; a domain also covers its subdomains
+DOMAIN_CACHE_TTLS = {
+    'gatech.edu': 3 * 24 * 3600,
+    'dblp.org': 7 * 24 * 3600,
+}
+# Compressed bytes kept before least-recently-used entries are evicted
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Response headers kept with a cached body
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+
+def _domain_ttl(host, ttls, default):
+    """TTL for ``host``: the longest matching domain suffix in ``ttls``, else ``default``"""
+    labels = host.split(':')[0].split('.')
+    for start in range(len(labels)):
+        domain = '.'.join(labels[start:])
+        if domain in ttls:
+            return ttls[domain]
+    return default
+
+class HTTPCache:
+    """Persistent cache of successful GET responses in SQLite.
+    
+    Bodies are stored zlib-compressed together with their ETag and
+    Last-Modified validators. An entry younger than its domain's TTL is served
+    as is; an older one is revalidated with a conditional request, and a 304
+    just refreshes it. The total compressed size is bounded by evicting the
+    least recently used entries.
+    """
+    
+    def __init__(self, path=HTTP_CACHE_PATH, max_bytes=DEFAULT_CACHE_MAX_BYTES, default_ttl=DEFAULT_CACHE_TTL,
+                 domain_ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.domain_ttls = DOMAIN_CACHE_TTLS if domain_ttls is None else domain_ttls
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache(accessed_at)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0, 'bytes_saved': 0}
+    
+    def ttl_for(self, url):
+        return _domain_ttl(urlparse(url).netloc.lower(), self.domain_ttls, self.default_ttl)
+    
+    def lookup(self, url):
+        """Return (headers, body, etag, last_modified, fresh) for a cached URL, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT headers, body, etag, last_modified, fetched_at FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        headers, body, etag, last_modified, fetched_at = row
+        fresh = time.time() - fetched_at < self.ttl_for(url)
+        return json.loads(headers), zlib.decompress(body), etag, last_modified, fresh
+    
+    def touch(self, url, revalidated=False):
+        """Mark an entry used (and, after a 304, fetched now)"""
+        now = time.time()
+        with self.lock:
+            if revalidated:
+                self.conn.execute("UPDATE http_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self.conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+    
+    def store(self, url, response):
+        """Cache a 200 response unless the server forbids it"""
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        body = zlib.compress(response.content, 6)
+        now = time.time()
+        with self.lock:
+            previous = self.conn.execute("SELECT size FROM http_cache WHERE url = ?", (url,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, headers, body, size, etag, last_modified, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, json.dumps(headers), body, len(body), headers.get('ETag'), headers.get('Last-Modified'), now, now)
+            )
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            self.stats['stored'] += 1
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+    
+    def _evict(self):
+        """Drop least recently used entries until the cache is back to 90% of max_bytes"""
+        target = self.max_bytes * 0.9
+        rows = self.conn.execute("SELECT url, size FROM http_cache ORDER BY accessed_at").fetchall()
+        evicted = []
+        for url, size in rows:
+            if self.total_bytes <= target:
+                break
+            evicted.append((url,))
+            self.total_bytes -= size
+        self.conn.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+        self.stats['evicted'] += len(evicted)
+        logger.info(f"Evicted {len(evicted)} cached responses ({self.total_bytes} bytes kept)")
+    
+    def record(self, outcome, saved=0):
+        with self.lock:
+            self.stats[outcome] += 1
+            self.stats['bytes_saved'] += saved
+    
+    def hit_rate(self):
+        """Share of lookups answered without downloading the body (fresh hits and 304s)"""
+        served = self.stats['hits'] + self.stats['revalidated']
+        total = served + self.stats['misses']
+        return served / total if total else 0.0
+    
+    def report(self):
+        """Print cache hit rate and counters"""
+        s = self.stats
+        print(f"HTTP cache: {self.hit_rate():.1%} hit rate ({s['hits']} fresh, {s['revalidated']} revalidated, "
+              f"{s['misses']} downloaded), {s['bytes_saved'] / (1024 * 1024):.1f} MiB not re-downloaded, "
+              f"{s['evicted']} evicted, {self.total_bytes / (1024 * 1024):.1f} MiB on disk")
+        return dict(s, hit_rate=self.hit_rate())
+    
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM http_cache")
+            self.conn.commit()
+            self.total_bytes = 0
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def _cached_response(url, headers, body):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response.from_cache = True
+    return response
+
+class CachedSession:
+    """Wraps a session (or HostSessions) so GETs go through an HTTPCache.
+    
+    Only GET requests without a body are cached; everything else is passed
+    straight through to the wrapped session.
+    """
+    
+    def __init__(self, session, cache):
+        self.session = session
+        self.cache = cache
+    
+    @staticmethod
+    def _cache_key(url, params=None):
+        if not params:
+            return url
+        request = requests.models.PreparedRequest()
+        request.prepare_url(url, params)
+        return request.url
+    
+    def cached_response(self, url, params=None, **kwargs):
+        """The cached response for ``url`` if it is still fresh, without any network request"""
+        key = self._cache_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is None or not entry[4]:
+            return None
+        headers, body = entry[0], entry[1]
+        self.cache.touch(key)
+        self.cache.record('hits', len(body))
+        return _cached_response(key, headers, body)
+    
+    def get(self, url, params=None, **kwargs):
+        key = self._cache_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            headers, body, etag, last_modified, fresh = entry
+            if fresh:
+                self.cache.touch(key)
+                self.cache.record('hits', len(body))
+                return _cached_response(key, headers, body)
+            conditional = dict(kwargs.pop('headers', None) or {})
+            if etag:
+                conditional['If-None-Match'] = etag
+            if last_modified:
+                conditional['If-Modified-Since'] = last_modified
+            kwargs['headers'] = conditional
+        
+        response = self.session.get(url, params=params, **kwargs)
+        if entry is not None and response.status_code == 304:
+            self.cache.touch(key, revalidated=True)
+            self.cache.record('revalidated', len(entry[1]))
+            return _cached_response(key, entry[0], entry[1])
+        self.cache.record('misses')
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+    
+    def head(self, url, **kwargs):
+        return self.session.head(url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+    
+    def report(self):
+        return self.cache.report()
@@ -0,0 +1,208 @@
+import sqlite3
+import json
+import logging
+import threading
+import time
+import zlib
+from contextlib import nullcontext
+
+from scholarly import scholarly
+
+logger = logging.getLogger("scholar_cache")
+
+SCHOLAR_CACHE_PATH = "scholar_cache.db"
+# Filled author profiles are reused for this long before being fetched again
+SCHOLAR_CACHE_TTL = 30 * 24 * 3600
+# A search that found no profile is not repeated for this long
+SCHOLAR_NEGATIVE_TTL = 3 * 24 * 3600
+# Compressed profile bytes kept before least-recently-used profiles are evicted
+SCHOLAR_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+def normalize_query(name, affiliation):
+    """Cache key for an author search: case- and whitespace-insensitive (name, affiliation)"""
+    return ' '.join(str(name).lower().split()) + '\0' + ' '.join(str(affiliation or '').lower().split())
+
+class ScholarCache:
+    """Persistent cache of Google Scholar author lookups in SQLite.
+    
+    A search for (name, affiliation) is remembered as the Scholar id it
+    resolved to, or as not found for ``negative_ttl`` seconds. Filled profiles
+    are stored once per Scholar id, zlib-compressed, and reused for ``ttl``
+    seconds, so the scraper and the verifier fill each person at most once per
+    TTL even when they search with different affiliations. The compressed size
+    is bounded by evicting the least recently used profiles. Lookup errors are
+    raised and never cached.
+    
+    ``author`` takes an optional ``throttle``, a callable returning a context
+    manager (such as ``lambda: engine.throttle(SCHOLAR_HOST)``) entered around
+    each request to Scholar, so cache hits never wait for a rate limit.
+    """
+    
+    def __init__(self, path=SCHOLAR_CACHE_PATH, ttl=SCHOLAR_CACHE_TTL, negative_ttl=SCHOLAR_NEGATIVE_TTL,
+                 max_bytes=SCHOLAR_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # scholar_id is NULL for a search that found no profile
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS scholar_queries (
+            query TEXT PRIMARY KEY,
+            scholar_id TEXT,
+            searched_at REAL NOT NULL
+        )
+        ''')
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS scholar_authors (
+            scholar_id TEXT PRIMARY KEY,
+            author BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            filled_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_scholar_authors_accessed ON scholar_authors(accessed_at)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM scholar_authors").fetchone()[0]
+        self.stats = {'hits': 0, 'not_found_hits': 0, 'searches': 0, 'fills': 0, 'evicted': 0}
+    
+    def author(self, name, affiliation, throttle=None):
+        """The filled Scholar profile (a dict) of the first author matching "name affiliation", or None"""
+        throttle = throttle or nullcontext
+        query = normalize_query(name, affiliation)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT scholar_id, searched_at FROM scholar_queries WHERE query = ?", (query,)
+            ).fetchone()
+        
+        scholar_id = None
+        if row is not None:
+            scholar_id, searched_at = row
+            if scholar_id is None and now - searched_at < self.negative_ttl:
+                self._record('not_found_hits')
+                return None
+        
+        if scholar_id is not None:
+            cached = self._cached_author(scholar_id)
+            if cached is not None:
+                self._record('hits')
+                return cached
+            # Known profile, but stale or evicted: refill it by id without searching again
+            self._record('fills')
+            with throttle():
+                author = scholarly.search_author_id(scholar_id, filled=True)
+        else:
+            self._record('searches')
+            with throttle():
+                author = next(scholarly.search_author(f"{name} {affiliation}"), None)
+            if author is not None:
+                scholar_id = author.get('scholar_id')
+                cached = self._cached_author(scholar_id) if scholar_id else None
+                if cached is not None:
+                    # Another search already filled this profile
+                    self._remember_query(query, scholar_id)
+                    self._record('hits')
+                    return cached
+                self._record('fills')
+                with throttle():
+                    author = scholarly.fill(author)
+        
+        if not author:
+            self._remember_query(query, None)
+            return None
+        author = json.loads(json.dumps(author, default=str))
+        if scholar_id:
+            self._store_author(scholar_id, author)
+            self._remember_query(query, scholar_id)
+        return author
+    
+    def _cached_author(self, scholar_id):
+        """A fresh cached profile (marking it used), or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT author, filled_at FROM scholar_authors WHERE scholar_id = ?", (scholar_id,)
+            ).fetchone()
+            if row is None or time.time() - row[1] >= self.ttl:
+                return None
+            self.conn.execute("UPDATE scholar_authors SET accessed_at = ? WHERE scholar_id = ?",
+                              (time.time(), scholar_id))
+            self.conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+    
+    def _remember_query(self, query, scholar_id):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scholar_queries (query, scholar_id, searched_at) VALUES (?, ?, ?)",
+                (query, scholar_id, time.time())
+            )
+            self.conn.commit()
+    
+    def _store_author(self, scholar_id, author):
+        body = zlib.compress(json.dumps(author, ensure_ascii=False).encode('utf-8'), 6)
+        now = time.time()
+        with self.lock:
+            previous = self.conn.execute(
+                "SELECT size FROM scholar_authors WHERE scholar_id = ?", (scholar_id,)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scholar_authors (scholar_id, author, size, filled_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (scholar_id, body, len(body), now, now)
+            )
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+    
+    def _evict(self):
+        """Drop least recently used profiles until the cache is back to 90% of max_bytes"""
+        target = self.max_bytes * 0.9
+        rows = self.conn.execute("SELECT scholar_id, size FROM scholar_authors ORDER BY accessed_at").fetchall()
+        evicted = []
+        for scholar_id, size in rows:
+            if self.total_bytes <= target:
+                break
+            evicted.append((scholar_id,))
+            self.total_bytes -= size
+        self.conn.executemany("DELETE FROM scholar_authors WHERE scholar_id = ?", evicted)
+        self.stats['evicted'] += len(evicted)
+        logger.info(f"Evicted {len(evicted)} cached Scholar profiles ({self.total_bytes} bytes kept)")
+    
+    def _record(self, outcome):
+        with self.lock:
+            self.stats[outcome] += 1
+    
+    def report(self):
+        """Print cache hit and Scholar request counters"""
+        s = self.stats
+        print(f"Scholar cache: {s['hits']} profiles and {s['not_found_hits']} not-found results reused, "
+              f"{s['searches']} searches, {s['fills']} profiles filled, {s['evicted']} evicted, "
+              f"{self.total_bytes / (1024 * 1024):.1f} MiB on disk")
+        return dict(s)
+    
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM scholar_queries")
+            self.conn.execute("DELETE FROM scholar_authors")
+            self.conn.commit()
+            self.total_bytes = 0
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def default_scholar_cache():
+    """The ScholarCache at SCHOLAR_CACHE_PATH, shared by every caller in the process"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScholarCache()
+        return _default_cache